@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmarks column metadata operations of an Adat against a FeatureAdat.
+
+A synthetic 11K-plex adat is built by repeating the SOMAmers of the control data adat
+(with unique SeqIds) and stacking its samples. Usage:
+
+    python benchmarks/feature_table.py --somamers 11000 --samples 200
+"""
+import argparse
+import io
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+import somadata
+from somadata import Adat, FeatureAdat
+
+CONTROL_DATA_PATH = (
+    Path(__file__).parent.parent / 'tests' / 'data' / 'control_data.adat'
+)
+
+
+def build_features(n_somamers: int, n_samples: int):
+    rfu_matrix, row_metadata, column_metadata, header_metadata = somadata.parse_file(
+        str(CONTROL_DATA_PATH)
+    )
+    n_columns = len(column_metadata['SeqId'])
+    columns = np.arange(n_somamers) % n_columns
+    rows = np.arange(n_samples) % len(rfu_matrix)
+    column_metadata = {
+        name: [values[i] for i in columns] for name, values in column_metadata.items()
+    }
+    column_metadata['SeqId'] = [
+        f'{i // 100000 + 10000}-{i % 100000}' for i in range(n_somamers)
+    ]
+    row_metadata = {
+        name: [values[i] for i in rows] for name, values in row_metadata.items()
+    }
+    rfu_matrix = np.asarray(rfu_matrix)[np.ix_(rows, columns)]
+    return rfu_matrix, row_metadata, column_metadata, header_metadata
+
+
+def best_time(function: Callable, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Adat vs FeatureAdat benchmark')
+    parser.add_argument('--somamers', type=int, default=11000)
+    parser.add_argument('--samples', type=int, default=200)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    features = build_features(args.somamers, args.samples)
+    seq_ids = features[2]['SeqId'][::10]
+    ranks = [str(i) for i in range(args.somamers)]
+    adats = {
+        'Adat': Adat.from_features(*features),
+        'FeatureAdat': FeatureAdat.from_features(*features),
+    }
+    benchmarks = {
+        'from_features': lambda cls, adat: cls.from_features(*features),
+        'insert_meta': lambda cls, adat: adat.insert_meta(
+            axis=1, name='Rank', values=ranks
+        ),
+        'pick_on_meta': lambda cls, adat: adat.pick_on_meta(
+            axis=1, name='SeqId', values=seq_ids
+        ),
+        'pick_meta': lambda cls, adat: adat.pick_meta(
+            axis=1, names=['SeqId', 'Target']
+        ),
+        'to_adat': lambda cls, adat: adat.to_adat(io.StringIO()),
+    }
+
+    print(f'{args.samples} samples x {args.somamers} SOMAmers')
+    print(f'{"operation":<16}{"Adat":>10}{"FeatureAdat":>14}')
+    for name, benchmark in benchmarks.items():
+        timings = [
+            best_time(lambda: benchmark(type(adat), adat), args.repeats)
+            for adat in adats.values()
+        ]
+        print(f'{name:<16}{timings[0]:>9.4f}s{timings[1]:>13.4f}s')
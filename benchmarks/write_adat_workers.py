@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Benchmarks `somadata.write_adat` with an increasing number of worker processes.
+
+A synthetic adat is built by stacking the samples of the control data adat until
+it holds the requested number of samples. Usage:
+
+    python benchmarks/write_adat_workers.py --samples 5000 --max-workers 8
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import somadata
+
+CONTROL_DATA_PATH = (
+    Path(__file__).parent.parent / 'tests' / 'data' / 'control_data.adat'
+)
+
+
+def build_adat(n_samples: int) -> somadata.Adat:
+    adat = somadata.read_adat(str(CONTROL_DATA_PATH))
+    n_copies = -(-n_samples // len(adat))
+    return somadata.concatenate_adats([adat] * n_copies).iloc[:n_samples]
+
+
+def time_write(adat: somadata.Adat, path: str, workers: int, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        adat.to_adat(path, workers=workers)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='write_adat worker scaling benchmark')
+    parser.add_argument('--samples', type=int, default=2000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    adat = build_adat(args.samples)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'benchmark.adat')
+        baseline = time_write(adat, path, None, args.repeats)
+        size_mb = os.path.getsize(path) / 1024**2
+        print(f'{args.samples} samples, {size_mb:.0f} MB, {os.cpu_count()} cpus')
+        print(f'workers=1: {baseline:.2f}s')
+        workers = 2
+        while workers <= args.max_workers:
+            timing = time_write(adat, path, workers, args.repeats)
+            print(f'workers={workers}: {timing:.2f}s ({baseline / timing:.1f}x)')
+            workers *= 2
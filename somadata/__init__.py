@@ -1,7 +1,22 @@
 from somadata.adat import Adat
 from somadata.annotations import Annotations
-from somadata.io.adat.file import read_file, read_adat, parse_file
+from somadata.feature_adat import FeatureAdat
+from somadata.lazy_adat import LazyAdat
+from somadata.io.adat.cache import AdatCache
+from somadata.io.adat.file import (
+    AdatWriter,
+    append_to_adat,
+    parse_file,
+    read_adat,
+    read_adat_chunks,
+    read_adat_header,
+    read_adat_metadata,
+    read_adats,
+    read_file,
+)
 from somadata.io.annotations.file import read_annotations
+from somadata.io.binary.file import read_binary
+from somadata.io.parquet.file import read_adat_parquet
 from somadata.tools.adat_concatenation import (
     concatenate_adats,
     smart_adat_concatenation,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, TextIO, Union
+from typing import Dict, List, Optional, TextIO, Union
 
+import numpy as np
 import pandas as pd
 
 from . import io
@@ -40,20 +41,27 @@ class Adat(AdatMetaHelpers, AdatMathHelpers, pd.DataFrame, AdatNormalization):
     def _constructor(self) -> Adat:
         return Adat
 
+    @property
+    def column_multiindex(self) -> pd.MultiIndex:
+        """The column metadata as a MultiIndex, which are the columns of an Adat."""
+        return self.columns
+
     @classmethod
     def from_features(
         cls,
-        rfu_matrix: List[List[float]],
+        rfu_matrix: Union[List[List[float]], np.ndarray],
         row_metadata: Dict[str, List[str]],
         column_metadata: Dict[str, List[str]],
         header_metadata: Dict[str, str],
+        dtype: Optional[Union[str, np.dtype]] = None,
     ) -> Adat:
         """Returns an Adat from the component adat file format sections.
 
         Parameters
         ----------
-        rfu_matrix : List[List[float]]
+        rfu_matrix : List[List[float]] | np.ndarray
             An nSample x nSomamer matrix of the RFU data (by row) where each sub-array corresponds to a sample.
+            NumPy arrays are used as the RFU block without being copied.
 
         row_metadata : Dict[str, List[str]]
             A dictionary of each column of the row metadata where the key-value
@@ -66,6 +74,9 @@ class Adat(AdatMetaHelpers, AdatMathHelpers, pd.DataFrame, AdatNormalization):
         header_metadata : Dict[str, str]
             A dictionary of each row of the header_metadata corresponds to a key-value pair.
 
+        dtype : str | np.dtype, optional
+            The dtype of the RFU values. If None (default), the dtype is inferred from `rfu_matrix`.
+
         Returns
         -------
         adat : Adat
@@ -73,7 +84,10 @@ class Adat(AdatMetaHelpers, AdatMathHelpers, pd.DataFrame, AdatNormalization):
         Examples
         --------
         >>> adat = Adat.from_features(rfu_matrix, row_metadata, col_metadata, header_metadata)
+        >>> adat = Adat.from_features(rfu_matrix, row_metadata, col_metadata, header_metadata, dtype='float32')
         """
+        if dtype is not None:
+            rfu_matrix = np.asarray(rfu_matrix, dtype=dtype)
 
         index = pd.MultiIndex.from_arrays(
             list(row_metadata.values()), names=list(row_metadata.keys())
@@ -86,6 +100,7 @@ class Adat(AdatMetaHelpers, AdatMathHelpers, pd.DataFrame, AdatNormalization):
             index=index,
             columns=columns,
             header_metadata=header_metadata,
+            copy=False,
         )
 
     def to_file(self, *args, **kwargs):
@@ -102,6 +117,8 @@ class Adat(AdatMetaHelpers, AdatMathHelpers, pd.DataFrame, AdatNormalization):
         self,
         path_or_buf: Union[str, TextIO],
         *args,
+        compression: Optional[str] = 'infer',
+        compression_workers: Optional[int] = None,
         **kwargs,
     ) -> None:
         """Writes the adat to an adat formatted file with the given filename.
@@ -119,6 +136,17 @@ class Adat(AdatMetaHelpers, AdatMathHelpers, pd.DataFrame, AdatNormalization):
             Combines the column metadata for SeqId and
             SeqIdVersion to the V3 style (12345-6_7)
 
+        workers : int, optional
+            The number of processes formatting the RFU values in parallel, see `write_adat`.
+
+        compression : str, optional
+            Compresses the file written to a path with 'gzip', 'bz2' or 'xz'. If 'infer' (default),
+            the compression is inferred from the file extension (.gz, .bz2, .xz).
+
+        compression_workers : int, optional
+            The number of threads compressing the file in parallel blocks. If None (default),
+            the file is compressed as a single stream.
+
         Returns
         -------
         None
@@ -126,10 +154,61 @@ class Adat(AdatMetaHelpers, AdatMathHelpers, pd.DataFrame, AdatNormalization):
         Examples
         --------
         >>> Adat.to_adat('path/to/file.adat')
+        >>> Adat.to_adat('path/to/file.adat.gz', compression_workers=4)
         """
 
         if type(path_or_buf) == str:
-            with open(path_or_buf, 'w', newline='', encoding='utf-8') as f:
+            with io.adat.compression.open_text(
+                path_or_buf, 'w', compression, compression_workers
+            ) as f:
                 io.adat.file.write_adat(self, f, *args, **kwargs)
         else:
             io.adat.file.write_adat(self, path_or_buf, *args, **kwargs)
+
+    def to_binary(self, path: str) -> None:
+        """Writes the adat to a binary adat directory that `somadata.read_binary` memory-maps.
+
+        Parameters
+        ----------
+        path : str
+            The directory that the RFU matrix and metadata will be written to
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> Adat.to_binary('path/to/file.adatb')
+        """
+        io.binary.file.write_binary(self, path)
+
+    def to_parquet(
+        self, path: str, row_group_size: Optional[int] = None, **kwargs
+    ) -> None:
+        """Writes the adat to a parquet file that `somadata.read_adat_parquet` reads. Requires pyarrow.
+
+        Row metadata and the RFU values of each SOMAmer (named by SeqId) are stored as columns,
+        the column metadata and header metadata in the file's schema metadata.
+
+        Parameters
+        ----------
+        path : str
+            Path that the file will be written to
+
+        row_group_size : int, optional
+            The maximum number of samples per row group.
+
+        **kwargs
+            Passed on to `pyarrow.parquet.write_table` (e.g., `compression`).
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> Adat.to_parquet('path/to/file.parquet')
+        >>> Adat.to_parquet('path/to/file.parquet', row_group_size=100, compression='zstd')
+        """
+        io.parquet.file.write_parquet(self, path, row_group_size, **kwargs)
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import re
-from copy import deepcopy
 from warnings import warn
 
 import pandas as pd
 
 from somadata import Adat
+from somadata.base.adat_math_helpers import _lift_rfu
 from somadata.data.lift import check_substrings
 
 from . import errors
@@ -115,21 +115,21 @@ class Annotations(pd.DataFrame):
                 "SeqId not found in either index or columns of annotations data"
             )
 
-        mod_adat = adat.copy()
-        for xlsx_col, adat_col in xlsx_to_adat_column_map.items():
-            if adat_col not in adat.columns.names:
-                continue
-            values_dict = {
-                seq_id: col_meta
-                for seq_id, col_meta in zip(seq_ids, self[xlsx_col].values)
-            }
-            mod_adat = mod_adat.replace_keyed_meta(
-                axis=1,
-                replaced_meta_name=adat_col,
-                key_meta_name='SeqId',
-                values_dict=values_dict,
-            )
-        return mod_adat
+        # Update every column metadata name in a single rebuild of the adat's column metadata
+        with adat.edit_meta(axis=1) as edit:
+            for xlsx_col, adat_col in xlsx_to_adat_column_map.items():
+                if adat_col not in edit.names:
+                    continue
+                values_dict = {
+                    seq_id: col_meta
+                    for seq_id, col_meta in zip(seq_ids, self[xlsx_col].values)
+                }
+                edit.replace_keyed(
+                    replaced_meta_name=adat_col,
+                    key_meta_name='SeqId',
+                    values_dict=values_dict,
+                )
+        return edit.adat
 
     def supported_lifting_space_str(self):
         ret_str = ''
@@ -249,12 +249,4 @@ class Annotations(pd.DataFrame):
                 'Unable to perform lifting due to analyte mismatch between adat & annotations. Has either file been modified?'
             )
 
-        # Scale adat
-        scaled_adat = adat.multiply(scalars, axis='columns', level='SeqId').round(1)
-        scaled_adat.header_metadata = deepcopy(adat.header_metadata)
-        scaled_adat.header_metadata[
-            '!ProcessSteps'
-        ] += f', Lifting Bridge ({signal_space} -> {lift_to_version})'
-        scaled_adat.header_metadata['SignalSpace'] = lift_to_version
-
-        return scaled_adat
+        return _lift_rfu(adat, scalars, signal_space, lift_to_version)
@@ -5,6 +5,8 @@ import numpy as np
 import pandas as pd
 
 from ..data.lift import LiftData
+from ..tools.math import jround_array
+from ..tools.pandas import get_float_dtype
 
 
 def calcELOD(x: pd.Series):
@@ -16,6 +18,27 @@ def calcELOD(x: pd.Series):
     return eLOD
 
 
+def _lift_rfu(adat, scale_factors: pd.Series, signal_space: str, lift_to_version: str):
+    """Returns the adat scaled by its SeqId scale factors, rounded and annotated as lifted to `lift_to_version`."""
+    # Scale adat, keeping the RFU dtype (e.g., float32) of the adat
+    scale_factors = scale_factors.astype(get_float_dtype(adat))
+    # Arithmetic with a Series does not carry subclass metadata over, the result takes the adat's
+    scaled_adat = adat.multiply(scale_factors, axis='columns', level='SeqId')
+    # Round the way the adat writer does, rather than DataFrame.round's float error prone x * 10 / 10
+    rounded_rfu = jround_array(scaled_adat.to_numpy(), 1)
+    scaled_adat = adat._constructor(
+        rounded_rfu.astype(get_float_dtype(adat), copy=False),
+        index=scaled_adat.index,
+        columns=scaled_adat.columns,
+    ).__finalize__(adat)
+    scaled_adat.header_metadata = deepcopy(adat.header_metadata)
+    scaled_adat.header_metadata[
+        '!ProcessSteps'
+    ] += f', Lifting Bridge ({signal_space} -> {lift_to_version})'
+    scaled_adat.header_metadata['SignalSpace'] = lift_to_version
+    return scaled_adat
+
+
 class AdatMathHelpers:
     """
     A collection of methods to help with performing common and standard computations on the adat.
@@ -166,13 +189,4 @@ class AdatMathHelpers:
                     'Unable to perform lifting due to analyte mismatch between adat & lift reference unable to lift.'
                 )
 
-        # Scale adat
-        scaled_adat = adat.multiply(
-            lift.scale_factors, axis='columns', level='SeqId'
-        ).round(1)
-        scaled_adat.header_metadata = deepcopy(adat.header_metadata)
-        scaled_adat.header_metadata[
-            '!ProcessSteps'
-        ] += f', Lifting Bridge ({signal_space} -> {lift_to_version})'
-        scaled_adat.header_metadata['SignalSpace'] = lift_to_version
-        return scaled_adat
+        return _lift_rfu(adat, lift.scale_factors, signal_space, lift_to_version)
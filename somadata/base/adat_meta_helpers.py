@@ -1,14 +1,175 @@
 from __future__ import annotations
 from somadata.errors import AdatKeyError, AdatMetaError
 from typing import Union, List, Set, Tuple, Dict
-from somadata.tools.pandas import get_pd_axis
+from somadata.tools.pandas import get_pd_axis, metadata_copy
 import numpy as np
+import re
 import warnings
 import pandas as pd
 
 
+def _insert_keyed_values(key_meta: pd.Index, values_dict: Dict(str, str)) -> List(str):
+    values = []
+    for key in key_meta:
+        if key in values_dict:
+            values.append(values_dict[key])
+        else:
+            values.append('')
+
+    if None in values:
+        warnings.warn('Empty string values inserted into metadata.', category=Warning)
+    return values
+
+
+def _replace_keyed_values(key_meta: pd.Index, values_to_update: pd.Index, values_dict: Dict(str, str)) -> List(str):
+    values = []
+    warning_str = 'Some keys not provided, using original values for those keys'
+    warnings.filterwarnings('once', message=warning_str)
+    for key, value in zip(key_meta, values_to_update):
+        if key in values_dict:
+            values.append(values_dict[key])
+        else:
+            warnings.warn(warning_str)
+            values.append(value)
+    return values
+
+
+def _hashable_values(metadata_values: pd.Index) -> pd.Index:
+    """Returns string metadata values as objects, which `isin` looks up far faster than pandas' string dtype."""
+    if pd.api.types.is_string_dtype(metadata_values.dtype):
+        return metadata_values.astype(object)
+    return metadata_values
+
+
+def _condition_mask(metadata_values: pd.Index, condition) -> np.ndarray:
+    """Returns the boolean mask of the metadata values that meet a `query_meta` condition."""
+    if callable(condition):
+        mask = np.asarray(condition(metadata_values), dtype=bool)
+        if mask.shape != (len(metadata_values),):
+            raise ValueError(f'Condition mask has shape {mask.shape}, expected ({len(metadata_values)},)')
+        return mask
+    if isinstance(condition, re.Pattern):
+        return np.asarray(pd.Series(metadata_values.astype(str)).str.contains(condition), dtype=bool)
+    if isinstance(condition, slice):
+        if condition.step is not None:
+            raise ValueError('Range conditions do not support a step.')
+        bounds = [bound for bound in (condition.start, condition.stop) if bound is not None]
+        if all(isinstance(bound, (int, float)) for bound in bounds):
+            # Numeric bounds compare the values as numbers, values that are not numbers never match
+            metadata_values = pd.Index(pd.to_numeric(metadata_values, errors='coerce'))
+        mask = np.ones(len(metadata_values), dtype=bool)
+        if condition.start is not None:
+            mask &= np.asarray(metadata_values >= condition.start, dtype=bool)
+        if condition.stop is not None:
+            mask &= np.asarray(metadata_values <= condition.stop, dtype=bool)
+        return mask
+    if isinstance(condition, (list, tuple, set, frozenset)):
+        return np.asarray(_hashable_values(metadata_values).isin(condition), dtype=bool)
+    return np.asarray(metadata_values == condition, dtype=bool)
+
+
+class MetaEdit:
+    """A batch of metadata changes to one axis of an adat, applied with a single rebuild of its metadata.
+
+    Created with `adat.edit_meta(axis)`. Inserts, replacements and drops are checked as they are added
+    and only change the pending metadata, `apply` (or leaving the `with` block) builds the new
+    MultiIndex once and returns a new adat that shares the RFU values of the original.
+
+    Examples
+    --------
+    >>> with adat.edit_meta(axis=1) as edit:
+    ...     edit.replace('Target', targets)
+    ...     edit.insert('Rank', ranks)
+    ...     edit.drop(['Dilution'])
+    >>> new_adat = edit.adat
+    >>> new_adat = adat.edit_meta(axis=0).replace('Barcode', barcodes).drop(['PlateId']).apply()
+    """
+
+    def __init__(self, adat: Adat, axis: int) -> None:
+        metadata = get_pd_axis(adat, axis)
+        self.axis = axis
+        self.source_adat = adat
+        self.adat = None
+        self.levels = {name: metadata.get_level_values(name) for name in metadata.names}
+        self.length = len(metadata)
+
+    @property
+    def names(self) -> List(str):
+        """The metadata names after the pending changes."""
+        return list(self.levels)
+
+    def _level(self, name: str) -> pd.Index:
+        """Returns the pending values of metadata `name`, which may have been dropped by an earlier change."""
+        if name not in self.levels:
+            raise AdatKeyError(f'Name, "{name}", not found in multiindex')
+        return self.levels[name]
+
+    def _check_length(self, name: str, values: Union[List(str), Tuple(str)]) -> None:
+        if len(values) != self.length:
+            raise ValueError(f'Length of values for "{name}" ({len(values)}) does not match the length of the metadata ({self.length})')
+
+    def insert(self, name: str, values: Union[List(str), Tuple(str)]) -> MetaEdit:
+        """Adds metadata `name`, see `Adat.insert_meta`."""
+        if name in self.levels:
+            raise AdatKeyError('Name already exists in metadata, use `replace` instead.')
+        self._check_length(name, values)
+        self.levels[name] = values
+        return self
+
+    def replace(self, name: str, values: Union[List(str), Tuple(str)]) -> MetaEdit:
+        """Replaces the values of metadata `name`, see `Adat.replace_meta`."""
+        if name not in self.levels:
+            raise AdatKeyError('Name does not exists in metadata, use `insert` instead.')
+        self._check_length(name, values)
+        self.levels[name] = values
+        return self
+
+    def drop(self, names: Union[List(str), Set(str), Tuple(str)]) -> MetaEdit:
+        """Removes the metadata `names`, see `Adat.exclude_meta`."""
+        if not isinstance(names, (list, tuple, set)):
+            raise TypeError('"names" must be a list, tuple, or set.')
+        # A name given twice is dropped once
+        names = list(dict.fromkeys(names))
+        for name in names:
+            self._level(name)
+        for name in names:
+            del self.levels[name]
+        return self
+
+    def insert_keyed(self, inserted_meta_name: str, key_meta_name: str, values_dict: Dict(str, str)) -> MetaEdit:
+        """Adds metadata keyed to existing metadata, see `Adat.insert_keyed_meta`."""
+        if inserted_meta_name in self.levels:
+            raise AdatKeyError('Name already exists in index, use `replace_keyed` instead.')
+        return self.insert(inserted_meta_name, _insert_keyed_values(self._level(key_meta_name), values_dict))
+
+    def replace_keyed(self, replaced_meta_name: str, values_dict: Dict(str, str), key_meta_name: str = None) -> MetaEdit:
+        """Updates metadata keyed to existing metadata, see `Adat.replace_keyed_meta`."""
+        key_meta_name = key_meta_name or replaced_meta_name
+        if replaced_meta_name not in self.levels:
+            raise AdatKeyError('Name does not exists in index, use `insert_keyed` instead.')
+        values = _replace_keyed_values(self._level(key_meta_name), self.levels[replaced_meta_name], values_dict)
+        return self.replace(replaced_meta_name, values)
+
+    def apply(self) -> Adat:
+        """Returns the adat with all the changes, building its metadata once."""
+        self.adat = self.source_adat._apply_meta_edit(self.axis, self.levels)
+        return self.adat
+
+    def __enter__(self) -> MetaEdit:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.apply()
+
+
 class AdatMetaHelpers:
     """A collection of methods to help with altering the adat metadata and the adat based on the metadata.
+
+    Methods that only change the metadata return Adats that share the RFU values of the original
+    (a shallow copy) when pandas copy-on-write is active (always from pandas 3.0), writing to either Adat
+    then copies the values it writes to first. Without copy-on-write the RFU values are copied, so the
+    other Adat is never changed.
     """
     def _filter_on_meta(self, axis: int, name: str, values: Union[List(str), Set(str), Tuple(str)], include: bool = True) -> Adat:
 
@@ -18,34 +179,22 @@ class AdatMetaHelpers:
         else:
             values = set(values)
 
-        # Setup array and get appropriate multiindex
-        keep = []
-        metadata = get_pd_axis(self, axis)
+        # Get appropriate multiindex
+        metadata_values = _hashable_values(get_pd_axis(self, axis).get_level_values(name))
 
         # Check to ensure all values are in the metadata
-        metadata_values = set(metadata.get_level_values(name))
-        if not metadata_values.issuperset(values):
+        if not pd.Index(list(values), dtype=object).isin(metadata_values).all():
             raise KeyError(f'Some or all provided values not found in metadata column, {name}.')
 
-        # Iterate over the selected multiindex and fill the keep array
-        for value in metadata.get_level_values(name):
-            if value in values:
-                keep.append(True)
-            else:
-                keep.append(False)
-
-        # Invert the keep array if we are excluding the chosen values
+        # Build the keep mask, inverted if we are excluding the chosen values
+        keep = metadata_values.isin(values)
         if not include:
-            keep = np.invert(keep)
+            keep = ~keep
 
-        # Subset the adat
+        # Subset the adat, boolean indexing already returns a new adat
         if axis == 0:
-            adat = self.loc[keep]
-        elif axis == 1:
-            adat = self.loc[:, keep]
-
-        # Return the subsetted adat (default) or modify the current adat in place
-        return adat.copy()
+            return self.loc[keep]
+        return self.loc[:, keep]
 
     def _filter_meta(self, axis: int, names: Union[List(str), Set(str), Tuple(str)], include: bool) -> Adat:
 
@@ -55,8 +204,8 @@ class AdatMetaHelpers:
         else:
             names = set(names)
 
-        # Make a copy of the df (what we will eventually return) & grab the multiindex
-        adat = self.copy()
+        # Copy the df (what we will eventually return) & grab the multiindex
+        adat = metadata_copy(self)
         metadata = get_pd_axis(adat, axis)
 
         # Double check to make sure names exist in multiindex
@@ -81,7 +230,7 @@ class AdatMetaHelpers:
 
     def _insert_meta(self, axis: int, name: str, values: Union[List(str), Tuple(str)], replace: bool) -> Adat:
 
-        adat = self.copy()
+        adat = metadata_copy(self)
         if axis == 0:
             if not replace and name in adat.index.names:
                 raise AdatKeyError('Name already exists in index, use `adat.replace_meta` instead.')
@@ -103,6 +252,43 @@ class AdatMetaHelpers:
 
         return adat
 
+    def _apply_meta_edit(self, axis: int, levels: Dict(str, pd.Index)) -> Adat:
+        if not levels:
+            raise AdatMetaError('An adat axis must keep at least one metadata name.')
+        metadata = pd.MultiIndex.from_arrays(list(levels.values()), names=list(levels))
+
+        adat = metadata_copy(self)
+        if axis == 0:
+            adat.index = metadata
+        else:
+            adat.columns = metadata
+        return adat
+
+    def edit_meta(self, axis: int) -> MetaEdit:
+        """Returns a MetaEdit that batches metadata inserts, replacements and drops into one rebuild.
+
+        Parameters
+        ----------
+        axis : int
+            The metadata/multiindex to operate on:
+            0 - row metadata,
+            1 - column metadata
+
+        Returns
+        -------
+        edit : MetaEdit
+
+        Examples
+        --------
+        >>> with adat.edit_meta(axis=1) as edit:
+        ...     edit.replace('Target', targets)
+        ...     edit.insert('Rank', ranks)
+        ...     edit.drop(['Dilution'])
+        >>> new_adat = edit.adat
+        >>> new_adat = adat.edit_meta(axis=0).replace('Barcode', barcodes).apply()
+        """
+        return MetaEdit(self, axis)
+
     def exclude_on_meta(self, axis: int, name: str, values: Union[List(str), Set(str), Tuple(str)]) -> Adat:
         """Returns an adat with rfu rows or columns excluded given the multiindex name and values to exclude on.
 
@@ -160,6 +346,55 @@ class AdatMetaHelpers:
 
         return self._filter_on_meta(axis, name, values, include=True)
 
+    def _query_mask(self, axis: int, conditions: Dict(str, object)) -> Union[np.ndarray, slice]:
+        if not conditions:
+            return slice(None)
+
+        metadata = get_pd_axis(self, axis)
+        mask = np.ones(len(metadata), dtype=bool)
+        for name, condition in conditions.items():
+            if name not in metadata.names:
+                raise AdatKeyError(f'Name, "{name}", not found in multiindex')
+            mask &= _condition_mask(metadata.get_level_values(name), condition)
+        return mask
+
+    def query_meta(self, rows: Dict(str, object) = None, columns: Dict(str, object) = None) -> Adat:
+        """Returns an adat with the rows and columns whose metadata meet all of the given conditions.
+
+        Each condition is keyed by a metadata name and can be:
+         - a value, kept when equal
+         - a list, tuple or set, kept when the value is one of them
+         - a slice, kept when `start <= value <= stop` (either bound may be None).
+           Numeric bounds compare the values as numbers.
+         - a compiled regex (`re.compile`), kept when it matches part of the value
+         - a callable, given the metadata values (`pd.Index`) and returning a boolean mask
+
+        Unlike `pick_on_meta`, values that do not occur in the metadata are not an error.
+        The rows & columns are selected together, in a single subset of the adat.
+
+        Parameters
+        ----------
+        rows : Dict(str, object), optional
+            Conditions on the row metadata.
+
+        columns : Dict(str, object), optional
+            Conditions on the column metadata.
+
+        Returns
+        -------
+        adat : Adat
+
+        Examples
+        --------
+        >>> new_adat = adat.query_meta(rows={'SampleType': 'Sample', 'RowCheck': 'PASS'})
+        >>> new_adat = adat.query_meta(rows={'HybControlNormScale': slice(0.4, 2.5)}, columns={'Type': 'Protein'})
+        >>> new_adat = adat.query_meta(columns={'Target': re.compile('^IL'), 'SeqId': ['10000-28', '10001-7']})
+        >>> new_adat = adat.query_meta(rows={'SampleId': lambda values: values.str.startswith('QC')})
+        """
+        row_mask = self._query_mask(0, rows)
+        column_mask = self._query_mask(1, columns)
+        return self.loc[row_mask, column_mask]
+
     def pick_meta(self, axis: int, names: Union[List(str), Set(str), Tuple(str)]) -> Adat:
         """Returns an adat with excluded metadata/multiindices given the names to keep.
 
@@ -299,22 +534,13 @@ class AdatMetaHelpers:
         >>> new_adat = adat.insert_keyed_meta(axis=1, inserted_meta_name='NewProteinType', key_meta_name='Type', values_dict={"Protein": "Buffer")
         """
 
-        values = []
         metadata = get_pd_axis(self, axis)
         key_meta = metadata.get_level_values(key_meta_name)
 
         if inserted_meta_name in metadata.names:
             raise AdatKeyError('Name already exists in index, use `adat.replace_keyed_meta` instead.')
 
-        for key in key_meta:
-            if key in values_dict:
-                values.append(values_dict[key])
-            else:
-                values.append('')
-
-        if None in values:
-            warnings.warn('Empty string values inserted into metadata.', category=Warning)
-
+        values = _insert_keyed_values(key_meta, values_dict)
         return self.insert_meta(axis, inserted_meta_name, values)
 
     def replace_keyed_meta(self, axis: int, replaced_meta_name: str, values_dict: Dict(str, str), key_meta_name: str = None) -> Adat:
@@ -351,7 +577,6 @@ class AdatMetaHelpers:
 
         key_meta_name = key_meta_name or replaced_meta_name
 
-        values = []
         metadata = get_pd_axis(self, axis)
         key_meta = metadata.get_level_values(key_meta_name)
         values_to_update = metadata.get_level_values(replaced_meta_name)
@@ -359,15 +584,7 @@ class AdatMetaHelpers:
         if replaced_meta_name not in metadata.names:
             raise AdatKeyError('Name does not exists in index, use `adat.insert_keyed_meta` instead.')
 
-        warning_str = 'Some keys not provided, using original values for those keys'
-        warnings.filterwarnings('once', message=warning_str)
-        for key, value in zip(key_meta, values_to_update):
-            if key in values_dict:
-                values.append(values_dict[key])
-            else:
-                warnings.warn(warning_str)
-                values.append(value)
-
+        values = _replace_keyed_values(key_meta, values_to_update, values_dict)
         return self.replace_meta(axis, replaced_meta_name, values)
 
     def update_somamer_metadata_from_adat(self, adat: Adat) -> Adat:
@@ -396,28 +613,30 @@ class AdatMetaHelpers:
         # Check to make sure seq_ids & order are identical
         if list(adat.columns.get_level_values('SeqId')) != list(self.columns.get_level_values('SeqId')):
             raise AdatMetaError('SeqIds do not match the provided adat. Unable to perform metadata substitution')
+        columns = get_pd_axis(adat, 1)
 
         columns_to_overwrite = [
             'SeqIdVersion', 'SomaId', 'TargetFullName', 'Target', 'UniProt',
             'EntrezGeneID', 'EntrezGeneSymbol', 'Organism', 'Units', 'Type', 'Dilution',
         ]
 
-        new_meta_adat = self.copy()
+        edit = self.edit_meta(axis=1)
         # Modify adat for each name in columns_to_overwrite
         for column_name in columns_to_overwrite:
 
             # Check to see if the column exists. If it doesn't, throw a warning & move on to the next one
-            if column_name not in new_meta_adat.columns.names:
+            if column_name not in edit.names:
                 warnings.warn(f'Standard column, {column_name}, not found in column metadata. Continuing to next.')
                 continue
             # If it does exist in the source adat but not in the provided adat, we have problems!
-            elif column_name not in adat.columns.names:
+            elif column_name not in columns.names:
                 AdatMetaError(f'Standard column, {column_name}, not found in provided column metadata but exists in source adat.')
 
             # Replace metadata
-            new_meta_adat = new_meta_adat.replace_meta(axis=1, name=column_name, values=adat.columns.get_level_values(column_name))
+            edit.replace(column_name, columns.get_level_values(column_name))
 
-        return new_meta_adat
+        # Rebuild the column metadata once for all the replaced names
+        return edit.apply()
 
     def reorder_on_metadata(self, axis: int, name: str, source_adat: Adat) -> Adat:
         """Given an Adat with matching metadata in a different order, returns this adat reorganized to match that order.
@@ -446,23 +665,92 @@ class AdatMetaHelpers:
         --------
         >>> new_adat = adat.reorder_on_metadata(axis=1, name='SeqId', other_adat)
         """
-        reorder_index = []
-        adat = self.copy()
-        if axis == 0:
-            metadata_order = list(source_adat.index.get_level_values(name))
-            for metadata in adat.index.get_level_values(name):
-                try:
-                    reorder_index.append(metadata_order.index(metadata))
-                except ValueError:
-                    raise AdatMetaError(f'Source metadata, {metadata}, not found in adat index, {name}')
-            adat = adat.iloc[reorder_index]
-        elif axis == 1:
-            metadata_order = list(source_adat.columns.get_level_values(name))
-            for metadata in adat.columns.get_level_values(name):
-                try:
-                    reorder_index.append(metadata_order.index(metadata))
-                except ValueError:
-                    raise AdatMetaError(f'Source metadata, {metadata}, not found in adat column, {name}')
-            adat = adat.iloc[:, reorder_index]
+        axis_name = 'index' if axis == 0 else 'column'
+        keys = _hashable_values(get_pd_axis(self, axis).get_level_values(name))
+        source_keys = _hashable_values(get_pd_axis(source_adat, axis).get_level_values(name))
 
-        return adat
+        # Every one of this adat's rows/columns must be placed in the source order
+        not_in_source = ~keys.isin(source_keys)
+        if not_in_source.any():
+            raise AdatMetaError(f'Source metadata, {keys[not_in_source][0]}, not found in adat {axis_name}, {name}')
+
+        return self.align_to(source_adat, axis, name, missing='raise')
+
+    def align_to(self, other: Adat, axis: int, on: str, missing: str = 'raise') -> Adat:
+        """Returns this adat with its rows or columns in the order of another adat's, matched on a metadata name.
+
+        Rows/columns are matched by a hash lookup of the `on` metadata values, which must be unique
+        in both adats. Rows/columns of this adat whose values are not in `other` are left out.
+
+        Parameters
+        ----------
+        other : Adat
+            An Adat object with the metadata order you want
+
+        axis : int
+            The metadata/multiindex to operate on:
+            0 - row metadata,
+            1 - column metadata
+
+        on : str
+            The name of the metadata matched between the adats, e.g. 'SeqId' or 'SampleId'.
+
+        missing : str
+            How values of `other` that are not in this adat are handled:
+            'raise' (default) raises an AdatMetaError,
+            'drop' leaves them out of the result,
+            'nan' adds rows/columns of NaN RFUs, whose metadata is taken from `other` (names that `other`
+            does not have are empty strings).
+
+        Returns
+        -------
+        aligned_adat : Adat
+            This Adat whose rows or columns match the order of the provided adat's.
+
+        Examples
+        --------
+        >>> new_adat = adat.align_to(other_adat, axis=1, on='SeqId')
+        >>> new_adat = adat.align_to(other_adat, axis=0, on='SampleId', missing='drop')
+        >>> new_adat = adat.align_to(other_adat, axis=1, on='SeqId', missing='nan')
+        """
+        if missing not in ('raise', 'drop', 'nan'):
+            raise ValueError(f'Unknown missing "{missing}". Choose "raise", "drop" or "nan".')
+
+        metadata = get_pd_axis(self, axis)
+        other_metadata = get_pd_axis(other, axis)
+        keys = _hashable_values(metadata.get_level_values(on))
+        other_keys = _hashable_values(other_metadata.get_level_values(on))
+        if not keys.is_unique or not other_keys.is_unique:
+            raise AdatMetaError(f'Metadata, {on}, must be unique in both adats to align them.')
+
+        positions = keys.get_indexer(other_keys)
+        is_missing = positions == -1
+        if is_missing.any():
+            if missing == 'raise':
+                raise AdatMetaError(f'Metadata, {other_keys[is_missing][0]}, not found in adat {on}')
+            if missing == 'drop':
+                positions = positions[~is_missing]
+                is_missing = is_missing[~is_missing]
+
+        # Missing entries take the first row/column as a placeholder, replaced below
+        take = np.where(is_missing, 0, positions)
+        aligned = self.iloc[take] if axis == 0 else self.iloc[:, take]
+        if not is_missing.any():
+            return aligned
+
+        levels = {}
+        for level_name in metadata.names:
+            if level_name in other_metadata.names:
+                fill_values = other_metadata.get_level_values(level_name)
+            else:
+                fill_values = np.full(len(other_metadata), '', dtype=object)
+            level_values = np.asarray(metadata.get_level_values(level_name), dtype=object)[take]
+            levels[level_name] = np.where(is_missing, np.asarray(fill_values, dtype=object), level_values)
+
+        aligned = aligned._apply_meta_edit(axis, levels)
+        missing_positions = np.flatnonzero(is_missing)
+        if axis == 0:
+            aligned.iloc[missing_positions] = np.nan
+        else:
+            aligned.iloc[:, missing_positions] = np.nan
+        return aligned
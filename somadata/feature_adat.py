@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from somadata.adat import Adat
+from somadata.base.adat_meta_helpers import _hashable_values
+from somadata.errors import AdatKeyError, AdatMetaError
+from somadata.tools.pandas import metadata_copy
+
+
+def _feature_table(column_metadata: Dict[str, List[str]]) -> pd.DataFrame:
+    """Returns the column metadata as a DataFrame indexed by SeqId."""
+    if 'SeqId' not in column_metadata:
+        raise AdatMetaError('SeqId not found in column metadata.')
+    feature_table = pd.DataFrame(column_metadata)
+    feature_table.index = pd.Index(column_metadata['SeqId'])
+    if not feature_table.index.is_unique:
+        raise AdatMetaError('SeqIds must be unique to key a feature table.')
+    return feature_table
+
+
+class FeatureAdat(Adat):
+    """An Adat whose columns are keyed by SeqId, with the column metadata in a side DataFrame.
+
+    The columns are a plain `pd.Index` of SeqIds and `feature_table` holds every column metadata field
+    (including SeqId), indexed by SeqId. Building it is cheaper than the MultiIndex of an Adat, column-wise
+    operations do not carry the metadata levels along, and `insert_meta`/`replace_meta`/`pick_meta`/
+    `exclude_meta`/`pick_on_meta`/`exclude_on_meta` on the column axis only touch the feature table.
+    The feature table may hold SeqIds that have been filtered out of the columns.
+
+    `column_multiindex` (and therefore `to_adat`, `to_parquet` & `to_binary`) provides the column
+    metadata as an Adat's MultiIndex. SeqIds must be unique.
+
+    Examples
+    --------
+    >>> adat = somadata.read_adat('path/to/file.adat', feature_table=True)
+    >>> adat.feature_table.loc['10000-28', 'Target']
+    >>> adat = FeatureAdat.from_adat(multiindex_adat)
+    >>> multiindex_adat = adat.to_multiindex_adat()
+    """
+
+    _metadata = ['header_metadata', 'feature_table']
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.feature_table = kwargs.pop('feature_table', None)
+        super(FeatureAdat, self).__init__(*args, **kwargs)
+
+    @property
+    def _constructor(self) -> FeatureAdat:
+        return FeatureAdat
+
+    @classmethod
+    def from_features(
+        cls,
+        rfu_matrix: Union[List[List[float]], np.ndarray],
+        row_metadata: Dict[str, List[str]],
+        column_metadata: Dict[str, List[str]],
+        header_metadata: Dict[str, str],
+        dtype: Optional[Union[str, np.dtype]] = None,
+    ) -> FeatureAdat:
+        """Returns a FeatureAdat from the component adat file format sections.
+
+        See `Adat.from_features`, the column metadata must contain unique SeqIds.
+        """
+        if dtype is not None:
+            rfu_matrix = np.asarray(rfu_matrix, dtype=dtype)
+
+        feature_table = _feature_table(column_metadata)
+        index = pd.MultiIndex.from_arrays(
+            list(row_metadata.values()), names=list(row_metadata.keys())
+        )
+        return cls(
+            data=rfu_matrix,
+            index=index,
+            columns=pd.Index(feature_table.index, name='SeqId'),
+            header_metadata=header_metadata,
+            feature_table=feature_table,
+            copy=False,
+        )
+
+    @classmethod
+    def from_adat(cls, adat: Adat) -> FeatureAdat:
+        """Returns a FeatureAdat with the RFU values, row & header metadata of an Adat."""
+        feature_table = _feature_table(
+            {name: adat.columns.get_level_values(name) for name in adat.columns.names}
+        )
+        return cls(
+            data=adat.to_numpy(),
+            index=adat.index,
+            columns=pd.Index(feature_table.index, name='SeqId'),
+            header_metadata=adat.header_metadata,
+            feature_table=feature_table,
+            copy=False,
+        )
+
+    def to_multiindex_adat(self) -> Adat:
+        """Returns an Adat, whose columns are the column metadata MultiIndex."""
+        return Adat(
+            data=self.to_numpy(),
+            index=self.index,
+            columns=self.column_multiindex,
+            header_metadata=self.header_metadata,
+            copy=False,
+        )
+
+    def _aligned_feature_table(self) -> pd.DataFrame:
+        """Returns the feature table rows of the adat's columns, in column order."""
+        if self.feature_table is None:
+            # e.g., the result of pd.concat, which does not carry a FeatureAdat's metadata over
+            raise AdatMetaError(
+                'FeatureAdat has no feature table, so its column metadata is unknown. '
+                'Use FeatureAdat.from_adat or to_multiindex_adat before combining FeatureAdats.'
+            )
+        if self.feature_table.index.equals(self.columns):
+            return self.feature_table
+        return self.feature_table.loc[self.columns]
+
+    @property
+    def column_multiindex(self) -> pd.MultiIndex:
+        """The column metadata as a MultiIndex, which are the columns of an Adat."""
+        feature_table = self._aligned_feature_table()
+        return pd.MultiIndex.from_arrays(
+            [feature_table[name] for name in feature_table.columns],
+            names=list(feature_table.columns),
+        )
+
+    def _with_feature_table(
+        self, feature_table: pd.DataFrame, columns: Optional[pd.Index] = None
+    ) -> FeatureAdat:
+        adat = metadata_copy(self)
+        adat.feature_table = feature_table
+        if columns is not None:
+            adat.columns = columns
+        return adat
+
+    def _apply_meta_edit(self, axis: int, levels: Dict[str, pd.Index]) -> FeatureAdat:
+        if axis != 1:
+            return super()._apply_meta_edit(axis, levels)
+
+        feature_table = _feature_table(
+            {name: list(values) for name, values in levels.items()}
+        )
+        columns = pd.Index(feature_table.index, name='SeqId')
+        if columns.equals(self.columns):
+            columns = None
+        return self._with_feature_table(feature_table, columns)
+
+    def _filter_on_meta(
+        self,
+        axis: int,
+        name: str,
+        values: Union[List[str], Set[str], Tuple[str]],
+        include: bool = True,
+    ) -> FeatureAdat:
+        if axis != 1:
+            return super()._filter_on_meta(axis, name, values, include)
+
+        if not isinstance(values, (list, tuple, set)):
+            raise TypeError('"values" must be a list, tuple, or set.')
+        values = set(values)
+
+        metadata_values = _hashable_values(
+            pd.Index(self._aligned_feature_table()[name])
+        )
+        if not pd.Index(list(values), dtype=object).isin(metadata_values).all():
+            raise KeyError(
+                f'Some or all provided values not found in metadata column, {name}.'
+            )
+
+        keep = metadata_values.isin(values)
+        if not include:
+            keep = ~keep
+        return self.loc[:, keep]
+
+    def _filter_meta(
+        self, axis: int, names: Union[List[str], Set[str], Tuple[str]], include: bool
+    ) -> FeatureAdat:
+        if axis != 1:
+            return super()._filter_meta(axis, names, include)
+
+        if not isinstance(names, (list, tuple, set)):
+            raise TypeError('"values" must be a list, tuple, or set.')
+        names = set(names)
+
+        for name in names:
+            if name not in self.feature_table.columns:
+                raise AdatKeyError(f'Name, "{name}", not found in multiindex')
+
+        kept_names = [
+            name for name in self.feature_table.columns if (name in names) == include
+        ]
+        if 'SeqId' not in kept_names:
+            raise AdatMetaError(
+                'SeqId keys the columns of a FeatureAdat and cannot be removed.'
+            )
+        return self._with_feature_table(self.feature_table[kept_names])
+
+    def _insert_meta(
+        self,
+        axis: int,
+        name: str,
+        values: Union[List[str], Tuple[str]],
+        replace: bool,
+    ) -> FeatureAdat:
+        if axis != 1:
+            return super()._insert_meta(axis, name, values, replace)
+
+        if not replace and name in self.feature_table.columns:
+            raise AdatKeyError(
+                'Name already exists in columns, use `adat.replace_meta` instead.'
+            )
+        elif replace and name not in self.feature_table.columns:
+            raise AdatKeyError(
+                'Name does not exists in columns, use `adat.insert_meta` instead.'
+            )
+
+        feature_table = self._aligned_feature_table().copy()
+        feature_table[name] = list(values)
+        if name != 'SeqId':
+            return self._with_feature_table(feature_table)
+
+        columns = pd.Index(feature_table['SeqId'], name='SeqId')
+        if not columns.is_unique:
+            raise AdatMetaError('SeqIds must be unique to key a feature table.')
+        feature_table.index = pd.Index(feature_table['SeqId'])
+        return self._with_feature_table(feature_table, columns)
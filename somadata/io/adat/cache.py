@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from somadata import Adat
+from somadata.io.binary.errors import AdatBinaryReadError
+from somadata.io.binary.file import METADATA_FILENAME, read_binary, write_binary
+
+# parse_file arguments that do not change the parsed result
+IGNORED_OPTIONS = ('f', 'engine', 'compression', 'workers')
+
+
+class AdatCache:
+    """A directory of parsed adats that `read_adat` can serve repeated reads from.
+
+    Each entry is a binary adat (see `Adat.to_binary`), whose RFU matrix is memory-mapped
+    on a cache hit. Entries are keyed by the adat's path,
+    size and modification time (or, with `key='hash'`, its content) plus the parse options.
+    The least recently used entries are evicted once the directory exceeds `max_bytes`.
+
+    Parameters
+    ----------
+    directory : str
+        The cache directory, created if it does not exist.
+
+    max_bytes : int
+        The maximum total size of the cache entries. (Default = 10 GiB)
+
+    key : str
+        'stat' (default) keys files on their path, size & modification time,
+        'hash' keys files on a SHA-256 hash of their content.
+
+    Examples
+    --------
+    >>> cache = somadata.AdatCache('path/to/cache', max_bytes=2 * 1024**3)
+    >>> adat = somadata.read_adat('path/to/file.adat', cache=cache)
+    >>> adat = somadata.read_adat('path/to/file.adat', cache='path/to/cache')
+    """
+
+    def __init__(
+        self, directory: str, max_bytes: int = 10 * 1024**3, key: str = 'stat'
+    ) -> None:
+        if key not in ('stat', 'hash'):
+            raise ValueError(f'Unknown key "{key}". Choose "stat" or "hash".')
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        self.key = key
+        os.makedirs(self.directory, exist_ok=True)
+
+    def entry_key(self, path: str, options: Dict) -> Optional[str]:
+        """Returns the cache key of an adat parsed with the given `parse_file` options.
+
+        Returns None if the options cannot be cached (e.g., callable filters).
+        """
+        options = {
+            name: value
+            for name, value in options.items()
+            if name not in IGNORED_OPTIONS
+        }
+        if (
+            options.get('column_filter') is not None
+            or options.get('row_filter') is not None
+        ):
+            return None
+        if options.get('seq_ids') is not None:
+            options['seq_ids'] = sorted(options['seq_ids'])
+        options['dtype'] = np.dtype(options.get('dtype', np.float64)).str
+
+        path = os.path.abspath(path)
+        if self.key == 'hash':
+            file_hash = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    file_hash.update(block)
+            identity = [file_hash.hexdigest()]
+        else:
+            stat = os.stat(path)
+            identity = [path, stat.st_size, stat.st_mtime_ns]
+
+        key_data = json.dumps([identity, options], sort_keys=True, default=str)
+        return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Adat]:
+        """Returns the cached Adat for `key`, or None on a cache miss."""
+        entry = os.path.join(self.directory, key)
+        if not os.path.isdir(entry):
+            return None
+        try:
+            # Copy-on-write mapping, RFU pages are read lazily and writes never reach the file
+            adat = read_binary(entry, mmap=True)
+        except (OSError, ValueError, AdatBinaryReadError):
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        # Mark the entry as recently used
+        os.utime(os.path.join(entry, METADATA_FILENAME))
+        return adat
+
+    def put(self, key: str, adat: Adat) -> None:
+        """Stores `adat` under `key` and evicts entries beyond `max_bytes`."""
+        entry = os.path.join(self.directory, key)
+        temp_entry = tempfile.mkdtemp(dir=self.directory, prefix='.tmp-')
+        try:
+            write_binary(adat, temp_entry)
+            os.replace(temp_entry, entry)
+        except OSError:
+            # Another reader stored the same entry first
+            shutil.rmtree(temp_entry, ignore_errors=True)
+        self.evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for name in os.listdir(self.directory):
+            entry = os.path.join(self.directory, name)
+            if name.startswith('.') or not os.path.isdir(entry):
+                continue
+            try:
+                last_used = os.path.getmtime(os.path.join(entry, METADATA_FILENAME))
+                size = sum(
+                    os.path.getsize(os.path.join(entry, filename))
+                    for filename in os.listdir(entry)
+                )
+            except OSError:
+                continue
+            entries.append((last_used, size, entry))
+        return entries
+
+    def size(self) -> int:
+        """Returns the total size of the cache entries in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits in `max_bytes`."""
+        entries = sorted(self._entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total_size <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Removes every cache entry."""
+        for _, _, entry in self._entries():
+            shutil.rmtree(entry, ignore_errors=True)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import bz2
+import collections
+import gzip
+import io
+import lzma
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+
+COMPRESSION_MAGIC = {
+    b'\x1f\x8b': 'gzip',
+    b'BZh': 'bz2',
+    b'\xfd7zXZ\x00': 'xz',
+}
+
+COMPRESSION_OPENERS = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+
+COMPRESSION_FUNCTIONS = {
+    'gzip': lambda data: gzip.compress(data, mtime=0),
+    'bz2': bz2.compress,
+    'xz': lzma.compress,
+}
+
+# Uncompressed bytes per independently compressed block when compressing with multiple workers
+BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def infer_compression(path: str, sniff: bool = False) -> Optional[str]:
+    """Returns the compression ('gzip', 'bz2', 'xz') of a file from its extension.
+
+    If `sniff` and the extension is unknown, the first bytes of the file are checked
+    against the codecs' magic numbers. Returns None for uncompressed files.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in COMPRESSION_EXTENSIONS:
+        return COMPRESSION_EXTENSIONS[extension]
+
+    if sniff and os.path.isfile(path):
+        with open(path, 'rb') as f:
+            leading_bytes = f.read(max(len(magic) for magic in COMPRESSION_MAGIC))
+        for magic, compression in COMPRESSION_MAGIC.items():
+            if leading_bytes.startswith(magic):
+                return compression
+    return None
+
+
+class BlockCompressedWriter(io.RawIOBase):
+    """A binary stream that compresses fixed size blocks in a thread pool and writes them in order.
+
+    Each block is written as a complete gzip member/bz2 stream/xz stream, the concatenation
+    of which is a valid file for the stdlib (and command line) decompressors.
+    """
+
+    def __init__(
+        self,
+        fileobj: io.BufferedIOBase,
+        compress: Callable[[bytes], bytes],
+        workers: int,
+        block_size: int = BLOCK_SIZE,
+    ) -> None:
+        super().__init__()
+        self._fileobj = fileobj
+        self._compress = compress
+        self._block_size = block_size
+        self._max_pending = 2 * workers
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending = collections.deque()
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._buffer += b
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+        return len(b)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._executor.submit(self._compress, block))
+        # Bound the memory held by blocks waiting to be written
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer = bytearray()
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown()
+            self._fileobj.close()
+            super().close()
+
+
+def open_text(
+    path: str,
+    mode: str = 'r',
+    compression: Optional[str] = 'infer',
+    compression_workers: Optional[int] = None,
+    block_size: int = BLOCK_SIZE,
+) -> io.TextIOBase:
+    """Opens a (possibly compressed) adat file as a text stream.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+
+    mode : str
+        'r' to read, 'w' to write or 'a' to append.
+
+    compression : str, optional
+        'gzip', 'bz2', 'xz' or None. If 'infer' (default), the compression is inferred
+        from the file extension (and, when reading, the file's leading bytes).
+
+    compression_workers : int, optional
+        When writing compressed files, the number of threads compressing blocks of
+        the output in parallel. If None or 1, the file is compressed as a single stream.
+
+    block_size : int
+        The uncompressed size of each block compressed in parallel.
+
+    Returns
+    -------
+    f : io.TextIOBase
+    """
+    if compression == 'infer':
+        compression = infer_compression(path, sniff=mode == 'r')
+    if compression is not None and compression not in COMPRESSION_OPENERS:
+        raise ValueError(
+            f'Unknown compression "{compression}". Choose from: {", ".join(COMPRESSION_OPENERS)}.'
+        )
+
+    if mode == 'r':
+        if compression is None:
+            return open(path, 'r')
+        return COMPRESSION_OPENERS[compression](path, 'rt')
+
+    if compression is None:
+        return open(path, mode, newline='', encoding='utf-8')
+    if compression_workers is not None and compression_workers > 1:
+        raw = BlockCompressedWriter(
+            open(path, mode + 'b'),
+            COMPRESSION_FUNCTIONS[compression],
+            compression_workers,
+            block_size,
+        )
+        return io.TextIOWrapper(io.BufferedWriter(raw), newline='', encoding='utf-8')
+    return COMPRESSION_OPENERS[compression](
+        path, mode + 't', newline='', encoding='utf-8'
+    )
@@ -1,2 +1,6 @@
 class AdatReadError(Exception):
     pass
+
+
+class AdatWriteError(Exception):
+    pass
@@ -1,76 +1,170 @@
 from __future__ import annotations
 
+import collections
 import csv
+import functools
+import inspect
 import io
 import json
+import locale
 import logging
+import os
 import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from importlib.metadata import version
-from typing import Dict, List, Tuple, Union
-
-from somadata import Adat
-from somadata.io.adat.errors import AdatReadError
-from somadata.tools.math import jround
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
+import pandas as pd
 
-def parse_file(
-    f: Union[str, io.TextIOWrapper], compatibility_mode: bool = False
-) -> Tuple[
-    List[List[float]], Dict[str, List[str]], Dict[str, List[str]], Dict[str, str]
-]:
-    """Returns component pieces of an adat given an adat file object.
+from somadata import Adat
+from somadata.io.adat.cache import AdatCache
+from somadata.io.adat.compression import infer_compression, open_text
+from somadata.io.adat.errors import AdatReadError, AdatWriteError
+from somadata.feature_adat import FeatureAdat
+from somadata.lazy_adat import LazyAdat
+from somadata.tools.math import jround_array
+from somadata.tools.pandas import get_pd_axis
 
-    Parameters
-    ----------
-    f : Union[str, io.TextIOWrapper]
-        An open adat file object or path to an adat file.
-    compatibility_mode : bool
-        If True, the function will attempt to parse the file where header metadata values are strings.
+# Approximate number of RFU values formatted and written at a time by write_adat
+WRITE_CHUNK_CELLS = 1_000_000
 
-    Returns
-    -------
-    rfu_matrix : List[List[float]]
-        An nSample x nSomamer matrix of the RFU data (by row) where each sub-array corresponds to a sample.
+# Pools that write_adat can format chunks of samples in
+WRITE_EXECUTORS = {'process': ProcessPoolExecutor, 'thread': ThreadPoolExecutor}
 
-    row_metadata : Dict[str, List[str]]
-        A dictionary of each column of the row metadata where the key-value
-        pairs are column-name and an array of each sample's corresponding metadata
+# Bytes read at a time when scanning the TABLE section for record starts
+READ_BLOCK_SIZE = 16 * 1024 * 1024
 
-    column_metadata : Dict[str, List[str]]
-        A dictionary of each row of the adat column metadata where the key-value pairs are
-        row-name and an array of each somamer's corresponding metadata.
 
-    header_metadata : Dict[str, str]
-        A dictionary of each row of the header_metadata corresponds to a key-value pair.
-    """
+def _open_adat(
+    f: Union[str, io.TextIOWrapper], compression: Optional[str] = 'infer'
+) -> io.TextIOWrapper:
     if type(f) == str:
-        f = open(f, 'r')
+        return open_text(f, 'r', compression)
     elif not hasattr(f, 'read'):
         raise AdatReadError('File must be a string or file-like object.')
+    return f
+
 
+def _strip_trailing_cells(line: List[str]) -> List[str]:
+    # Check for trailing Nones
+    for index, cell in enumerate(reversed(line)):
+        if cell:
+            break
+        del line[-1]
+    return line
+
+
+def _parse_header_line(
+    line: List[str], header_metadata: Dict[str, str], compatibility_mode: bool
+) -> None:
+    # Not every key in the header has a value
+    if len(line) == 1:
+        header_metadata[line[0]] = ''
+    # Should be the typical case
+    elif len(line) == 2 and compatibility_mode:
+        header_metadata[line[0]] = line[1]
+    elif len(line) == 2 and not compatibility_mode:
+        try:
+            header_metadata[line[0]] = json.loads(line[1])
+            if type(header_metadata[line[0]]) != dict:
+                header_metadata[line[0]] = line[1]
+        except json.JSONDecodeError:
+            header_metadata[line[0]] = line[1]
+        # If we have the report config section, check to see if it was loaded as a dict
+        if line[0] == "ReportConfig" and type(header_metadata[line[0]]) != dict:
+            warnings.warn(
+                'Malformed ReportConfig section in header.  Setting to an empty dictionary.'
+            )
+            header_metadata[line[0]] = {}
+    # More than 2 values to a key should never ever happen
+    else:
+        raise AdatReadError('Unexpected size of header: ' + '|'.join(line))
+
+
+def _add_column_metadata(
+    line: List[str], column_metadata: Dict[str, List[str]], row_metadata_offset: int
+) -> None:
+    column_metadata_name = line[row_metadata_offset]
+    column_metadata_data = line[row_metadata_offset + 1 :]
+
+    if column_metadata_name == 'SeqId' and re.match(
+        r'\d{3,}-\d{1,3}_\d+', column_metadata_data[0]
+    ):
+        warnings.warn(
+            'V3 style seqIds (i.e., 12345-6_7). Converting to V4 Style. The adat file writer has an option to write using the V3 style'
+        )
+        seq_id_data = [x.split('_')[0] for x in column_metadata_data]
+        version_data = [x.split('_')[1] for x in column_metadata_data]
+        column_metadata[column_metadata_name] = seq_id_data
+        column_metadata['SeqIdVersion'] = version_data
+    else:
+        column_metadata[column_metadata_name] = column_metadata_data
+
+
+def _pad_column_metadata(column_metadata: Dict[str, List[str]], strict: bool) -> None:
+    # Ensure all column metadata is the same length and if not, raise or extend it to the maximum length
+    col_meta_lengths = [len(values) for values in column_metadata.values()]
+    if len(set(col_meta_lengths)) <= 1:
+        return
+
+    max_length = max(col_meta_lengths)
+    if strict:
+        short_names = [
+            name
+            for name, values in column_metadata.items()
+            if len(values) != max_length
+        ]
+        raise AdatReadError(
+            f'Column metadata has missing values: {", ".join(short_names)}'
+        )
+
+    for name, values in column_metadata.items():
+        if len(values) == max_length:
+            continue
+        warnings.warn(f'Adding empty values to column metadata: "{name}"')
+        n_missing_elements = max_length - len(values)
+        column_metadata[name] = values + [''] * n_missing_elements
+
+
+def _read_table_layout(
+    reader: Iterator[List[str]],
+    compatibility_mode: bool,
+    strict: bool = False,
+    header_only: bool = False,
+) -> Tuple[Dict[str, str], Dict[str, List[str]], List[str], int]:
+    """Parses an adat up to (and including) the row metadata names line of the TABLE section.
+
+    Returns the header metadata, the column metadata, the row metadata names and the
+    offset of the first RFU cell in each TABLE line.  The row metadata names are
+    `None` if the file does not contain a TABLE section.
+
+    The column metadata is validated once the column metadata block ends; ragged
+    column metadata raises an `AdatReadError` if `strict`, otherwise it is padded
+    with empty strings.
+
+    If `header_only`, parsing stops at the start of the TABLE section.
+    """
     current_section = None
 
     header_metadata = {}
     column_metadata = {}
-    row_metadata = {}
-    rfu_matrix = []
+    row_metadata_names = None
+    row_metadata_offset = None
 
     matrix_depth = 0
 
-    reader = csv.reader(f, delimiter='\t')
     for line in reader:
-        # Check for trailing Nones
-        for index, cell in enumerate(reversed(line)):
-            if cell:
-                break
-            del line[-1]
+        _strip_trailing_cells(line)
 
         # If we see a new section set which portion of the adat we are in & continue to next line
         if '^HEADER' in line[0]:
             current_section = 'HEADER'
             continue
         elif '^TABLE_BEGIN' in line[0]:
+            if header_only:
+                break
             current_section = 'TABLE'
             continue
         elif '^COL_DATA' in line[0]:
@@ -83,28 +177,7 @@ def parse_file(
         # Parse the data according to which section of the adat we're reading
 
         if current_section == 'HEADER':
-            # Not every key in the header has a value
-            if len(line) == 1:
-                header_metadata[line[0]] = ''
-            # Should be the typical case
-            elif len(line) == 2 and compatibility_mode:
-                header_metadata[line[0]] = line[1]
-            elif len(line) == 2 and not compatibility_mode:
-                try:
-                    header_metadata[line[0]] = json.loads(line[1])
-                    if type(header_metadata[line[0]]) != dict:
-                        header_metadata[line[0]] = line[1]
-                except json.JSONDecodeError:
-                    header_metadata[line[0]] = line[1]
-                # If we have the report config section, check to see if it was loaded as a dict
-                if line[0] == "ReportConfig" and type(header_metadata[line[0]]) != dict:
-                    warnings.warn(
-                        'Malformed ReportConfig section in header.  Setting to an empty dictionary.'
-                    )
-                    header_metadata[line[0]] = {}
-            # More than 2 values to a key should never ever happen
-            else:
-                raise AdatReadError('Unexpected size of header: ' + '|'.join(line))
+            _parse_header_line(line, header_metadata, compatibility_mode)
 
         elif current_section == 'COL_DATA':
             # Get the height of the column metadata section & skip the rest of the section
@@ -123,58 +196,492 @@ def parse_file(
 
             # Column Metadata Section
             if matrix_depth < col_metadata_length:
-                column_metadata_name = line[row_metadata_offset]
-                column_metadata_data = line[row_metadata_offset + 1 :]
-
-                if column_metadata_name == 'SeqId' and re.match(
-                    r'\d{3,}-\d{1,3}_\d+', column_metadata_data[0]
-                ):
-                    warnings.warn(
-                        'V3 style seqIds (i.e., 12345-6_7). Converting to V4 Style. The adat file writer has an option to write using the V3 style'
-                    )
-                    seq_id_data = [x.split('_')[0] for x in column_metadata_data]
-                    version_data = [x.split('_')[1] for x in column_metadata_data]
-                    column_metadata[column_metadata_name] = seq_id_data
-                    column_metadata['SeqIdVersion'] = version_data
-                else:
-                    column_metadata[column_metadata_name] = column_metadata_data
-
-            # Perform a check to ensure all column metadata is the same length and if not, extend it to the maximum length
-            col_meta_lengths = [len(values) for values in column_metadata.values()]
-            if len(set(col_meta_lengths)) > 1:
-                max_length = max(col_meta_lengths)
-                for name, values in column_metadata.items():
-                    if len(values) == max_length:
-                        continue
-                    warnings.warn(f'Adding empty values to column metadata: "{name}"')
-                    n_missing_elements = max_length - len(values)
-                    append_array = [''] * n_missing_elements
-                    new_values = values + append_array
-                    column_metadata[name] = new_values
-
-            # Row Metadata Titles
-            elif matrix_depth == col_metadata_length:
+                _add_column_metadata(line, column_metadata, row_metadata_offset)
+
+            # Row Metadata Titles, the rest of the file is the row metadata & RFU section
+            else:
                 row_metadata_names = line[:row_metadata_offset]
-                row_metadata = {name: [] for name in row_metadata_names}
-
-            # Row Metadata & RFU Section
-            elif matrix_depth > col_metadata_length:
-                # Store in row metadata into dictionary
-                row_metadata_data = line[:row_metadata_offset]
-                # Check for missing metadata and handle it
-                if len(row_metadata_data) < len(row_metadata_names):
-                    missing_count = len(row_metadata_names) - len(row_metadata_data)
-                    logging.warning(
-                        f"Row metadata has {missing_count} missing values. "
-                        f"Filling missing entries with empty strings."
-                    )
-                    row_metadata_data = list(row_metadata_data) + [""] * missing_count
-                for name, data in zip(row_metadata_names, row_metadata_data):
-                    row_metadata[name].append(data)
-                # Store the RFU data
-                rfu_row_data = line[row_metadata_offset + 1 :]
-                converted_rfu_row_data = list(map(float, rfu_row_data))
-                rfu_matrix.append(converted_rfu_row_data)
+                break
+
+    _pad_column_metadata(column_metadata, strict)
+
+    return header_metadata, column_metadata, row_metadata_names, row_metadata_offset
+
+
+def _fill_missing_row_metadata(
+    row_metadata_data: List[str], n_row_metadata: int
+) -> List[str]:
+    # Check for missing metadata and handle it
+    if len(row_metadata_data) < n_row_metadata:
+        missing_count = n_row_metadata - len(row_metadata_data)
+        logging.warning(
+            f"Row metadata has {missing_count} missing values. "
+            f"Filling missing entries with empty strings."
+        )
+        row_metadata_data = list(row_metadata_data) + [""] * missing_count
+    return row_metadata_data
+
+
+def _parse_rows_python(
+    reader: Iterator[List[str]],
+    row_metadata_names: List[str],
+    row_metadata_offset: int,
+    usecols: Optional[List[int]] = None,
+    row_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+) -> Tuple[List[List[float]], Dict[str, List[str]]]:
+    row_metadata = {name: [] for name in row_metadata_names}
+    rfu_matrix = []
+
+    for line in reader:
+        _strip_trailing_cells(line)
+        if not line:
+            continue
+
+        # Store in row metadata into dictionary
+        row_metadata_data = _fill_missing_row_metadata(
+            line[:row_metadata_offset], len(row_metadata_names)
+        )
+        if row_filter is not None and not row_filter(
+            dict(zip(row_metadata_names, row_metadata_data))
+        ):
+            continue
+        for name, data in zip(row_metadata_names, row_metadata_data):
+            row_metadata[name].append(data)
+        # Store the RFU data
+        rfu_row_data = line[row_metadata_offset + 1 :]
+        if usecols is not None:
+            rfu_row_data = [rfu_row_data[i] for i in usecols if i < len(rfu_row_data)]
+        converted_rfu_row_data = list(map(float, rfu_row_data))
+        rfu_matrix.append(converted_rfu_row_data)
+
+    return rfu_matrix, row_metadata
+
+
+def _iter_table_records(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the TABLE records of the lines, joining the lines of quoted cells that contain line breaks."""
+    lines = iter(lines)
+    for line in lines:
+        if '"' in line:
+            # A quoted cell may span several lines, the csv module reads exactly the lines of one record
+            record = [line]
+
+            def record_lines() -> Iterator[str]:
+                yield line
+                for next_line in lines:
+                    record.append(next_line)
+                    yield next_line
+
+            next(csv.reader(record_lines(), delimiter='\t'), None)
+            line = ''.join(record)
+        yield line
+
+
+def _split_table_line(line: str, row_metadata_offset: int) -> Tuple[List[str], str]:
+    """Splits a raw TABLE line into its row metadata cells and the unparsed RFU text."""
+    line = line.rstrip('\r\n').rstrip('\t')
+    # Quoted cells only ever occur in the row metadata, let the csv module unescape them
+    if '"' in line:
+        cells = next(csv.reader([line], delimiter='\t'))
+        return cells[:row_metadata_offset], '\t'.join(cells[row_metadata_offset + 1 :])
+
+    cells = line.split('\t', row_metadata_offset + 1)
+    if len(cells) > row_metadata_offset + 1:
+        return cells[:row_metadata_offset], cells[-1]
+    return cells[:row_metadata_offset], ''
+
+
+def _convert_rfu_lines(
+    rfu_lines: List[str],
+    n_columns: int,
+    dtype: Union[str, np.dtype] = np.float64,
+    usecols: Optional[List[int]] = None,
+) -> np.ndarray:
+    """Converts tab delimited RFU text (one line per sample) into an nSample x nSomamer array.
+
+    Uses the NumPy C text parser, whose values are identical to `float`. Short rows are padded with NaN.
+    Only the `usecols` positions are converted (and returned) if provided.
+    """
+    if not rfu_lines:
+        n_returned = n_columns if usecols is None else len(usecols)
+        return np.empty((0, n_returned), dtype=dtype)
+
+    padded_lines = []
+    for rfu_line in rfu_lines:
+        n_cells = rfu_line.count('\t') + 1 if rfu_line else 0
+        if n_cells < n_columns:
+            missing_cells = ['nan'] * (n_columns - n_cells)
+            rfu_line = '\t'.join(([rfu_line] if rfu_line else []) + missing_cells)
+        padded_lines.append(rfu_line)
+
+    try:
+        return np.loadtxt(
+            padded_lines,
+            delimiter='\t',
+            dtype=dtype,
+            comments=None,
+            usecols=usecols,
+            ndmin=2,
+        )
+    except ValueError as e:
+        raise AdatReadError(f'Unable to parse RFU values: {e}') from e
+
+
+def _split_table_lines(
+    lines: Iterable[str],
+    row_metadata_names: List[str],
+    row_metadata_offset: int,
+    keep_rfu: bool = True,
+    row_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Returns the row metadata and the unparsed RFU text of each (non-empty) TABLE line.
+
+    The RFU text is discarded (and an empty list returned) if not `keep_rfu`.
+    Lines whose row metadata `row_filter` returns False for are skipped.
+    """
+    row_metadata_rows = []
+    rfu_lines = []
+
+    for line in _iter_table_records(lines):
+        if not line.rstrip('\r\n\t'):
+            continue
+        row_metadata_data, rfu_line = _split_table_line(line, row_metadata_offset)
+        row_metadata_data = _fill_missing_row_metadata(
+            row_metadata_data, len(row_metadata_names)
+        )
+        if row_filter is not None and not row_filter(
+            dict(zip(row_metadata_names, row_metadata_data))
+        ):
+            continue
+        row_metadata_rows.append(row_metadata_data)
+        if keep_rfu:
+            rfu_lines.append(rfu_line)
+
+    row_metadata = {name: [] for name in row_metadata_names}
+    for name, data in zip(row_metadata_names, zip(*row_metadata_rows)):
+        row_metadata[name] = list(data)
+
+    return row_metadata, rfu_lines
+
+
+def _parse_rows_fast(
+    lines: Iterator[str],
+    row_metadata_names: List[str],
+    row_metadata_offset: int,
+    n_columns: int,
+    usecols: Optional[List[int]] = None,
+    row_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    dtype: Union[str, np.dtype] = np.float64,
+) -> Tuple[np.ndarray, Dict[str, List[str]]]:
+    row_metadata, rfu_lines = _split_table_lines(
+        lines, row_metadata_names, row_metadata_offset, row_filter=row_filter
+    )
+    rfu_matrix = _convert_rfu_lines(rfu_lines, n_columns, dtype=dtype, usecols=usecols)
+    return rfu_matrix, row_metadata
+
+
+def _project_columns(
+    column_metadata: Dict[str, List[str]],
+    seq_ids: Optional[Iterable[str]] = None,
+    column_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    row_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+) -> Tuple[Dict[str, List[str]], Optional[List[int]]]:
+    """Returns the column metadata of the selected columns and their positions in the RFU block.
+
+    The positions are `None` if no selection is requested.
+    """
+    if seq_ids is None and column_filter is None:
+        return column_metadata, None
+
+    names = list(column_metadata.keys())
+    n_columns = max([len(values) for values in column_metadata.values()], default=0)
+    keep = [True] * n_columns
+
+    if seq_ids is not None:
+        if 'SeqId' not in column_metadata:
+            raise AdatReadError('SeqId not found in column metadata.')
+        seq_ids = set(seq_ids)
+        if not seq_ids.issubset(column_metadata['SeqId']):
+            raise KeyError('Some or all provided SeqIds not found in column metadata.')
+        keep = [seq_id in seq_ids for seq_id in column_metadata['SeqId']]
+
+    if column_filter is not None:
+        for i, values in enumerate(zip(*column_metadata.values())):
+            keep[i] = keep[i] and bool(column_filter(dict(zip(names, values))))
+
+    usecols = [i for i, kept in enumerate(keep) if kept]
+    projected_column_metadata = {
+        name: [values[i] for i in usecols] for name, values in column_metadata.items()
+    }
+    return projected_column_metadata, usecols
+
+
+def _iter_line_batches(lines: Iterator[str], batch_size: int) -> Iterator[List[str]]:
+    batch = []
+    for line in _iter_table_records(lines):
+        if not line.rstrip('\r\n\t'):
+            continue
+        batch.append(line)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _record_aligned_ranges(
+    fb: io.BufferedReader, start: int, end: int, n_ranges: int
+) -> List[Tuple[int, int]]:
+    """Splits the bytes [start, end) of a file into (at most) `n_ranges` ranges that begin at TABLE record starts.
+
+    `start` must be a record start. A line starts a record if the quotes before it are balanced,
+    as a quoted cell (which may contain line breaks) always holds an even number of quotes.
+    The quotes are counted in a single pass over the range.
+    """
+    boundaries = [start]
+    fb.seek(start)
+    position = start
+    n_quotes = 0
+    at_line_start = True
+    for i in range(1, n_ranges):
+        target = start + (end - start) * i // n_ranges
+        while position < target:
+            block = fb.read(min(READ_BLOCK_SIZE, target - position))
+            if not block:
+                break
+            n_quotes += block.count(b'"')
+            position += len(block)
+            at_line_start = block.endswith(b'\n')
+
+        # Move to the beginning of the next line outside of a quoted cell (or stay if already at one)
+        while (not at_line_start or n_quotes % 2) and position < end:
+            line = fb.readline()
+            if not line:
+                break
+            n_quotes += line.count(b'"')
+            position += len(line)
+            at_line_start = True
+        if boundaries[-1] < position < end:
+            boundaries.append(position)
+    boundaries.append(end)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _parse_byte_range(
+    path: str,
+    start: int,
+    end: int,
+    encoding: str,
+    row_metadata_names: List[str],
+    row_metadata_offset: int,
+    n_columns: int,
+    usecols: Optional[List[int]],
+    row_filter: Optional[Callable[[Dict[str, str]], bool]],
+    dtype: Union[str, np.dtype],
+) -> Tuple[np.ndarray, Dict[str, List[str]]]:
+    with open(path, 'rb') as fb:
+        fb.seek(start)
+        text = fb.read(end - start).decode(encoding)
+    # Universal newlines, as the lines of a file opened by `open(path, 'r')`
+    lines = io.StringIO(text, newline=None)
+    return _parse_rows_fast(
+        lines,
+        row_metadata_names,
+        row_metadata_offset,
+        n_columns,
+        usecols,
+        row_filter,
+        dtype,
+    )
+
+
+def _parse_file_parallel(
+    path: str,
+    workers: int,
+    compatibility_mode: bool,
+    strict: bool,
+    seq_ids: Optional[Iterable[str]],
+    column_filter: Optional[Callable[[Dict[str, str]], bool]],
+    row_filter: Optional[Callable[[Dict[str, str]], bool]],
+    dtype: Union[str, np.dtype],
+) -> Tuple[np.ndarray, Dict[str, List[str]], Dict[str, List[str]], Dict[str, str]]:
+    """Parses the TABLE section of an adat file in record aligned byte ranges in a process pool."""
+    # The encoding `open(path, 'r')` reads with, so both paths return the same metadata
+    encoding = locale.getpreferredencoding(False)
+    with open(path, 'rb') as fb:
+        n_bytes_read = 0
+
+        def decoded_lines() -> Iterator[str]:
+            nonlocal n_bytes_read
+            for raw_line in fb:
+                n_bytes_read += len(raw_line)
+                yield raw_line.decode(encoding)
+
+        reader = csv.reader(decoded_lines(), delimiter='\t')
+        (
+            header_metadata,
+            column_metadata,
+            row_metadata_names,
+            row_metadata_offset,
+        ) = _read_table_layout(reader, compatibility_mode, strict)
+        if row_metadata_names is None:
+            return [], {}, column_metadata, header_metadata
+
+        n_columns = max([len(values) for values in column_metadata.values()])
+        column_metadata, usecols = _project_columns(
+            column_metadata, seq_ids, column_filter
+        )
+        # Use a few ranges per worker to even out the load
+        byte_ranges = _record_aligned_ranges(
+            fb, n_bytes_read, os.fstat(fb.fileno()).st_size, 4 * workers
+        )
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _parse_byte_range,
+                path,
+                start,
+                end,
+                encoding,
+                row_metadata_names,
+                row_metadata_offset,
+                n_columns,
+                usecols,
+                row_filter,
+                dtype,
+            )
+            for start, end in byte_ranges
+        ]
+        results = [future.result() for future in futures]
+
+    n_returned = n_columns if usecols is None else len(usecols)
+    rfu_matrix = np.concatenate(
+        [np.empty((0, n_returned), dtype=dtype)] + [result[0] for result in results]
+    )
+    row_metadata = {
+        name: [value for result in results for value in result[1][name]]
+        for name in row_metadata_names
+    }
+    return rfu_matrix, row_metadata, column_metadata, header_metadata
+
+
+def parse_file(
+    f: Union[str, io.TextIOWrapper],
+    compatibility_mode: bool = False,
+    engine: str = 'fast',
+    strict: bool = False,
+    seq_ids: Optional[Iterable[str]] = None,
+    column_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    row_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    dtype: Union[str, np.dtype] = np.float64,
+    compression: Optional[str] = 'infer',
+    workers: Optional[int] = None,
+) -> Tuple[
+    Union[List[List[float]], np.ndarray],
+    Dict[str, List[str]],
+    Dict[str, List[str]],
+    Dict[str, str],
+]:
+    """Returns component pieces of an adat given an adat file object.
+
+    Parameters
+    ----------
+    f : Union[str, io.TextIOWrapper]
+        An open adat file object or path to an adat file.
+    compatibility_mode : bool
+        If True, the function will attempt to parse the file where header metadata values are strings.
+    engine : str
+        The parser used for the row metadata & RFU section of the file.
+        'fast' (default) hands the RFU block to numpy's C parser (`np.loadtxt`) and returns a float64 ndarray,
+        'python' parses the file line by line with the csv module and returns a list of lists.
+        Both engines produce identical values.
+    strict : bool
+        If True, raises an AdatReadError when the column metadata rows differ in length,
+        otherwise (default) short rows are padded with empty strings.
+    seq_ids : Iterable[str], optional
+        Only the RFU columns of these SeqIds are converted and returned.
+    column_filter : Callable[[Dict[str, str]], bool], optional
+        Called with each column's metadata (name to value), only the RFU columns
+        it returns True for are converted and returned. Combined with `seq_ids` if both are given.
+    row_filter : Callable[[Dict[str, str]], bool], optional
+        Called with each sample's row metadata (name to value) before its RFU values are converted,
+        only the samples it returns True for are kept.
+    dtype : str | np.dtype
+        The dtype the 'fast' engine converts the RFU values to. (Default = float64)
+        Values are parsed straight into this dtype, e.g., float32 halves the memory of the RFU matrix.
+    compression : str, optional
+        The compression of the file at path `f`: 'gzip', 'bz2', 'xz' or None. If 'infer' (default),
+        it is detected from the file extension or the file's leading bytes. Files are decompressed while streaming.
+    workers : int, optional
+        If greater than 1, the row metadata & RFU section of an uncompressed adat file path is split into
+        record aligned byte ranges that are parsed in a pool of `workers` processes with the 'fast' engine.
+        Callables (e.g., `row_filter`) must then be picklable.
+
+    Returns
+    -------
+    rfu_matrix : List[List[float]] | np.ndarray
+        An nSample x nSomamer matrix of the RFU data (by row) where each sub-array corresponds to a sample.
+
+    row_metadata : Dict[str, List[str]]
+        A dictionary of each column of the row metadata where the key-value
+        pairs are column-name and an array of each sample's corresponding metadata
+
+    column_metadata : Dict[str, List[str]]
+        A dictionary of each row of the adat column metadata where the key-value pairs are
+        row-name and an array of each somamer's corresponding metadata.
+
+    header_metadata : Dict[str, str]
+        A dictionary of each row of the header_metadata corresponds to a key-value pair.
+    """
+    if engine not in ('fast', 'python'):
+        raise ValueError(f'Unknown engine "{engine}". Choose "fast" or "python".')
+
+    if workers is not None and workers > 1:
+        is_compressed = compression is not None and (
+            compression != 'infer' or infer_compression(f, sniff=True) is not None
+        )
+        if engine != 'fast' or type(f) != str or is_compressed:
+            raise ValueError(
+                '"workers" requires the "fast" engine and an uncompressed adat file path.'
+            )
+        return _parse_file_parallel(
+            f,
+            workers,
+            compatibility_mode,
+            strict,
+            seq_ids,
+            column_filter,
+            row_filter,
+            dtype,
+        )
+
+    f = _open_adat(f, compression)
+    reader = csv.reader(f, delimiter='\t')
+    (
+        header_metadata,
+        column_metadata,
+        row_metadata_names,
+        row_metadata_offset,
+    ) = _read_table_layout(reader, compatibility_mode, strict)
+    n_columns = max([len(values) for values in column_metadata.values()], default=0)
+    column_metadata, usecols = _project_columns(column_metadata, seq_ids, column_filter)
+
+    if row_metadata_names is None:
+        rfu_matrix, row_metadata = [], {}
+    elif engine == 'python':
+        rfu_matrix, row_metadata = _parse_rows_python(
+            reader, row_metadata_names, row_metadata_offset, usecols, row_filter
+        )
+    else:
+        rfu_matrix, row_metadata = _parse_rows_fast(
+            f,
+            row_metadata_names,
+            row_metadata_offset,
+            n_columns,
+            usecols,
+            row_filter,
+            dtype,
+        )
 
     f.close()
     return rfu_matrix, row_metadata, column_metadata, header_metadata
@@ -191,7 +698,34 @@ def read_file(filepath: str) -> Adat:
     return read_adat(filepath)
 
 
-def read_adat(path_or_buf: Union[str, io.TextIOWrapper], *args, **kwargs) -> Adat:
+def _read_adat_cached(
+    path: str, cache: Union[str, AdatCache], *args, **kwargs
+) -> Optional[Adat]:
+    if not isinstance(cache, AdatCache):
+        cache = AdatCache(cache)
+
+    options = inspect.signature(parse_file).bind(path, *args, **kwargs)
+    options.apply_defaults()
+    key = cache.entry_key(path, options.arguments)
+    if key is None:
+        return None
+
+    adat = cache.get(key)
+    if adat is None:
+        adat = Adat.from_features(*parse_file(path, *args, **kwargs))
+        cache.put(key, adat)
+    return adat
+
+
+def read_adat(
+    path_or_buf: Union[str, io.TextIOWrapper],
+    *args,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    cache: Optional[Union[str, AdatCache]] = None,
+    lazy: bool = False,
+    feature_table: bool = False,
+    **kwargs,
+) -> Union[Adat, FeatureAdat, LazyAdat]:
     """Returns an Adat from the filepath/name.
 
     Parameters
@@ -199,61 +733,410 @@ def read_adat(path_or_buf: Union[str, io.TextIOWrapper], *args, **kwargs) -> Ada
     path_or_buf : Union[str, io.TextIOWrapper]
         Path or buffer that the file will be read from
 
+    dtype : str | np.dtype, optional
+        The dtype of the Adat's RFU values, e.g., 'float32'. (Default = float64)
+
+    cache : str | AdatCache, optional
+        An AdatCache (or its directory) that parsed files are stored in and served from.
+        Cached RFU matrices are memory-mapped. Reads with `column_filter`/`row_filter` bypass the cache.
+
+    lazy : bool
+        If True, only the metadata of the adat file path is read and a LazyAdat is returned,
+        which reads the (selected) RFU values the first time they are used.
+
+    feature_table : bool
+        If True, a FeatureAdat is returned, whose columns are the SeqIds and whose column
+        metadata is held in its `feature_table`. Cannot be combined with `lazy`.
+
+    *args, **kwargs
+        Passed on to `parse_file` (e.g., `compatibility_mode`, `engine`, `strict`,
+        `seq_ids`, `column_filter`, `row_filter` and `compression`).
+
     Examples
     --------
     >>> adat = Adat.from_file('path/to/file.adat')
+    >>> adat = somadata.read_adat('path/to/file.adat', seq_ids=['10000-28', '10001-7'])
+    >>> adat = somadata.read_adat('path/to/file.adat', column_filter=lambda meta: meta['Type'] == 'Protein')
+    >>> adat = somadata.read_adat('path/to/file.adat', row_filter=lambda meta: meta['SampleType'] == 'Sample')
+    >>> adat = somadata.read_adat('path/to/file.adat', dtype='float32')
+    >>> adat = somadata.read_adat('path/to/file.adat.gz')
+    >>> adat = somadata.read_adat('path/to/file.adat', cache='path/to/cache')
+    >>> adat = somadata.read_adat('path/to/file.adat', lazy=True)
+    >>> adat = somadata.read_adat('path/to/file.adat', feature_table=True)
 
     Returns
     -------
-    adat : Adat
+    adat : Adat | FeatureAdat | LazyAdat
     """
+    if dtype is not None:
+        kwargs['dtype'] = dtype
+    if lazy and feature_table:
+        raise ValueError('"lazy" and "feature_table" cannot be combined.')
+    if lazy:
+        if type(path_or_buf) != str:
+            raise ValueError('"lazy" requires an adat file path.')
+        options = inspect.signature(parse_file).bind(path_or_buf, *args, **kwargs)
+        options.apply_defaults()
+        row_metadata, column_metadata, header_metadata = read_adat_metadata(
+            path_or_buf,
+            **{
+                name: options.arguments[name]
+                for name in (
+                    'compatibility_mode',
+                    'strict',
+                    'seq_ids',
+                    'column_filter',
+                    'row_filter',
+                    'compression',
+                )
+            },
+        )
+        loader = functools.partial(read_adat, path_or_buf, *args, cache=cache, **kwargs)
+        return LazyAdat(loader, row_metadata, column_metadata, header_metadata)
+    if cache is not None and type(path_or_buf) == str:
+        adat = _read_adat_cached(path_or_buf, cache, *args, **kwargs)
+        if adat is not None:
+            return FeatureAdat.from_adat(adat) if feature_table else adat
+
     rfu_matrix, row_metadata, column_metadata, header_metadata = parse_file(
         path_or_buf, *args, **kwargs
     )
 
-    return Adat.from_features(
+    adat_class = FeatureAdat if feature_table else Adat
+    return adat_class.from_features(
         rfu_matrix=rfu_matrix,
         row_metadata=row_metadata,
         column_metadata=column_metadata,
         header_metadata=header_metadata,
+        dtype=dtype,
     )
 
 
-def write_adat(
-    adat,
-    f: io.TextIOWrapper,
-    round_rfu: bool = True,
-    convert_to_v3_seq_ids: bool = False,
-) -> None:
-    """Write this Adat to an adat format data source.
+def read_adats(
+    paths: List[str],
+    workers: Optional[int] = None,
+    executor: str = 'process',
+    errors: str = 'raise',
+    **kwargs,
+) -> List[Union[Adat, Exception]]:
+    """Returns a list of Adats, in the order of `paths`, read concurrently.
 
     Parameters
     ----------
-    adat : Adat
-        Adat Pandas dataframe to be written.
+    paths : List[str]
+        The adat file paths to read.
 
-    path : str
-        The file path to write to.
+    workers : int, optional
+        The maximum number of files read at the same time. Defaults to the number of processors.
 
-    round_rfu : bool
-        Rounds the RFU matrix to one decimal place if True,
-        otherwise leaves the matrix as-is. (Default = True)
+    executor : str
+        'process' (default) reads each file in a separate process so parsing scales with cores,
+        'thread' reads them in threads of this process.
 
-    convert_to_v3_seq_ids : bool
-        Combines the column metadata for SeqId and
-        SeqIdVersion to the V3 style (12345-6_7)
+    errors : str
+        'raise' (default) raises an AdatReadError listing every file that could not be read,
+        once all files have been attempted. 'return' puts the exception raised while reading
+        a file in its place in the returned list instead.
+
+    **kwargs
+        Passed on to `read_adat` for every file. Callables (e.g., `row_filter`) must be
+        picklable to be used with the 'process' executor.
 
     Examples
     --------
-    >>> import somadata as sd
-    >>> adat = sd.read_adat('path/to/file.adat')
-    >>> sd.write_adat(adat, 'path/to/out/filename.adat')
-    >>> sd.write_adat(adat, 'path/to/out/filename.adat', round_rfu=False)
+    >>> adats = somadata.read_adats(['plate1.adat', 'plate2.adat'], workers=4)
+    >>> results = somadata.read_adats(paths, executor='thread', errors='return')
+    >>> failures = {path: result for path, result in zip(paths, results) if isinstance(result, Exception)}
 
     Returns
     -------
-    None
+    adats : List[Adat | Exception]
+    """
+    executors = {'process': ProcessPoolExecutor, 'thread': ThreadPoolExecutor}
+    if executor not in executors:
+        raise ValueError(
+            f'Unknown executor "{executor}". Choose "process" or "thread".'
+        )
+    if errors not in ('raise', 'return'):
+        raise ValueError(f'Unknown errors "{errors}". Choose "raise" or "return".')
+
+    results = []
+    with executors[executor](max_workers=workers) as pool:
+        futures = [pool.submit(read_adat, path, **kwargs) for path in paths]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+
+    failures = [
+        f'{path}: {result!r}'
+        for path, result in zip(paths, results)
+        if isinstance(result, Exception)
+    ]
+    if failures and errors == 'raise':
+        raise AdatReadError('Unable to read adats:\n' + '\n'.join(failures))
+
+    return results
+
+
+def read_adat_header(
+    path_or_buf: Union[str, io.TextIOWrapper], compatibility_mode: bool = False
+) -> Dict[str, str]:
+    """Returns the header metadata of an adat without reading the TABLE section.
+
+    Parsing stops at `^TABLE_BEGIN`, making this cheap enough to scan large numbers of files.
+
+    Parameters
+    ----------
+    path_or_buf : Union[str, io.TextIOWrapper]
+        Path or buffer that the file will be read from
+
+    compatibility_mode : bool
+        If True, the function will attempt to parse the file where header metadata values are strings.
+
+    Examples
+    --------
+    >>> header_metadata = somadata.read_adat_header('path/to/file.adat')
+    >>> header_metadata['!AssayVersion']
+    'V4'
+
+    Returns
+    -------
+    header_metadata : Dict[str, str]
+    """
+    f = _open_adat(path_or_buf)
+    try:
+        reader = csv.reader(f, delimiter='\t')
+        header_metadata, _, _, _ = _read_table_layout(
+            reader, compatibility_mode, header_only=True
+        )
+    finally:
+        f.close()
+    return header_metadata
+
+
+def read_adat_metadata(
+    path_or_buf: Union[str, io.TextIOWrapper],
+    compatibility_mode: bool = False,
+    strict: bool = False,
+    seq_ids: Optional[Iterable[str]] = None,
+    column_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    row_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    compression: Optional[str] = 'infer',
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], Dict[str, str]]:
+    """Returns the row, column and header metadata of an adat without converting the RFU values.
+
+    Parameters
+    ----------
+    path_or_buf : Union[str, io.TextIOWrapper]
+        Path or buffer that the file will be read from
+
+    compatibility_mode : bool
+        If True, the function will attempt to parse the file where header metadata values are strings.
+
+    strict : bool
+        If True, raises an AdatReadError when the column metadata rows differ in length.
+
+    seq_ids, column_filter, row_filter, compression
+        Select the columns & samples whose metadata is returned, and the file's compression,
+        as in `parse_file`.
+
+    Examples
+    --------
+    >>> row_metadata, column_metadata, header_metadata = somadata.read_adat_metadata('path/to/file.adat')
+
+    Returns
+    -------
+    row_metadata : Dict[str, List[str]]
+        A dictionary of each column of the row metadata where the key-value
+        pairs are column-name and an array of each sample's corresponding metadata
+
+    column_metadata : Dict[str, List[str]]
+        A dictionary of each row of the adat column metadata where the key-value pairs are
+        row-name and an array of each somamer's corresponding metadata.
+
+    header_metadata : Dict[str, str]
+        A dictionary of each row of the header_metadata corresponds to a key-value pair.
     """
+    f = _open_adat(path_or_buf, compression)
+    try:
+        reader = csv.reader(f, delimiter='\t')
+        (
+            header_metadata,
+            column_metadata,
+            row_metadata_names,
+            row_metadata_offset,
+        ) = _read_table_layout(reader, compatibility_mode, strict)
+        column_metadata, _ = _project_columns(column_metadata, seq_ids, column_filter)
+        if row_metadata_names is None:
+            row_metadata = {}
+        else:
+            row_metadata, _ = _split_table_lines(
+                f,
+                row_metadata_names,
+                row_metadata_offset,
+                keep_rfu=False,
+                row_filter=row_filter,
+            )
+    finally:
+        f.close()
+    return row_metadata, column_metadata, header_metadata
+
+
+def read_adat_chunks(
+    path_or_buf: Union[str, io.TextIOWrapper],
+    chunk_size: int = 1000,
+    compatibility_mode: bool = False,
+    strict: bool = False,
+    seq_ids: Optional[Iterable[str]] = None,
+    column_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    row_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    dtype: Union[str, np.dtype] = np.float64,
+) -> Iterator[Adat]:
+    """Yields Adats of (at most) `chunk_size` samples from the filepath/name.
+
+    The header and column metadata are parsed once and shared by every chunk
+    (the chunks' `columns` and `header_metadata` are the same objects), so only
+    `chunk_size` samples are held in memory at a time.
+
+    Parameters
+    ----------
+    path_or_buf : Union[str, io.TextIOWrapper]
+        Path or buffer that the file will be read from
+
+    chunk_size : int
+        The number of samples in each yielded Adat. (Default = 1000)
+
+    compatibility_mode : bool
+        If True, the function will attempt to parse the file where header metadata values are strings.
+
+    strict : bool
+        If True, raises an AdatReadError when the column metadata rows differ in length.
+
+    seq_ids : Iterable[str], optional
+        Only the RFU columns of these SeqIds are converted and returned.
+
+    column_filter : Callable[[Dict[str, str]], bool], optional
+        Called with each column's metadata (name to value), only the RFU columns
+        it returns True for are converted and returned.
+
+    row_filter : Callable[[Dict[str, str]], bool], optional
+        Called with each sample's row metadata (name to value), only the samples it
+        returns True for are converted and returned. Chunks may then hold fewer than
+        `chunk_size` samples.
+
+    dtype : str | np.dtype
+        The dtype of the chunks' RFU values. (Default = float64)
+
+    Examples
+    --------
+    >>> for adat in somadata.read_adat_chunks('path/to/file.adat', chunk_size=500):
+    ...     adat.pick_on_meta(axis=0, name='SampleType', values=['Sample']).to_adat(...)
+
+    Yields
+    ------
+    adat : Adat
+    """
+    if chunk_size < 1:
+        raise ValueError('"chunk_size" must be a positive integer.')
+
+    f = _open_adat(path_or_buf)
+    try:
+        reader = csv.reader(f, delimiter='\t')
+        (
+            header_metadata,
+            column_metadata,
+            row_metadata_names,
+            row_metadata_offset,
+        ) = _read_table_layout(reader, compatibility_mode, strict)
+        if row_metadata_names is None:
+            return
+
+        n_columns = max([len(values) for values in column_metadata.values()])
+        column_metadata, usecols = _project_columns(
+            column_metadata, seq_ids, column_filter
+        )
+        columns = pd.MultiIndex.from_arrays(
+            list(column_metadata.values()), names=list(column_metadata.keys())
+        )
+        for lines in _iter_line_batches(f, chunk_size):
+            rfu_matrix, row_metadata = _parse_rows_fast(
+                lines,
+                row_metadata_names,
+                row_metadata_offset,
+                n_columns,
+                usecols,
+                row_filter,
+                dtype,
+            )
+            if not len(rfu_matrix):
+                continue
+            index = pd.MultiIndex.from_arrays(
+                list(row_metadata.values()), names=list(row_metadata.keys())
+            )
+            yield Adat(
+                data=rfu_matrix,
+                index=index,
+                columns=columns,
+                header_metadata=header_metadata,
+                copy=False,
+            )
+    finally:
+        f.close()
+
+
+def _cell_text(value) -> str:
+    """Returns the text `csv.writer` writes for a cell, before quoting."""
+    if value is None:
+        return ''
+    return float.__repr__(value) if isinstance(value, float) else str(value)
+
+
+def _format_cell(value) -> str:
+    """Returns a TABLE cell as `csv.writer` (tab delimited, minimal quoting) writes it."""
+    text = _cell_text(value)
+    if any(character in text for character in '\t"\r\n'):
+        text = '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _format_rfu_rows(rfu_matrix: np.ndarray) -> List[str]:
+    """Returns each row of the RFU matrix as tab separated text, formatted like `csv.writer`."""
+    if rfu_matrix.dtype == np.float64:
+        # csv.writer writes floats with repr. For the closest float to a value with one decimal
+        # (e.g., a rounded RFU) below 1e14, '%.1f' prints the same digits and a whole row is
+        # formatted in a single call, the other rows fall back to repr.
+        with np.errstate(all='ignore'):
+            one_decimal = (np.abs(rfu_matrix) < 1e14) & (
+                np.rint(rfu_matrix * 10) / 10 == rfu_matrix
+            )
+        row_format = '\t'.join(['%.1f'] * rfu_matrix.shape[1])
+        return [
+            (
+                row_format % tuple(row)
+                if is_one_decimal
+                else '\t'.join(map(float.__repr__, row))
+            )
+            for row, is_one_decimal in zip(
+                rfu_matrix.tolist(), one_decimal.all(axis=1).tolist()
+            )
+        ]
+    return ['\t'.join(map(_format_cell, row)) for row in rfu_matrix]
+
+
+def _write_adat_preamble(
+    adat,
+    f: io.TextIOWrapper,
+    convert_to_v3_seq_ids: bool,
+    columns: Optional[pd.MultiIndex] = None,
+) -> None:
+    """Writes everything up to and including the row metadata titles of the TABLE section.
+
+    The column metadata written is `columns` if given, otherwise the Adat's.
+    """
+    if columns is None:
+        columns = get_pd_axis(adat, 1)
 
     # Add version number to header_metadata.  If the field already exists, append to it.
     pkg_version = 'SomaData_' + version('somadata')
@@ -263,7 +1146,7 @@ def write_adat(
         adat.header_metadata['!GeneratedBy'] += ', ' + pkg_version
 
     # Create COL_DATA & ROW_DATA sections
-    column_names = adat.columns.names
+    column_names = columns.names
     column_types = ['String' for name in column_names]
 
     row_names = adat.index.names
@@ -301,11 +1184,11 @@ def write_adat(
     column_offset = [None for i in range(len(row_names))]
     for column_name in column_names:
         # Prep the data
-        column_data = adat.columns.get_level_values(column_name)
+        column_data = columns.get_level_values(column_name)
 
         # Check if we are converting to the V3 style of adat seqIds
         if column_name == 'SeqId' and convert_to_v3_seq_ids:
-            version_data = adat.columns.get_level_values('SeqIdVersion')
+            version_data = columns.get_level_values('SeqIdVersion')
             column_data = [
                 seq_id + '_' + version
                 for seq_id, version in zip(column_data, version_data)
@@ -321,23 +1204,391 @@ def write_adat(
         writer.writerow(row)
 
     # Write the row metadata column titles.  Additional tabs added to conform to PX adat structure.
-    extra_nones = len(adat.columns.get_level_values(column_names[0])) + 1
+    extra_nones = len(columns.get_level_values(column_names[0])) + 1
     writer.writerow(row_names + [None for x in range(extra_nones)])
 
-    # Write the row metadata and rfu matrix simultaneously
-    for i, rfu_row in enumerate(adat.values):
-        # Prep the data
-        row_metadata = [
-            adat.index.get_level_values(row_name)[i] for row_name in row_names
-        ]
-        if round_rfu:
-            rfu_row = [jround(rfu, 1) for rfu in rfu_row]
+
+def _format_table_chunk(
+    row_prefixes: List[str], rfu_chunk: np.ndarray, round_rfu: bool
+) -> str:
+    """Returns the TABLE lines of a chunk of samples given their formatted row metadata."""
+    if round_rfu:
+        rfu_chunk = jround_array(rfu_chunk, 1)
+    if rfu_chunk.shape[1]:
+        rfu_rows = ['\t' + text for text in _format_rfu_rows(rfu_chunk)]
+    else:
+        rfu_rows = [''] * len(rfu_chunk)
+    return ''.join(
+        prefix + text + '\r\n' for prefix, text in zip(row_prefixes, rfu_rows)
+    )
+
+
+def _write_table_rows(
+    adat,
+    f: io.TextIOWrapper,
+    round_rfu: bool,
+    workers: Optional[int] = None,
+    executor: str = 'process',
+    row_positions: Optional[np.ndarray] = None,
+    column_positions: Optional[np.ndarray] = None,
+) -> None:
+    """Writes the row metadata and RFU values of each sample as TABLE lines.
+
+    If given, only the samples at `row_positions` and the RFU columns at `column_positions`
+    are written, the selected RFU values are only copied a chunk at a time.
+    With `workers` > 1, chunks of samples are formatted in a pool and written in order.
+    """
+    index = adat.index if row_positions is None else adat.index[row_positions]
+    row_metadata = [
+        list(map(_format_cell, index.get_level_values(row_name).tolist()))
+        for row_name in index.names
+    ]
+    row_prefixes = ['\t'.join(cells) + '\t' for cells in zip(*row_metadata)]
+    rfu_matrix = adat.values
+    n_rows = len(index)
+    n_columns = (
+        rfu_matrix.shape[1] if column_positions is None else len(column_positions)
+    )
+    chunk_size = max(1, WRITE_CHUNK_CELLS // max(1, n_columns))
+
+    def select_rfu_chunk(start: int) -> np.ndarray:
+        if row_positions is None:
+            rows = rfu_matrix[start : start + chunk_size]
         else:
-            rfu_row = list(rfu_row)
+            rows = rfu_matrix[row_positions[start : start + chunk_size]]
+        return rows if column_positions is None else rows[:, column_positions]
 
-        # Create and write the row
-        row = []
-        row += row_metadata
-        row += [None]
-        row += rfu_row
-        writer.writerow(row)
+    chunks = (
+        (row_prefixes[start : start + chunk_size], select_rfu_chunk(start))
+        for start in range(0, n_rows, chunk_size)
+    )
+
+    if workers is None or workers <= 1:
+        for prefixes, rfu_chunk in chunks:
+            f.write(_format_table_chunk(prefixes, rfu_chunk, round_rfu))
+        return
+
+    with WRITE_EXECUTORS[executor](max_workers=workers) as pool:
+        pending = collections.deque()
+        for prefixes, rfu_chunk in chunks:
+            pending.append(
+                pool.submit(_format_table_chunk, prefixes, rfu_chunk, round_rfu)
+            )
+            # Bound the memory held by chunks waiting to be written
+            while len(pending) > 2 * workers:
+                f.write(pending.popleft().result())
+        while pending:
+            f.write(pending.popleft().result())
+
+
+def _selected_positions(
+    index: pd.MultiIndex,
+    selection: Optional[Union[Callable[[Dict[str, str]], bool], Iterable[bool]]],
+    seq_ids: Optional[Iterable[str]] = None,
+) -> Optional[np.ndarray]:
+    """Returns the positions of the index entries selected by a metadata callable or boolean mask
+    (and `seq_ids`), or None if nothing is deselected."""
+    if selection is None and seq_ids is None:
+        return None
+
+    keep = np.ones(len(index), dtype=bool)
+    if seq_ids is not None:
+        seq_ids = set(seq_ids)
+        index_seq_ids = index.get_level_values('SeqId')
+        if not seq_ids.issubset(index_seq_ids):
+            raise KeyError('Some or all provided SeqIds not found in column metadata.')
+        keep &= index_seq_ids.isin(seq_ids)
+
+    if callable(selection):
+        names = list(index.names)
+        keep &= np.array(
+            [bool(selection(dict(zip(names, values)))) for values in index], dtype=bool
+        )
+    elif selection is not None:
+        mask = np.asarray(selection, dtype=bool)
+        if mask.shape != (len(index),):
+            raise ValueError(
+                f'Boolean mask of length {mask.size} does not match the {len(index)} entries selected from.'
+            )
+        keep &= mask
+
+    return np.flatnonzero(keep)
+
+
+def write_adat(
+    adat,
+    f: io.TextIOWrapper,
+    round_rfu: bool = True,
+    convert_to_v3_seq_ids: bool = False,
+    workers: Optional[int] = None,
+    executor: str = 'process',
+    seq_ids: Optional[Iterable[str]] = None,
+    column_filter: Optional[
+        Union[Callable[[Dict[str, str]], bool], Iterable[bool]]
+    ] = None,
+    row_filter: Optional[
+        Union[Callable[[Dict[str, str]], bool], Iterable[bool]]
+    ] = None,
+) -> None:
+    """Write this Adat to an adat format data source.
+
+    Parameters
+    ----------
+    adat : Adat
+        Adat Pandas dataframe to be written.
+
+    path : str
+        The file path to write to.
+
+    round_rfu : bool
+        Rounds the RFU matrix to one decimal place if True,
+        otherwise leaves the matrix as-is. (Default = True)
+
+    convert_to_v3_seq_ids : bool
+        Combines the column metadata for SeqId and
+        SeqIdVersion to the V3 style (12345-6_7)
+
+    workers : int, optional
+        If greater than 1, chunks of samples are formatted in a pool of `workers` and
+        written in order by the calling thread. The output is identical.
+
+    executor : str
+        'process' (default) formats chunks in separate processes so formatting scales with cores,
+        'thread' formats them in threads of this process.
+
+    seq_ids : Iterable[str], optional
+        Only write the columns of these SeqIds (in the Adat's column order).
+
+    column_filter : Callable[[Dict[str, str]], bool] | Iterable[bool], optional
+        Only write the columns whose metadata (name to value) the callable returns True for,
+        or that are True in a boolean mask. Combined with `seq_ids` if both are given.
+
+    row_filter : Callable[[Dict[str, str]], bool] | Iterable[bool], optional
+        Only write the samples whose row metadata (name to value) the callable returns True for,
+        or that are True in a boolean mask.
+
+    Examples
+    --------
+    >>> import somadata as sd
+    >>> adat = sd.read_adat('path/to/file.adat')
+    >>> sd.write_adat(adat, 'path/to/out/filename.adat')
+    >>> sd.write_adat(adat, 'path/to/out/filename.adat', round_rfu=False)
+    >>> adat.to_adat('path/to/out/filename.adat', workers=8)
+    >>> adat.to_adat('path/to/out/filename.adat', seq_ids=['10000-28'], row_filter=lambda meta: meta['SampleType'] == 'Sample')
+
+    Returns
+    -------
+    None
+    """
+    if executor not in WRITE_EXECUTORS:
+        raise ValueError(
+            f'Unknown executor "{executor}". Choose "process" or "thread".'
+        )
+    if workers is not None and workers < 1:
+        raise ValueError(f'"workers" must be at least 1, got {workers}.')
+
+    columns = get_pd_axis(adat, 1)
+    column_positions = _selected_positions(columns, column_filter, seq_ids)
+    row_positions = _selected_positions(adat.index, row_filter)
+    if column_positions is not None:
+        columns = columns[column_positions]
+
+    _write_adat_preamble(adat, f, convert_to_v3_seq_ids, columns)
+    _write_table_rows(
+        adat, f, round_rfu, workers, executor, row_positions, column_positions
+    )
+
+
+class AdatWriter:
+    """Writes an adat file from successive Adats holding chunks of its samples.
+
+    The header, column metadata and row metadata titles are written with the first chunk,
+    the samples of every chunk are appended as TABLE lines. Chunks must have the same column
+    metadata and row metadata names as the first chunk, so only one chunk needs to be in memory.
+    Closing a writer that has not written a chunk raises an AdatWriteError (and removes the file
+    it opened), as an adat file cannot be written without its column metadata.
+
+    Parameters
+    ----------
+    path_or_buf : str | io.TextIOWrapper
+        Path or buffer that the file will be written to
+
+    round_rfu : bool
+        Rounds the RFU matrix to one decimal place if True,
+        otherwise leaves the matrix as-is. (Default = True)
+
+    convert_to_v3_seq_ids : bool
+        Combines the column metadata for SeqId and
+        SeqIdVersion to the V3 style (12345-6_7)
+
+    compression : str, optional
+        Compresses the file written to a path with 'gzip', 'bz2' or 'xz'. If 'infer' (default),
+        the compression is inferred from the file extension (.gz, .bz2, .xz).
+
+    compression_workers : int, optional
+        The number of threads compressing the file in parallel blocks.
+
+    Examples
+    --------
+    >>> with somadata.AdatWriter('path/to/out.adat') as writer:
+    ...     for adat in somadata.read_adat_chunks('path/to/file.adat', chunk_size=96):
+    ...         writer.write(adat.lift('v5.0'))
+    """
+
+    def __init__(
+        self,
+        path_or_buf: Union[str, io.TextIOWrapper],
+        round_rfu: bool = True,
+        convert_to_v3_seq_ids: bool = False,
+        compression: Optional[str] = 'infer',
+        compression_workers: Optional[int] = None,
+    ) -> None:
+        if type(path_or_buf) == str:
+            self._f = open_text(path_or_buf, 'w', compression, compression_workers)
+            self._path = path_or_buf
+        else:
+            self._f = path_or_buf
+            self._path = None
+        self._closed = False
+        self.round_rfu = round_rfu
+        self.convert_to_v3_seq_ids = convert_to_v3_seq_ids
+        self.columns = None
+        self.row_names = None
+        self.n_samples = 0
+
+    def write(self, adat: Adat) -> None:
+        """Appends the samples of `adat`, writing the header & column metadata with the first chunk.
+
+        Raises an AdatWriteError if the column metadata or row metadata names
+        differ from those of the first chunk.
+        """
+        columns = get_pd_axis(adat, 1)
+        if self.columns is None:
+            _write_adat_preamble(adat, self._f, self.convert_to_v3_seq_ids, columns)
+            self.columns = columns
+            self.row_names = list(adat.index.names)
+        else:
+            if not columns.equals(self.columns) or list(columns.names) != list(
+                self.columns.names
+            ):
+                raise AdatWriteError(
+                    'Column metadata of the chunk does not match the column metadata already written.'
+                )
+            if list(adat.index.names) != self.row_names:
+                raise AdatWriteError(
+                    'Row metadata names of the chunk do not match the row metadata names already written.'
+                )
+        _write_table_rows(adat, self._f, self.round_rfu)
+        self.n_samples += len(adat)
+
+    def _close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._path is not None:
+            self._f.close()
+            # Do not leave an empty file behind, which is not a readable adat
+            if self.columns is None:
+                os.remove(self._path)
+
+    def close(self) -> None:
+        """Closes the file if the writer opened it.
+
+        Raises an AdatWriteError if no chunk was written, write an Adat without samples
+        for a file holding only the header & column metadata.
+        """
+        self._close()
+        if self.columns is None:
+            raise AdatWriteError(
+                'No Adat was written, so there is no header or column metadata to write. '
+                'Write an Adat without samples for an adat file with an empty TABLE.'
+            )
+
+    def __enter__(self) -> AdatWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Do not mask an exception raised in the with block
+        if exc_type is not None:
+            self._close()
+        else:
+            self.close()
+
+
+def append_to_adat(
+    path: str,
+    adat: Adat,
+    round_rfu: bool = True,
+    compression: Optional[str] = 'infer',
+) -> None:
+    """Appends the samples of an Adat to the end of an existing adat file.
+
+    Only the header and column metadata of the file are read, to check that the Adat has the
+    same column metadata and row metadata names. Nothing but the new TABLE lines is written.
+
+    Parameters
+    ----------
+    path : str
+        The adat file to append to.
+
+    adat : Adat
+        The samples to append.
+
+    round_rfu : bool
+        Rounds the RFU matrix to one decimal place if True,
+        otherwise leaves the matrix as-is. (Default = True)
+
+    compression : str, optional
+        The compression of the file: 'gzip', 'bz2', 'xz' or None. If 'infer' (default),
+        it is detected from the file extension or the file's leading bytes.
+        The new samples are appended as a new compressed stream.
+
+    Examples
+    --------
+    >>> somadata.append_to_adat('path/to/cumulative.adat', new_plate_adat)
+
+    Returns
+    -------
+    None
+    """
+    if compression == 'infer':
+        compression = infer_compression(path, sniff=True)
+
+    f = _open_adat(path, compression)
+    try:
+        reader = csv.reader(f, delimiter='\t')
+        _, column_metadata, row_metadata_names, _ = _read_table_layout(
+            reader, compatibility_mode=True
+        )
+    finally:
+        f.close()
+
+    if row_metadata_names is None:
+        raise AdatWriteError(f'{path} does not contain a TABLE section to append to.')
+    columns = get_pd_axis(adat, 1)
+    adat_column_metadata = {
+        name: [_cell_text(value) for value in columns.get_level_values(name)]
+        for name in columns.names
+    }
+    if adat_column_metadata != column_metadata:
+        raise AdatWriteError(
+            f'Column metadata of the Adat does not match the column metadata of {path}.'
+        )
+    if list(adat.index.names) != row_metadata_names:
+        raise AdatWriteError(
+            f'Row metadata names of the Adat do not match the row metadata names of {path}.'
+        )
+
+    # Complete the last line of an uncompressed file that lacks a line ending
+    missing_line_ending = False
+    if compression is None:
+        with open(path, 'rb') as fb:
+            fb.seek(0, os.SEEK_END)
+            if fb.tell():
+                fb.seek(-1, os.SEEK_END)
+                missing_line_ending = fb.read(1) not in (b'\n', b'\r')
+
+    with open_text(path, 'a', compression) as f:
+        if missing_line_ending:
+            f.write('\r\n')
+        _write_table_rows(adat, f, round_rfu)
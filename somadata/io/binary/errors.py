@@ -0,0 +1,2 @@
+class AdatBinaryReadError(Exception):
+    pass
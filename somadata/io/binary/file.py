@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+from somadata import Adat
+from somadata.io.binary.errors import AdatBinaryReadError
+from somadata.tools.pandas import get_pd_axis
+
+FORMAT_VERSION = 1
+RFU_FILENAME = 'rfu.bin'
+METADATA_FILENAME = 'metadata.json'
+
+
+def _index_to_dict(index: pd.Index) -> Dict[str, List]:
+    return {
+        'names': list(index.names),
+        'values': [index.get_level_values(i).tolist() for i in range(index.nlevels)],
+    }
+
+
+def _dict_to_index(index_dict: Dict[str, List]) -> pd.MultiIndex:
+    return pd.MultiIndex.from_arrays(index_dict['values'], names=index_dict['names'])
+
+
+def write_binary(adat: Adat, path: str) -> None:
+    """Writes an Adat to a binary adat directory.
+
+    The directory holds the RFU matrix as a raw little-endian array in column-major
+    order (`rfu.bin`, each SOMAmer's values are contiguous) and a JSON sidecar with the
+    row metadata, column metadata and header metadata (`metadata.json`).
+
+    Parameters
+    ----------
+    adat : Adat
+        Adat to be written.
+
+    path : str
+        The directory to write to, created if it does not exist.
+
+    Examples
+    --------
+    >>> somadata.io.binary.file.write_binary(adat, 'path/to/file.adatb')
+
+    Returns
+    -------
+    None
+    """
+    os.makedirs(path, exist_ok=True)
+
+    rfu_matrix = adat.to_numpy()
+    dtype = rfu_matrix.dtype.newbyteorder('<')
+    rfu_matrix = np.asfortranarray(rfu_matrix, dtype=dtype)
+    # Writing the transposed C-ordered view writes the column-major bytes without a copy
+    rfu_matrix.T.tofile(os.path.join(path, RFU_FILENAME))
+
+    metadata = {
+        'format_version': FORMAT_VERSION,
+        'dtype': dtype.str,
+        'shape': list(rfu_matrix.shape),
+        'order': 'F',
+        'row_metadata': _index_to_dict(adat.index),
+        'column_metadata': _index_to_dict(get_pd_axis(adat, 1)),
+        'header_metadata': adat.header_metadata,
+    }
+    with open(os.path.join(path, METADATA_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, default=str)
+
+
+def read_binary(path: str, mmap: bool = True) -> Adat:
+    """Returns an Adat from a binary adat directory written by `Adat.to_binary`.
+
+    Parameters
+    ----------
+    path : str
+        The binary adat directory.
+
+    mmap : bool
+        If True (default), the RFU matrix is memory-mapped (copy-on-write), so opening the adat only
+        reads its metadata and RFU pages are read from disk when they are first accessed.
+        Changes to the Adat are never written back to the file. If False, the RFU matrix is read into memory.
+
+    Examples
+    --------
+    >>> adat = somadata.read_binary('path/to/file.adatb')
+    >>> adat = somadata.read_binary('path/to/file.adatb', mmap=False)
+
+    Returns
+    -------
+    adat : Adat
+    """
+    try:
+        with open(os.path.join(path, METADATA_FILENAME), 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError) as e:
+        raise AdatBinaryReadError(f'Unable to read binary adat metadata: {e}') from e
+
+    if metadata.get('format_version') != FORMAT_VERSION:
+        raise AdatBinaryReadError(
+            f'Unsupported binary adat format version: {metadata.get("format_version")}'
+        )
+
+    dtype = np.dtype(metadata['dtype'])
+    shape = tuple(metadata['shape'])
+    rfu_path = os.path.join(path, RFU_FILENAME)
+    expected_size = dtype.itemsize * int(np.prod(shape))
+    if os.path.getsize(rfu_path) != expected_size:
+        raise AdatBinaryReadError(
+            f'RFU file size does not match the metadata, expected {expected_size} bytes.'
+        )
+
+    if mmap and expected_size:
+        rfu_matrix = np.memmap(
+            rfu_path, dtype=dtype, mode='c', shape=shape, order=metadata['order']
+        )
+    else:
+        rfu_matrix = np.fromfile(rfu_path, dtype=dtype).reshape(
+            shape, order=metadata['order']
+        )
+    if not dtype.isnative:
+        rfu_matrix = rfu_matrix.astype(dtype.newbyteorder('='))
+
+    return Adat(
+        data=rfu_matrix,
+        index=_dict_to_index(metadata['row_metadata']),
+        columns=_dict_to_index(metadata['column_metadata']),
+        header_metadata=metadata['header_metadata'],
+        copy=False,
+    )
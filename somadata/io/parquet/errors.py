@@ -0,0 +1,2 @@
+class AdatParquetReadError(Exception):
+    pass
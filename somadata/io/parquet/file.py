@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from somadata import Adat
+from somadata.io.adat.file import _project_columns
+from somadata.io.parquet.errors import AdatParquetReadError
+from somadata.tools.pandas import get_pd_axis
+
+FORMAT_VERSION = 1
+SCHEMA_METADATA_KEY = b'somadata'
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            'Reading and writing parquet files requires pyarrow. Install it with `pip install somadata[parquet]`.'
+        ) from e
+    return pyarrow
+
+
+def write_parquet(
+    adat: Adat, path: str, row_group_size: Optional[int] = None, **kwargs
+) -> None:
+    """Writes an Adat to a parquet file.
+
+    Each row metadata field and each SOMAmer (named by its SeqId) is stored as a column.
+    The column metadata and header metadata are stored as JSON in the schema metadata.
+
+    Parameters
+    ----------
+    adat : Adat
+        Adat to be written.
+
+    path : str
+        The file path.
+
+    row_group_size : int, optional
+        The maximum number of samples per row group. Smaller row groups allow
+        `read_adat_parquet` to skip more of the file when filtering samples.
+
+    **kwargs
+        Passed on to `pyarrow.parquet.write_table` (e.g., `compression`).
+
+    Examples
+    --------
+    >>> somadata.io.parquet.file.write_parquet(adat, 'path/to/file.parquet')
+
+    Returns
+    -------
+    None
+    """
+    pa = _import_pyarrow()
+
+    row_metadata_names = list(adat.index.names)
+    columns = get_pd_axis(adat, 1)
+    column_metadata = {
+        name: columns.get_level_values(name).tolist() for name in columns.names
+    }
+    if 'SeqId' not in column_metadata:
+        raise ValueError('SeqId not found in column metadata.')
+    seq_ids = column_metadata['SeqId']
+    if len(set(seq_ids)) != len(seq_ids):
+        raise ValueError('SeqIds must be unique to be written to parquet.')
+    if set(seq_ids) & set(row_metadata_names):
+        raise ValueError('Row metadata names must not overlap with SeqIds.')
+
+    rfu_matrix = adat.to_numpy()
+    arrays = [
+        pa.array(adat.index.get_level_values(name), from_pandas=True)
+        for name in row_metadata_names
+    ]
+    arrays.extend(pa.array(rfu_matrix[:, i]) for i in range(rfu_matrix.shape[1]))
+
+    metadata = {
+        'format_version': FORMAT_VERSION,
+        'row_metadata_names': row_metadata_names,
+        'column_metadata': column_metadata,
+        'header_metadata': adat.header_metadata,
+    }
+    schema_metadata = {SCHEMA_METADATA_KEY: json.dumps(metadata, default=str)}
+    table = pa.Table.from_arrays(
+        arrays, names=row_metadata_names + seq_ids, metadata=schema_metadata
+    )
+    pa.parquet.write_table(table, path, row_group_size=row_group_size, **kwargs)
+
+
+def read_adat_parquet(
+    path: str,
+    seq_ids: Optional[Iterable[str]] = None,
+    column_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    filters: Optional[Union[List, 'pyarrow.compute.Expression']] = None,
+) -> Adat:
+    """Returns an Adat from a parquet file written by `Adat.to_parquet`.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+
+    seq_ids : Iterable[str], optional
+        Only read the RFU columns of these SeqIds.
+
+    column_filter : Callable[[Dict[str, str]], bool], optional
+        Only read the RFU columns whose column metadata (a dict of column metadata name to value)
+        the callable returns True for.
+
+    filters : List[Tuple] | List[List[Tuple]] | pyarrow.compute.Expression, optional
+        Only read the samples whose row metadata match these `pyarrow.parquet` filters,
+        e.g., `[('SampleType', '==', 'Sample')]`. Row groups that cannot match are not read.
+
+    Examples
+    --------
+    >>> adat = somadata.read_adat_parquet('path/to/file.parquet')
+    >>> adat = somadata.read_adat_parquet('path/to/file.parquet', seq_ids=['10000-28', '10001-7'])
+    >>> adat = somadata.read_adat_parquet('path/to/file.parquet', filters=[('SampleType', '==', 'Sample')])
+
+    Returns
+    -------
+    adat : Adat
+    """
+    pa = _import_pyarrow()
+
+    schema = pa.parquet.read_schema(path)
+    if not schema.metadata or SCHEMA_METADATA_KEY not in schema.metadata:
+        raise AdatParquetReadError('Parquet file was not written by Adat.to_parquet.')
+    metadata = json.loads(schema.metadata[SCHEMA_METADATA_KEY])
+    if metadata.get('format_version') != FORMAT_VERSION:
+        raise AdatParquetReadError(
+            f'Unsupported adat parquet format version: {metadata.get("format_version")}'
+        )
+
+    row_metadata_names = metadata['row_metadata_names']
+    column_metadata, usecols = _project_columns(
+        metadata['column_metadata'], seq_ids=seq_ids, column_filter=column_filter
+    )
+    rfu_columns = column_metadata.get('SeqId', [])
+
+    table = pa.parquet.read_table(
+        path, columns=row_metadata_names + rfu_columns, filters=filters
+    )
+
+    if rfu_columns:
+        dtype = np.result_type(
+            *[
+                table.schema.field(seq_id).type.to_pandas_dtype()
+                for seq_id in rfu_columns
+            ]
+        )
+    else:
+        dtype = np.float64
+    # Column-major, so the Adat's RFU block is contiguous without another copy
+    rfu_matrix = np.empty((table.num_rows, len(rfu_columns)), dtype=dtype, order='F')
+    for i, seq_id in enumerate(rfu_columns):
+        rfu_matrix[:, i] = table.column(seq_id).to_numpy()
+
+    row_metadata = {name: table.column(name).to_pylist() for name in row_metadata_names}
+    return Adat.from_features(
+        rfu_matrix=rfu_matrix,
+        row_metadata=row_metadata,
+        column_metadata=column_metadata,
+        header_metadata=metadata['header_metadata'],
+    )
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+
+from somadata.adat import Adat
+
+# Special methods are looked up on the type, so __getattr__ does not forward them
+DELEGATED_METHODS = (
+    '__getitem__',
+    '__setitem__',
+    '__iter__',
+    '__contains__',
+    '__array__',
+    '__eq__',
+    '__ne__',
+    '__lt__',
+    '__le__',
+    '__gt__',
+    '__ge__',
+    '__add__',
+    '__radd__',
+    '__sub__',
+    '__rsub__',
+    '__mul__',
+    '__rmul__',
+    '__truediv__',
+    '__rtruediv__',
+    '__floordiv__',
+    '__rfloordiv__',
+    '__pow__',
+    '__rpow__',
+    '__neg__',
+    '__abs__',
+)
+
+
+class LazyAdat:
+    """An Adat whose RFU matrix is only read once its values are first used.
+
+    The row, column and header metadata are available immediately. Any other attribute
+    or operation loads the Adat (see `LazyAdat.load`) and is passed on to it, so a LazyAdat
+    can be used wherever an Adat is read from.
+
+    Parameters
+    ----------
+    loader : Callable[[], Adat]
+        Returns the Adat, called once on first use of its values.
+
+    row_metadata : Dict[str, List[str]]
+        A dictionary of each column of the row metadata where the key-value
+        pairs are column-name and an array of each sample's corresponding metadata
+
+    column_metadata : Dict[str, List[str]]
+        A dictionary of each row of the adat column metadata where the key-value pairs are
+        row-name and an array of each somamer's corresponding metadata.
+
+    header_metadata : Dict[str, str]
+        A dictionary of each row of the header_metadata corresponds to a key-value pair.
+
+    Examples
+    --------
+    >>> adat = somadata.read_adat('path/to/file.adat', lazy=True)
+    >>> adat.columns.get_level_values('SeqId')  # does not read the RFU matrix
+    >>> adat.pick_on_meta(axis=1, name='SeqId', values=['10000-28'])  # reads the RFU matrix
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Adat],
+        row_metadata: Dict[str, List[str]],
+        column_metadata: Dict[str, List[str]],
+        header_metadata: Dict[str, str],
+    ) -> None:
+        self._loader = loader
+        self._adat = None
+        self._index = pd.MultiIndex.from_arrays(
+            list(row_metadata.values()), names=list(row_metadata.keys())
+        )
+        self._columns = pd.MultiIndex.from_arrays(
+            list(column_metadata.values()), names=list(column_metadata.keys())
+        )
+        self._header_metadata = header_metadata
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the RFU matrix has been read."""
+        return self._adat is not None
+
+    def load(self) -> Adat:
+        """Reads (once) and returns the Adat."""
+        if self._adat is None:
+            adat = self._loader()
+            adat.header_metadata = self._header_metadata
+            self._adat = adat
+        return self._adat
+
+    @property
+    def index(self) -> pd.MultiIndex:
+        return self._index if self._adat is None else self._adat.index
+
+    @property
+    def columns(self) -> pd.MultiIndex:
+        return self._columns if self._adat is None else self._adat.columns
+
+    @property
+    def column_multiindex(self) -> pd.MultiIndex:
+        """The column metadata as a MultiIndex, see `Adat.column_multiindex`."""
+        return self.columns
+
+    @property
+    def header_metadata(self) -> Dict[str, str]:
+        return self._header_metadata
+
+    @header_metadata.setter
+    def header_metadata(self, header_metadata: Dict[str, str]) -> None:
+        self._header_metadata = header_metadata
+        if self._adat is not None:
+            self._adat.header_metadata = header_metadata
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (len(self.index), len(self.columns))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not defined above
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        if self._adat is None:
+            n_samples, n_somamers = self.shape
+            return f'<LazyAdat: {n_samples} samples x {n_somamers} SOMAmers, RFU matrix not loaded>'
+        return repr(self._adat)
+
+
+def _delegate(name: str) -> Callable:
+    def method(self, *args, **kwargs):
+        return getattr(self.load(), name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+for _name in DELEGATED_METHODS:
+    setattr(LazyAdat, _name, _delegate(_name))
@@ -4,8 +4,11 @@ import copy
 import re
 from typing import Dict, List
 
-from somadata import Adat
+import numpy as np
+
+from somadata import Adat, FeatureAdat
 from somadata.tools.errors import AdatConcatError
+from somadata.tools.pandas import get_pd_axis
 
 from . import adat_concatenation_utils
 
@@ -96,8 +99,10 @@ def _concat_column_metadata(adats: List[Adat]) -> Dict(str, List):
     col_metadata = {}
     col_checks = []
     for adat in adats:
-        for name in adat.columns.names:
-            values = list(adat.columns.get_level_values(name))
+        # The column metadata MultiIndex, which a FeatureAdat builds from its feature table
+        column_multiindex = get_pd_axis(adat, 1)
+        for name in column_multiindex.names:
+            values = list(column_multiindex.get_level_values(name))
             if name == 'ColCheck':
                 col_checks.append(
                     [True if value == 'PASS' else False for value in values]
@@ -148,15 +153,16 @@ def _concat_row_metadata(adats: List[Adat]) -> Dict(str, List):
     return row_metadata
 
 
-def _concat_rfus(adats: List[Adat]) -> List[List[float]]:
-    # Get RFU Values
-    values = []
-    for adat in adats:
-        values += list(adat.values)
-    return values
+def _concat_rfus(adats: List[Adat], dtype=None) -> np.ndarray:
+    # Get RFU Values, stacked in a single allocation of the common (or requested) dtype
+    values = [adat.to_numpy() for adat in adats]
+    dtype = dtype or np.result_type(*values)
+    return np.concatenate(values, axis=0, dtype=dtype)
 
 
-def concatenate_adats(adats: List[Adat], header_merge_strategy: Dict = None) -> Adat:
+def concatenate_adats(
+    adats: List[Adat], header_merge_strategy: Dict = None, dtype=None
+) -> Adat:
     """Given list of compatible adats will return a single adat with all data.
 
     An adat concatenation method that requires all row and column metadata have the same fields.
@@ -183,10 +189,14 @@ def concatenate_adats(adats: List[Adat], header_merge_strategy: Dict = None) ->
 
         - 'null': Will null the field
 
+    dtype : str | np.dtype (Optional)
+        The dtype of the concatenated RFU values. Defaults to the common dtype of the adats,
+        e.g., float32 adats are concatenated into a float32 adat.
+
     Returns
     -------
     adat : Adat
-        Concatenated adat
+        Concatenated adat, a FeatureAdat if all of the adats are FeatureAdats
 
     Examples
     --------
@@ -199,9 +209,12 @@ def concatenate_adats(adats: List[Adat], header_merge_strategy: Dict = None) ->
     )
     column_metadata = _concat_column_metadata(adats)
     row_metadata = _concat_row_metadata(adats)
-    rfu_matrix = _concat_rfus(adats)
+    rfu_matrix = _concat_rfus(adats, dtype)
 
-    adat = Adat.from_features(
+    adat_class = (
+        FeatureAdat if all(isinstance(adat, FeatureAdat) for adat in adats) else Adat
+    )
+    adat = adat_class.from_features(
         rfu_matrix, row_metadata, column_metadata, header_metadata
     )
     return adat
@@ -216,7 +229,7 @@ def _quick_concat(adats):
     return Adat(
         data=rfu_matrix,
         index=row_multiindex,
-        columns=adats[0].columns,
+        columns=get_pd_axis(adats[0], 1),
         header_metadata=adats[0].header_metadata,
     )
 
@@ -248,13 +261,13 @@ def smart_adat_concatenation(adats, somamer_source_adat=None):
     """
 
     # About to change the adats somamer metadata.  Make sure their seqids are the same.
-    if type(somamer_source_adat) == Adat:
+    if isinstance(somamer_source_adat, Adat):
         adats = adats + [somamer_source_adat]
 
     adats = adat_concatenation_utils.prepare_rfu_matrix_for_inner_merge(adats)
 
     # Unpack & update if we're updating
-    if type(somamer_source_adat) == Adat:
+    if isinstance(somamer_source_adat, Adat):
         somamer_source_adat = adats[-1]
         adats = adats[0:-1]
         adats = adat_concatenation_utils.convert_somamer_metadata_to_source(
@@ -1,4 +1,5 @@
 import numpy as np
+from numpy.typing import ArrayLike
 
 
 def jround(x: float, n_digits: int = 1) -> float:
@@ -40,3 +41,45 @@ def jround(x: float, n_digits: int = 1) -> float:
     else:
         pow10 = pow(10, dig)
         return(sgn * np.rint(x / pow10) * pow10)
+
+
+def jround_array(x: ArrayLike, n_digits: int = 1) -> np.ndarray:
+    """Given an array of numerical values returns the rounded float64 values.
+
+    A vectorized `jround`: every element is bit-identical to `jround(element, n_digits)`
+    (including signed zeros, NaN and `n_digits` <= 0), consistent with Java's default rounding utility.
+
+    Parameters
+    ----------
+    x : ArrayLike
+        Input numerical values
+
+    n_digits : int
+        Rounds x to n_digits digits. Default = 1
+
+    Examples
+    --------
+    >>> x_rounded = jround_array(adat.to_numpy(), 1)
+
+    Returns
+    -------
+    x_rounded : np.ndarray
+        x rounded to n_digit digits consistent with Java's rounding utility
+    """
+    x = np.asarray(x)
+    dig = np.floor(n_digits + 0.5)
+    negative = x < 0.0
+    sgn = np.where(negative, -1.0, 1.0)
+    x = np.where(negative, -x, x)
+
+    # Same operations, in the same order, as jround so the results are bit-identical
+    if dig == 0:
+        x_rounded = sgn * np.rint(x)
+    elif dig > 0:
+        pow10 = pow(10, dig)
+        intx = np.floor(x)
+        x_rounded = sgn * (intx + np.rint((x - intx) * pow10) / pow10)
+    else:
+        pow10 = pow(10, dig)
+        x_rounded = sgn * np.rint(x / pow10) * pow10
+    return x_rounded[()]
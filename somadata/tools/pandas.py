@@ -1,4 +1,5 @@
 from somadata.errors import AdatBaseError
+import numpy as np
 import pandas as pd
 
 
@@ -6,7 +7,34 @@ def get_pd_axis(obj, axis: int) -> pd.MultiIndex:
     if axis == 0:
         return obj.index
     elif axis == 1:
+        # A FeatureAdat builds its column metadata MultiIndex from its feature table. Look the property
+        # up on the type, so errors raised while building the MultiIndex are not mistaken for its absence.
+        if hasattr(type(obj), 'column_multiindex'):
+            return obj.column_multiindex
         return obj.columns
     else:
         raise AdatBaseError('Not a valid axis, please choose "0" for row metadata or "1" column metadata')
-   
\ No newline at end of file
+
+
+def copy_on_write_enabled() -> bool:
+    """Returns True if pandas copy-on-write is active, always the case from pandas 3.0."""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    # The option does not exist before pandas 1.5, and "warn" (pandas 2) does not copy on write
+    return getattr(pd.options.mode, 'copy_on_write', False) is True
+
+
+def metadata_copy(obj):
+    """Returns a copy of a DataFrame to change the metadata of, writes to it never change `obj`.
+
+    With copy-on-write the copy shares the values of `obj` (a shallow copy), otherwise the values are copied.
+    """
+    return obj.copy(deep=not copy_on_write_enabled())
+
+
+def get_float_dtype(obj) -> np.dtype:
+    """Returns the common floating point dtype of a DataFrame's values, float64 if they are not all floats."""
+    dtypes = list(obj.dtypes.unique())
+    if dtypes and all(pd.api.types.is_float_dtype(dtype) for dtype in dtypes):
+        return np.result_type(*dtypes)
+    return np.dtype(np.float64)
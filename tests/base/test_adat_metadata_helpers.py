@@ -1,11 +1,14 @@
-from unittest import TestCase
+import re
+from unittest import TestCase, mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 import somadata
 from somadata import Adat
-from somadata.errors import AdatMetaError
+from somadata.errors import AdatKeyError, AdatMetaError
+from somadata.tools.pandas import copy_on_write_enabled
 
 
 class ExcludeMetaTest(TestCase):
@@ -155,6 +158,59 @@ class PickOnMetaTest(TestCase):
         self.assertEqual(len(adat.columns.get_level_values('SeqId')), 2)
 
 
+class QueryMetaTest(TestCase):
+    def setUp(self):
+        self.adat = somadata.read_adat('./tests/data/control_data.adat')
+
+    def test_query_matches_pick_on_meta(self):
+        adat = self.adat.query_meta(
+            rows={'SampleType': {'Calibrator', 'Buffer'}}, columns={'Type': 'Protein'}
+        )
+        expected = self.adat.pick_on_meta(
+            axis=0, name='SampleType', values=['Calibrator', 'Buffer']
+        ).pick_on_meta(axis=1, name='Type', values=['Protein'])
+        pd.testing.assert_frame_equal(adat, expected)
+
+    def test_query_range(self):
+        adat = self.adat.query_meta(rows={'HybControlNormScale': slice(0.9, 1.0)})
+        scales = adat.index.get_level_values('HybControlNormScale').astype(float)
+        self.assertGreater(len(adat), 0)
+        self.assertTrue(((scales >= 0.9) & (scales <= 1.0)).all())
+        self.assertEqual(
+            len(adat),
+            sum(
+                0.9 <= float(scale) <= 1.0
+                for scale in self.adat.index.get_level_values('HybControlNormScale')
+            ),
+        )
+
+    def test_query_regex_and_callable(self):
+        adat = self.adat.query_meta(
+            columns={
+                'Target': re.compile('^IL'),
+                'SeqId': lambda seq_ids: seq_ids.str.startswith('1'),
+            }
+        )
+        targets = adat.columns.get_level_values('Target')
+        self.assertGreater(len(targets), 0)
+        self.assertTrue(all(target.startswith('IL') for target in targets))
+        self.assertTrue(
+            all(
+                seq_id.startswith('1')
+                for seq_id in adat.columns.get_level_values('SeqId')
+            )
+        )
+        self.assertEqual(len(adat), len(self.adat))
+
+    def test_query_missing_values_selects_nothing(self):
+        adat = self.adat.query_meta(rows={'PlatePosition': 'H50'})
+        self.assertEqual(adat.shape, (0, self.adat.shape[1]))
+
+    def test_query_unknown_name(self):
+        with self.assertRaises(AdatKeyError):
+            self.adat.query_meta(rows={'NotAName': 'A'})
+
+
 class InsertIntoMetaTest(TestCase):
     def setUp(self):
         self.adat = somadata.read_adat('./tests/data/control_data.adat')
@@ -195,6 +251,135 @@ class ReplaceMetaTest(TestCase):
         self.assertEqual(name_order, list(adat.columns.names))
 
 
+class SharedRfuValuesTest(TestCase):
+    def setUp(self):
+        self.adat = somadata.read_adat('./tests/data/control_data.adat')
+
+    def metadata_operations(self):
+        return [
+            self.adat.insert_meta(
+                axis=1, name='NewSeqIds', values=[''] * self.adat.shape[1]
+            ),
+            self.adat.replace_meta(
+                axis=0, name='Barcode', values=[''] * self.adat.shape[0]
+            ),
+            self.adat.pick_meta(axis=0, names=['Barcode']),
+            self.adat.exclude_meta(axis=1, names=['Type']),
+            self.adat.update_somamer_metadata_from_adat(self.adat),
+        ]
+
+    @pytest.mark.skipif(
+        not copy_on_write_enabled(),
+        reason='RFU values are copied without copy-on-write',
+    )
+    def test_metadata_operations_share_rfu_values(self):
+        for adat in self.metadata_operations():
+            self.assertTrue(np.shares_memory(adat.values, self.adat.values))
+
+    def test_writes_do_not_change_original(self):
+        value = self.adat.iloc[0, 0]
+        for adat in self.metadata_operations():
+            adat.iloc[0, 0] = -1.0
+            self.assertEqual(self.adat.iloc[0, 0], value)
+
+    def test_without_copy_on_write_values_are_copied(self):
+        value = self.adat.iloc[0, 0]
+        with mock.patch(
+            'somadata.tools.pandas.copy_on_write_enabled', return_value=False
+        ):
+            adats = self.metadata_operations()
+        for adat in adats:
+            self.assertFalse(np.shares_memory(adat.values, self.adat.values))
+            adat.iloc[0, 0] = -1.0
+            self.assertEqual(self.adat.iloc[0, 0], value)
+
+
+class EditMetaTest(TestCase):
+    def setUp(self):
+        self.adat = somadata.read_adat('./tests/data/control_data.adat')
+
+    def test_edit_matches_single_operations(self):
+        targets = [str(i) for i in range(self.adat.shape[1])]
+        ranks = [str(-i) for i in range(self.adat.shape[1])]
+        with self.adat.edit_meta(axis=1) as edit:
+            edit.replace('Target', targets)
+            edit.insert('Rank', ranks)
+            edit.drop(['Dilution'])
+        expected = (
+            self.adat.replace_meta(axis=1, name='Target', values=targets)
+            .insert_meta(axis=1, name='Rank', values=ranks)
+            .exclude_meta(axis=1, names=['Dilution'])
+        )
+        pd.testing.assert_frame_equal(edit.adat, expected)
+        self.assertTrue(np.shares_memory(edit.adat.values, self.adat.values))
+        self.assertIn('Dilution', self.adat.columns.names)
+
+    def test_apply_row_edit(self):
+        barcodes = [str(i) for i in range(self.adat.shape[0])]
+        adat = (
+            self.adat.edit_meta(axis=0)
+            .replace('Barcode', barcodes)
+            .insert_keyed('Control', 'SampleType', {'Calibrator': 'Yes'})
+            .apply()
+        )
+        self.assertEqual(barcodes, list(adat.index.get_level_values('Barcode')))
+        self.assertEqual(
+            list(adat.index.get_level_values('Control')),
+            [
+                'Yes' if sample_type == 'Calibrator' else ''
+                for sample_type in self.adat.index.get_level_values('SampleType')
+            ],
+        )
+
+    @pytest.mark.filterwarnings('ignore:Some keys not provided')
+    def test_replace_keyed_uses_pending_values(self):
+        seq_ids = list(self.adat.columns.get_level_values('SeqId'))
+        adat = (
+            self.adat.edit_meta(axis=1)
+            .insert('Key', seq_ids)
+            .replace_keyed('Target', {seq_ids[0]: 'New Target'}, key_meta_name='Key')
+            .apply()
+        )
+        targets = adat.columns.get_level_values('Target')
+        self.assertEqual(targets[0], 'New Target')
+        self.assertEqual(
+            list(targets[1:]), list(self.adat.columns.get_level_values('Target')[1:])
+        )
+
+    def test_edit_errors(self):
+        edit = self.adat.edit_meta(axis=1)
+        with self.assertRaises(AdatKeyError):
+            edit.insert('Target', ['A'] * self.adat.shape[1])
+        with self.assertRaises(AdatKeyError):
+            edit.replace('NewTarget', ['A'] * self.adat.shape[1])
+        with self.assertRaises(AdatKeyError):
+            edit.drop(['NewTarget'])
+        with self.assertRaises(ValueError):
+            edit.replace('Target', ['A'])
+
+    def test_drop_duplicate_names(self):
+        adat = self.adat.edit_meta(axis=1).drop(['Dilution', 'Dilution']).apply()
+        self.assertTrue(
+            adat.columns.equals(
+                self.adat.exclude_meta(axis=1, names=['Dilution']).columns
+            )
+        )
+
+    def test_keyed_edit_of_dropped_name_raises(self):
+        edit = self.adat.edit_meta(axis=1).drop(['SeqId'])
+        with self.assertRaisesRegex(AdatKeyError, '"SeqId"'):
+            edit.insert_keyed('Rank', 'SeqId', {'10000-28': '1'})
+        with self.assertRaisesRegex(AdatKeyError, '"SeqId"'):
+            edit.replace_keyed('Target', {'10000-28': 'A'}, key_meta_name='SeqId')
+
+    def test_failed_block_is_not_applied(self):
+        with self.assertRaises(AdatKeyError):
+            with self.adat.edit_meta(axis=1) as edit:
+                edit.drop(['Dilution'])
+                edit.drop(['Dilution'])
+        self.assertIsNone(edit.adat)
+
+
 class ReplaceKeyedMetaTest(TestCase):
     def setUp(self):
         rfu_data = [[1, 2, 3], [4, 5, 6]]
@@ -357,3 +542,79 @@ class UpdateSomamerMetadataFromAdatTestCase(TestCase):
 
         with self.assertRaises(AdatMetaError):
             mismatch_seq_id_adat.update_somamer_metadata_from_adat(self.adat0)
+
+
+class ReorderOnMetadataTest(TestCase):
+    def setUp(self):
+        self.adat = somadata.read_adat('./tests/data/control_data.adat')
+
+    def test_reorder_columns(self):
+        source_adat = self.adat.iloc[:, np.roll(np.arange(self.adat.shape[1]), 1)]
+        adat = self.adat.reorder_on_metadata(
+            axis=1, name='SeqId', source_adat=source_adat
+        )
+        pd.testing.assert_frame_equal(adat, source_adat)
+
+    def test_reorder_rows(self):
+        source_adat = self.adat.iloc[np.roll(np.arange(self.adat.shape[0]), 3)]
+        adat = self.adat.reorder_on_metadata(
+            axis=0, name='PlatePosition', source_adat=source_adat
+        )
+        pd.testing.assert_frame_equal(adat, source_adat)
+
+    def test_reorder_raises_on_unknown_metadata(self):
+        with self.assertRaises(AdatMetaError):
+            self.adat.reorder_on_metadata(
+                axis=1, name='SeqId', source_adat=self.adat.iloc[:, 1:]
+            )
+        with self.assertRaises(AdatMetaError):
+            self.adat.iloc[:, 1:].reorder_on_metadata(
+                axis=1, name='SeqId', source_adat=self.adat
+            )
+
+
+class AlignToTest(TestCase):
+    def setUp(self):
+        self.adat = somadata.read_adat('./tests/data/control_data.adat')
+        self.other = self.adat.iloc[:, ::-1]
+        self.partial = self.adat.iloc[:, 2:]
+
+    def test_align_leaves_out_extra_columns(self):
+        adat = self.adat.align_to(self.other.iloc[:, 5:], axis=1, on='SeqId')
+        pd.testing.assert_frame_equal(adat, self.other.iloc[:, 5:])
+
+    def test_missing_raise(self):
+        with self.assertRaises(AdatMetaError):
+            self.partial.align_to(self.other, axis=1, on='SeqId')
+
+    def test_missing_drop(self):
+        adat = self.partial.align_to(self.other, axis=1, on='SeqId', missing='drop')
+        pd.testing.assert_frame_equal(adat, self.other.iloc[:, :-2])
+
+    def test_missing_nan(self):
+        adat = self.partial.align_to(self.other, axis=1, on='SeqId', missing='nan')
+        self.assertTrue(adat.columns.equals(self.other.columns))
+        self.assertTrue(adat.iloc[:, -2:].isna().all().all())
+        pd.testing.assert_frame_equal(adat.iloc[:, :-2], self.other.iloc[:, :-2])
+
+    def test_missing_nan_rows(self):
+        other = self.adat.exclude_meta(axis=0, names=['Barcode'])
+        adat = self.adat.iloc[1:].align_to(
+            other, axis=0, on='PlatePosition', missing='nan'
+        )
+        self.assertEqual(adat.shape, self.adat.shape)
+        self.assertTrue(adat.iloc[0].isna().all())
+        self.assertEqual(list(adat.index.names), list(self.adat.index.names))
+        self.assertEqual(adat.index.get_level_values('Barcode')[0], '')
+        self.assertEqual(
+            adat.index.get_level_values('SampleId')[0],
+            self.adat.index.get_level_values('SampleId')[0],
+        )
+
+    def test_duplicate_keys_raise(self):
+        with self.assertRaises(AdatMetaError):
+            self.adat.align_to(self.adat, axis=0, on='SampleType')
+
+    def test_unknown_missing(self):
+        with self.assertRaises(ValueError):
+            self.adat.align_to(self.other, axis=1, on='SeqId', missing='fill')
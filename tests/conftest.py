@@ -31,3 +31,18 @@ def missing_rfu_adat_path(control_data_path: str, tmp_path_factory) -> str:
         writer = csv.writer(f, delimiter="\t")
         writer.writerows(reader)
     return fn
+
+
+@pytest.fixture(scope="session")
+def ragged_column_metadata_adat_path(control_data_path: str, tmp_path_factory) -> str:
+    fn = str(tmp_path_factory.mktemp("data") / "ragged_column_metadata_test.adat")
+    with open(control_data_path, "r", newline="", encoding="utf-8") as f:
+        reader = [row for row in csv.reader(f, delimiter="\t")]
+    # Drop the last 10 values of the "Target" column metadata row
+    for row in reader:
+        if len(row) > 32 and row[32] == 'Target':
+            del row[-10:]
+    with open(fn, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, delimiter="\t", lineterminator="\r\n")
+        writer.writerows(reader)
+    return fn
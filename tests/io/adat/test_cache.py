@@ -0,0 +1,96 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import somadata
+from somadata.io.adat.cache import AdatCache
+
+
+@pytest.fixture
+def adat_path(control_data_path: str, tmp_path) -> str:
+    path = str(tmp_path / 'control_data.adat')
+    shutil.copy(control_data_path, path)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path) -> AdatCache:
+    return AdatCache(str(tmp_path / 'cache'))
+
+
+def assert_adat_equal(adat, expected):
+    assert adat.index.equals(expected.index)
+    assert adat.columns.equals(expected.columns)
+    assert np.array_equal(adat.values, expected.values)
+    assert adat.header_metadata == expected.header_metadata
+
+
+def test_cache_hit_is_memory_mapped(adat_path: str, cache: AdatCache):
+    expected = somadata.read_adat(adat_path)
+    assert_adat_equal(somadata.read_adat(adat_path, cache=cache), expected)
+    assert len(os.listdir(cache.directory)) == 1
+
+    cached_adat = somadata.read_adat(adat_path, cache=cache)
+    assert_adat_equal(cached_adat, expected)
+    base = cached_adat.values
+    while isinstance(base.base, np.ndarray):
+        base = base.base
+    assert isinstance(base, np.memmap)
+
+
+def test_cache_writes_do_not_reach_the_cache(adat_path: str, cache: AdatCache):
+    somadata.read_adat(adat_path, cache=cache)
+    cached_adat = somadata.read_adat(adat_path, cache=cache.directory)
+    original_value = cached_adat.iloc[0, 0]
+    cached_adat.iloc[0, 0] = -1.0
+    assert somadata.read_adat(adat_path, cache=cache).iloc[0, 0] == original_value
+
+
+def test_cache_key_depends_on_file_and_options(adat_path: str, cache: AdatCache):
+    somadata.read_adat(adat_path, cache=cache)
+    somadata.read_adat(adat_path, cache=cache, dtype='float32')
+    somadata.read_adat(adat_path, cache=cache, seq_ids=['10000-28'])
+    assert len(os.listdir(cache.directory)) == 3
+
+    # Reads with callable filters are not cached
+    somadata.read_adat(adat_path, cache=cache, row_filter=lambda meta: True)
+    assert len(os.listdir(cache.directory)) == 3
+
+    stat = os.stat(adat_path)
+    os.utime(adat_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    somadata.read_adat(adat_path, cache=cache)
+    assert len(os.listdir(cache.directory)) == 4
+
+
+def test_cache_hash_key(adat_path: str, tmp_path):
+    cache = AdatCache(str(tmp_path / 'cache'), key='hash')
+    somadata.read_adat(adat_path, cache=cache)
+    moved_path = str(tmp_path / 'moved.adat')
+    shutil.move(adat_path, moved_path)
+    somadata.read_adat(moved_path, cache=cache)
+    assert len(os.listdir(cache.directory)) == 1
+
+
+def test_cache_lru_eviction(adat_path: str, cache: AdatCache):
+    keys = []
+    for seq_ids in (None, ['10000-28'], ['10001-7']):
+        if len(keys) == 2:
+            cache.max_bytes = cache.size() + 1024
+            # Make the first entry the most recently used
+            os.utime(os.path.join(cache.directory, keys[1], 'metadata.json'), (0, 0))
+        existing_keys = set(os.listdir(cache.directory))
+        somadata.read_adat(adat_path, cache=cache, seq_ids=seq_ids)
+        keys += list(set(os.listdir(cache.directory)) - existing_keys)
+
+    assert cache.size() <= cache.max_bytes
+    assert sorted(os.listdir(cache.directory)) == sorted([keys[0], keys[2]])
+
+    cache.clear()
+    assert os.listdir(cache.directory) == []
+
+
+def test_invalid_cache_key(tmp_path):
+    with pytest.raises(ValueError):
+        AdatCache(str(tmp_path), key='size')
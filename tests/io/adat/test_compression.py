@@ -0,0 +1,76 @@
+import bz2
+import gzip
+import lzma
+import shutil
+
+import numpy as np
+import pytest
+
+import somadata
+from somadata.io.adat.compression import infer_compression, open_text
+
+DECOMPRESSORS = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+
+
+@pytest.fixture
+def adat(control_data_path: str) -> somadata.Adat:
+    return somadata.read_adat(control_data_path)
+
+
+@pytest.fixture
+def plain_bytes(adat: somadata.Adat, tmp_path) -> bytes:
+    path = tmp_path / 'plain.adat'
+    adat.to_adat(str(path))
+    return path.read_bytes()
+
+
+@pytest.mark.parametrize(
+    'extension, compression', [('.gz', 'gzip'), ('.bz2', 'bz2'), ('.xz', 'xz')]
+)
+def test_compressed_round_trip(
+    adat: somadata.Adat, plain_bytes: bytes, tmp_path, extension, compression
+):
+    path = str(tmp_path / f'compressed.adat{extension}')
+    adat.to_adat(path)
+
+    assert infer_compression(path) == compression
+    with DECOMPRESSORS[compression](path, 'rb') as f:
+        assert f.read() == plain_bytes
+
+    read_adat = somadata.read_adat(path)
+    assert read_adat.index.equals(adat.index)
+    assert read_adat.columns.equals(adat.columns)
+    assert np.array_equal(read_adat.values, adat.values)
+
+
+@pytest.mark.parametrize('compression', ['gzip', 'bz2', 'xz'])
+def test_parallel_block_compression(
+    adat: somadata.Adat, plain_bytes: bytes, tmp_path, compression
+):
+    path = str(tmp_path / 'compressed.adat')
+    with open_text(
+        path, 'w', compression, compression_workers=4, block_size=64 * 1024
+    ) as f:
+        somadata.io.adat.file.write_adat(adat, f)
+
+    with DECOMPRESSORS[compression](path, 'rb') as f:
+        assert f.read() == plain_bytes
+
+
+def test_compression_sniffed_without_extension(
+    adat: somadata.Adat, plain_bytes: bytes, tmp_path
+):
+    gz_path = str(tmp_path / 'compressed.adat.gz')
+    adat.to_adat(gz_path, compression_workers=2)
+    path = str(tmp_path / 'compressed.adat')
+    shutil.copy(gz_path, path)
+
+    assert infer_compression(path) is None
+    assert infer_compression(path, sniff=True) == 'gzip'
+    assert somadata.read_adat_header(path) == somadata.read_adat_header(gz_path)
+    assert np.array_equal(somadata.read_adat(path).values, adat.values)
+
+
+def test_unknown_compression(adat: somadata.Adat, tmp_path):
+    with pytest.raises(ValueError):
+        adat.to_adat(str(tmp_path / 'compressed.adat'), compression='zip')
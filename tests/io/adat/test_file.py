@@ -1,15 +1,28 @@
+import csv
 import io
 import logging
 
+import numpy as np
 import pytest
 
-from somadata.io.adat.file import parse_file
+from somadata.io.adat.errors import AdatReadError
+from somadata import Adat
+from somadata.io.adat.file import (
+    parse_file,
+    read_adat_chunks,
+    read_adat_metadata,
+    write_adat,
+)
+from somadata.tools.math import jround
 
 
-def test_parse_file_with_missing_row_metadata(missing_rfu_adat_path: str, caplog):
+@pytest.mark.parametrize('engine', ['fast', 'python'])
+def test_parse_file_with_missing_row_metadata(
+    missing_rfu_adat_path: str, caplog, engine: str
+):
     with caplog.at_level(logging.WARNING):
         rfu_matrix, row_metadata, column_metadata, header_metadata = parse_file(
-            missing_rfu_adat_path
+            missing_rfu_adat_path, engine=engine
         )
 
     # Assert that the warning was logged about missing row metadata
@@ -48,3 +61,292 @@ def test_parse_file_with_missing_row_metadata(missing_rfu_adat_path: str, caplog
         '0.840',
         '',
     ]
+
+
+def test_parse_file_engines_are_identical(control_data_path: str):
+    fast_pieces = parse_file(control_data_path, engine='fast')
+    python_pieces = parse_file(control_data_path, engine='python')
+
+    assert isinstance(fast_pieces[0], np.ndarray)
+    assert fast_pieces[0].dtype == np.float64
+    assert fast_pieces[0].flags['C_CONTIGUOUS']
+    assert np.array_equal(fast_pieces[0], np.array(python_pieces[0]))
+    assert fast_pieces[1:] == python_pieces[1:]
+
+
+def test_parse_file_fast_engine_pads_missing_rfus(missing_rfu_adat_path: str):
+    rfu_matrix, _, column_metadata, _ = parse_file(missing_rfu_adat_path)
+    assert rfu_matrix.shape == (11, len(column_metadata['SeqId']))
+    assert np.isnan(rfu_matrix[-1]).all()
+    assert not np.isnan(rfu_matrix[:-1]).any()
+
+
+def test_parse_file_unknown_engine(control_data_path: str):
+    with pytest.raises(ValueError):
+        parse_file(control_data_path, engine='rust')
+
+
+def test_parse_file_pads_ragged_column_metadata(ragged_column_metadata_adat_path: str):
+    with pytest.warns(UserWarning) as record:
+        _, _, column_metadata, _ = parse_file(ragged_column_metadata_adat_path)
+
+    assert len(record) == 1
+    assert (
+        record[0].message.args[0] == 'Adding empty values to column metadata: "Target"'
+    )
+    assert len(column_metadata['Target']) == len(column_metadata['SeqId'])
+    assert column_metadata['Target'][-10:] == [''] * 10
+
+
+def test_parse_file_strict_raises_on_ragged_column_metadata(
+    ragged_column_metadata_adat_path: str,
+):
+    with pytest.raises(AdatReadError, match='Target'):
+        parse_file(ragged_column_metadata_adat_path, strict=True)
+
+
+@pytest.mark.parametrize('engine', ['fast', 'python'])
+def test_parse_file_seq_id_projection(control_data_path: str, engine: str):
+    full_rfu, _, full_column_metadata, _ = parse_file(control_data_path)
+    seq_ids = ['10000-28', '10001-7', '10008-43']
+    rfu_matrix, _, column_metadata, _ = parse_file(
+        control_data_path, engine=engine, seq_ids=seq_ids
+    )
+
+    positions = [full_column_metadata['SeqId'].index(seq_id) for seq_id in seq_ids]
+    assert column_metadata['SeqId'] == seq_ids
+    assert column_metadata['Target'] == [
+        full_column_metadata['Target'][i] for i in positions
+    ]
+    assert np.array_equal(np.array(rfu_matrix), full_rfu[:, positions])
+
+
+@pytest.mark.parametrize('engine', ['fast', 'python'])
+def test_parse_file_column_filter(control_data_path: str, engine: str):
+    full_rfu, _, full_column_metadata, _ = parse_file(control_data_path)
+    rfu_matrix, _, column_metadata, _ = parse_file(
+        control_data_path,
+        engine=engine,
+        column_filter=lambda meta: meta['Type'] == 'Protein',
+    )
+
+    keep = np.array(full_column_metadata['Type']) == 'Protein'
+    assert set(column_metadata['Type']) == {'Protein'}
+    assert len(column_metadata['SeqId']) == keep.sum()
+    assert np.array_equal(np.array(rfu_matrix), full_rfu[:, keep])
+
+
+def test_parse_file_unknown_seq_ids(control_data_path: str):
+    with pytest.raises(KeyError):
+        parse_file(control_data_path, seq_ids=['10000-28', '99999-99'])
+
+
+@pytest.mark.parametrize('engine', ['fast', 'python'])
+def test_parse_file_row_filter(control_data_path: str, engine: str):
+    full_rfu, full_row_metadata, _, _ = parse_file(control_data_path)
+    rfu_matrix, row_metadata, _, _ = parse_file(
+        control_data_path,
+        engine=engine,
+        row_filter=lambda meta: meta['SampleType'] == 'Calibrator',
+    )
+
+    keep = np.array(full_row_metadata['SampleType']) == 'Calibrator'
+    assert row_metadata['SampleType'] == ['Calibrator'] * keep.sum()
+    assert row_metadata['SampleId'] == list(
+        np.array(full_row_metadata['SampleId'])[keep]
+    )
+    assert np.array_equal(np.array(rfu_matrix), full_rfu[keep])
+
+
+def _is_calibrator(row_metadata):
+    return row_metadata['SampleType'] == 'Calibrator'
+
+
+def test_parse_file_workers(control_data_path: str):
+    serial_pieces = parse_file(control_data_path)
+    parallel_pieces = parse_file(control_data_path, workers=2)
+
+    assert np.array_equal(parallel_pieces[0], serial_pieces[0])
+    assert parallel_pieces[1:] == serial_pieces[1:]
+
+
+def test_parse_file_workers_with_selection(control_data_path: str):
+    kwargs = {
+        'seq_ids': ['10000-28', '10001-7'],
+        'row_filter': _is_calibrator,
+        'dtype': 'float32',
+    }
+    serial_pieces = parse_file(control_data_path, **kwargs)
+    parallel_pieces = parse_file(control_data_path, workers=2, **kwargs)
+
+    assert parallel_pieces[0].dtype == np.float32
+    assert np.array_equal(parallel_pieces[0], serial_pieces[0])
+    assert parallel_pieces[1:] == serial_pieces[1:]
+
+
+def test_parse_file_workers_requires_fast_engine(control_data_path: str):
+    with pytest.raises(ValueError):
+        parse_file(control_data_path, engine='python', workers=2)
+
+
+def _csv_table_rows(adat: Adat, round_rfu: bool) -> str:
+    """The TABLE rows as written by a csv.writer row by row."""
+    f = io.StringIO()
+    writer = csv.writer(f, delimiter='\t', lineterminator='\r\n')
+    for row_metadata, rfu_row in zip(adat.index, adat.values):
+        if round_rfu:
+            rfu_row = [jround(rfu, 1) for rfu in rfu_row]
+        writer.writerow(list(row_metadata) + [None] + list(rfu_row))
+    return f.getvalue()
+
+
+@pytest.mark.parametrize('round_rfu', [True, False])
+@pytest.mark.parametrize('dtype', ['float64', 'float32'])
+def test_write_adat_table_matches_csv_writer(
+    control_data: Adat, round_rfu: bool, dtype: str
+):
+    adat = control_data.astype(dtype)
+    adat.iloc[0, :3] = [np.nan, -0.04, 1e20]
+    adat = adat.insert_meta(axis=0, name='Rank', values=list(range(adat.shape[0])))
+    adat = adat.replace_meta(
+        axis=0,
+        name='SampleNotes',
+        values=['tab\there', 'quote"d', 'line\nbreak'] + [''] * (adat.shape[0] - 3),
+    )
+
+    f = io.StringIO()
+    write_adat(adat, f, round_rfu=round_rfu)
+    table_rows = f.getvalue().split('\t' * (adat.shape[1] + 1) + '\r\n', 1)[1]
+    assert table_rows == _csv_table_rows(adat, round_rfu)
+
+
+@pytest.fixture
+def quoted_notes_adat_path(control_data: Adat, tmp_path) -> str:
+    """An adat written by write_adat with quoted row metadata cells, some spanning several lines."""
+    adat = control_data.replace_meta(
+        axis=0,
+        name='SampleNotes',
+        values=['line\nbreak', 'quote"d\n"lines', 'tab\there', 'two\n\nbreaks']
+        + [''] * (control_data.shape[0] - 4),
+    )
+    path = str(tmp_path / 'quoted_notes.adat')
+    adat.to_adat(path)
+    return path
+
+
+@pytest.mark.parametrize('engine', ['fast', 'python'])
+def test_parse_file_quoted_multiline_cells(
+    quoted_notes_adat_path: str, control_data: Adat, engine: str
+):
+    rfu_matrix, row_metadata, _, _ = parse_file(quoted_notes_adat_path, engine=engine)
+
+    assert len(rfu_matrix) == control_data.shape[0]
+    assert row_metadata['SampleNotes'][:4] == [
+        'line\nbreak',
+        'quote"d\n"lines',
+        'tab\there',
+        'two\n\nbreaks',
+    ]
+    assert row_metadata['SampleId'] == list(
+        control_data.index.get_level_values('SampleId')
+    )
+    assert np.array_equal(
+        np.array(rfu_matrix), parse_file(quoted_notes_adat_path, engine='python')[0]
+    )
+
+
+def test_parse_file_workers_quoted_multiline_cells(
+    control_data: Adat, tmp_path, monkeypatch
+):
+    # Every sample has a long multi-line note, so most byte range cuts fall inside a quoted cell
+    notes = [
+        f'note "{i}"\n' + 'x' * 20000 + '\nend' for i in range(control_data.shape[0])
+    ]
+    adat = control_data.replace_meta(axis=0, name='SampleNotes', values=notes)
+    path = str(tmp_path / 'multiline_notes.adat')
+    adat.to_adat(path)
+    monkeypatch.setattr('somadata.io.adat.file.READ_BLOCK_SIZE', 4096)
+
+    serial_pieces = parse_file(path)
+    parallel_pieces = parse_file(path, workers=8)
+
+    assert serial_pieces[1]['SampleNotes'] == notes
+    assert np.array_equal(parallel_pieces[0], serial_pieces[0])
+    assert parallel_pieces[1:] == serial_pieces[1:]
+
+
+def test_read_adat_metadata_quoted_multiline_cells(quoted_notes_adat_path: str):
+    expected = parse_file(quoted_notes_adat_path, engine='python')[1]
+    row_metadata, _, _ = read_adat_metadata(quoted_notes_adat_path)
+    assert row_metadata == expected
+
+
+def test_read_adat_chunks_quoted_multiline_cells(quoted_notes_adat_path: str):
+    expected = parse_file(quoted_notes_adat_path, engine='python')[1]
+    chunks = list(read_adat_chunks(quoted_notes_adat_path, chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 2]
+    notes = [
+        note for chunk in chunks for note in chunk.index.get_level_values('SampleNotes')
+    ]
+    assert notes == expected['SampleNotes']
+
+
+@pytest.mark.parametrize('executor', ['process', 'thread'])
+def test_write_adat_workers(control_data: Adat, monkeypatch, executor: str):
+    expected = io.StringIO()
+    write_adat(control_data, expected)
+
+    monkeypatch.setattr('somadata.io.adat.file.WRITE_CHUNK_CELLS', 10000)
+    f = io.StringIO()
+    write_adat(control_data, f, workers=2, executor=executor)
+    assert f.getvalue() == expected.getvalue()
+
+
+@pytest.mark.parametrize('workers', [None, 1, 2])
+def test_write_adat_unknown_executor(control_data: Adat, workers):
+    f = io.StringIO()
+    with pytest.raises(ValueError, match='Unknown executor'):
+        write_adat(control_data, f, workers=workers, executor='cluster')
+    assert f.getvalue() == ''
+
+
+@pytest.mark.parametrize('workers', [0, -2])
+def test_write_adat_invalid_workers(control_data: Adat, workers: int):
+    with pytest.raises(ValueError, match='workers'):
+        write_adat(control_data, io.StringIO(), workers=workers)
+
+
+def _write(adat: Adat, **kwargs) -> str:
+    f = io.StringIO()
+    write_adat(adat, f, **kwargs)
+    return f.getvalue()
+
+
+def test_write_adat_selections(control_data: Adat):
+    seq_ids = ['10001-7', '10000-28']
+    expected = control_data.pick_on_meta(axis=1, name='SeqId', values=seq_ids)
+    expected = expected.pick_on_meta(axis=0, name='SampleType', values=['Calibrator'])
+    assert _write(
+        control_data,
+        seq_ids=seq_ids,
+        row_filter=lambda meta: meta['SampleType'] == 'Calibrator',
+    ) == _write(expected)
+
+    column_mask = control_data.columns.get_level_values('SeqId').isin(seq_ids)
+    row_mask = control_data.index.get_level_values('SampleType') == 'Calibrator'
+    assert _write(
+        control_data, column_filter=column_mask, row_filter=row_mask
+    ) == _write(expected)
+
+    assert _write(
+        control_data,
+        column_filter=lambda meta: meta['SeqId'] in seq_ids,
+        row_filter=row_mask,
+    ) == _write(expected)
+
+
+def test_write_adat_selection_errors(control_data: Adat):
+    with pytest.raises(KeyError):
+        _write(control_data, seq_ids=['0000-00'])
+    with pytest.raises(ValueError):
+        _write(control_data, row_filter=[True, False])
@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+import pytest
+
+import somadata
+from somadata import Adat
+from somadata.io.binary.errors import AdatBinaryReadError
+from somadata.io.binary.file import METADATA_FILENAME, RFU_FILENAME
+
+
+def assert_adat_equal(adat, expected):
+    assert adat.index.equals(expected.index)
+    assert adat.columns.equals(expected.columns)
+    assert np.array_equal(adat.values, expected.values, equal_nan=True)
+    assert adat.values.dtype == expected.values.dtype
+    assert adat.header_metadata == expected.header_metadata
+
+
+@pytest.fixture
+def binary_path(control_data: Adat, tmp_path) -> str:
+    path = str(tmp_path / 'control_data.adatb')
+    control_data.to_binary(path)
+    return path
+
+
+def test_round_trip(control_data: Adat, binary_path: str):
+    assert_adat_equal(somadata.read_binary(binary_path), control_data)
+    assert_adat_equal(somadata.read_binary(binary_path, mmap=False), control_data)
+
+
+def test_rfu_file_is_raw_little_endian(control_data: Adat, binary_path: str):
+    rfu_matrix = np.fromfile(os.path.join(binary_path, RFU_FILENAME), dtype='<f8')
+    assert np.array_equal(rfu_matrix, control_data.values.ravel(order='F'))
+
+
+def test_read_is_memory_mapped(control_data: Adat, binary_path: str):
+    adat = somadata.read_binary(binary_path)
+    base = adat.values
+    while isinstance(base.base, np.ndarray):
+        base = base.base
+    assert isinstance(base, np.memmap)
+
+    # Copy-on-write, changes never reach the file
+    adat.iloc[0, 0] = -1.0
+    assert somadata.read_binary(binary_path).iloc[0, 0] == control_data.iloc[0, 0]
+
+
+def test_round_trip_float32_and_non_string_metadata(control_data: Adat, tmp_path):
+    adat = control_data.astype('float32')
+    adat = adat.insert_meta(axis=0, name='Rank', values=list(range(adat.shape[0])))
+    path = str(tmp_path / 'float32.adatb')
+    adat.to_binary(path)
+    assert_adat_equal(somadata.read_binary(path), adat)
+
+
+def test_round_trip_empty_adat(control_data: Adat, tmp_path):
+    adat = control_data.iloc[:0]
+    path = str(tmp_path / 'empty.adatb')
+    adat.to_binary(path)
+    assert_adat_equal(somadata.read_binary(path), adat)
+
+
+def test_truncated_rfu_file_raises(binary_path: str):
+    with open(os.path.join(binary_path, RFU_FILENAME), 'r+b') as f:
+        f.truncate(8)
+    with pytest.raises(AdatBinaryReadError):
+        somadata.read_binary(binary_path)
+
+
+def test_missing_metadata_raises(binary_path: str):
+    os.remove(os.path.join(binary_path, METADATA_FILENAME))
+    with pytest.raises(AdatBinaryReadError):
+        somadata.read_binary(binary_path)
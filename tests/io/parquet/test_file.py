@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+import somadata
+from somadata import Adat
+from somadata.io.parquet.errors import AdatParquetReadError
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+def assert_adat_equal(adat, expected):
+    assert adat.index.equals(expected.index)
+    assert adat.columns.equals(expected.columns)
+    assert np.array_equal(adat.values, expected.values, equal_nan=True)
+    assert adat.values.dtype == expected.values.dtype
+    assert adat.header_metadata == expected.header_metadata
+
+
+@pytest.fixture
+def parquet_path(control_data: Adat, tmp_path) -> str:
+    path = str(tmp_path / 'control_data.parquet')
+    control_data.to_parquet(path, row_group_size=4)
+    return path
+
+
+def test_round_trip(control_data: Adat, parquet_path: str):
+    adat = somadata.read_adat_parquet(parquet_path)
+    assert_adat_equal(adat, control_data)
+    assert isinstance(adat.header_metadata['ReportConfig'], dict)
+
+
+def test_round_trip_float32(control_data: Adat, tmp_path):
+    adat = control_data.astype('float32')
+    path = str(tmp_path / 'float32.parquet')
+    adat.to_parquet(path, compression='zstd')
+    assert_adat_equal(somadata.read_adat_parquet(path), adat)
+
+
+def test_file_layout(control_data: Adat, parquet_path: str):
+    schema = pq.read_schema(parquet_path)
+    n_row_metadata = len(control_data.index.names)
+    assert schema.names[:n_row_metadata] == list(control_data.index.names)
+    assert schema.names[n_row_metadata:] == list(
+        control_data.columns.get_level_values('SeqId')
+    )
+    assert pq.ParquetFile(parquet_path).metadata.num_row_groups == 3
+
+
+def test_column_projection(control_data: Adat, parquet_path: str):
+    seq_ids = ['10001-7', '10000-28']
+    adat = somadata.read_adat_parquet(parquet_path, seq_ids=seq_ids)
+    assert_adat_equal(
+        adat, control_data.pick_on_meta(axis=1, name='SeqId', values=seq_ids)
+    )
+
+    adat = somadata.read_adat_parquet(
+        parquet_path, column_filter=lambda meta: meta['SeqId'] == '10008-43'
+    )
+    assert list(adat.columns.get_level_values('SeqId')) == ['10008-43']
+
+    with pytest.raises(KeyError):
+        somadata.read_adat_parquet(parquet_path, seq_ids=['0000-00'])
+
+
+def test_row_filters(control_data: Adat, parquet_path: str):
+    adat = somadata.read_adat_parquet(
+        parquet_path, filters=[('SampleType', '==', 'Calibrator')]
+    )
+    expected = control_data.pick_on_meta(
+        axis=0, name='SampleType', values=['Calibrator']
+    )
+    assert_adat_equal(adat, expected)
+
+
+def test_non_adat_parquet_raises(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    path = str(tmp_path / 'other.parquet')
+    pq.write_table(pa.table({'a': [1, 2]}), path)
+    with pytest.raises(AdatParquetReadError):
+        somadata.read_adat_parquet(path)
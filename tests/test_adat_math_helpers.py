@@ -2,6 +2,7 @@ import os
 from unittest import TestCase
 
 import pytest
+import numpy as np
 from numpy import isclose
 
 import somadata
@@ -44,3 +45,14 @@ class TestAdatLift(TestCase):
         assert 'Total' in cv_decomp_df.columns
         assert 'Intra' in cv_decomp_df.columns
         assert 'Inter' in cv_decomp_df.columns
+
+
+class TestAdatLiftDtype(TestCase):
+    filename = './tests/data/control_data.adat'
+
+    def test_lift_keeps_float32(self):
+        adat = somadata.read_adat(self.filename, dtype='float32')
+        lift_adat = adat.lift('v5.0')
+        self.assertEqual(set(lift_adat.dtypes), {np.dtype('float32')})
+        expected = somadata.read_adat(self.filename).lift('v5.0')
+        assert all(isclose(lift_adat.values, expected.values, atol=0.1).flatten())
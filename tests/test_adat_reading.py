@@ -1,10 +1,12 @@
 import os
 from unittest import TestCase
 
+import numpy as np
 import pytest
 
 import somadata
 from somadata import Adat
+from somadata.io.adat.errors import AdatReadError
 
 
 class AdatReadingTest(TestCase):
@@ -211,3 +213,174 @@ class ConvertV3SeqIdsReadTestCase(TestCase):
         self.assertEqual(
             ['7', '8', '9'], list(adat.columns.get_level_values('SeqIdVersion'))
         )
+
+
+class ReadAdatChunksTest(TestCase):
+    filename = './tests/data/control_data.adat'
+
+    def setUp(self):
+        self.adat = somadata.read_adat(self.filename)
+        self.chunks = list(somadata.read_adat_chunks(self.filename, chunk_size=4))
+
+    def test_chunk_sizes(self):
+        self.assertEqual(
+            [chunk.shape for chunk in self.chunks], [(4, 5284), (4, 5284), (3, 5284)]
+        )
+        for chunk in self.chunks:
+            self.assertIsInstance(chunk, Adat)
+
+    def test_chunks_share_metadata(self):
+        for chunk in self.chunks[1:]:
+            self.assertIs(chunk.columns, self.chunks[0].columns)
+            self.assertIs(chunk.header_metadata, self.chunks[0].header_metadata)
+        self.assertEqual(self.chunks[0].header_metadata, self.adat.header_metadata)
+
+    def test_chunks_match_full_read(self):
+        for i, chunk in enumerate(self.chunks):
+            expected = self.adat.iloc[i * 4 : (i + 1) * 4]
+            self.assertTrue(chunk.index.equals(expected.index))
+            self.assertTrue(chunk.columns.equals(expected.columns))
+            self.assertTrue((chunk.values == expected.values).all())
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            next(somadata.read_adat_chunks(self.filename, chunk_size=0))
+
+
+class ReadAdatMetadataTest(TestCase):
+    filename = './tests/data/control_data.adat'
+
+    def setUp(self):
+        self.pieces = somadata.parse_file(self.filename)
+
+    def test_read_adat_header(self):
+        header_metadata = somadata.read_adat_header(self.filename)
+        self.assertEqual(header_metadata, self.pieces[3])
+        self.assertIsInstance(header_metadata['ReportConfig'], dict)
+
+    def test_read_adat_header_compatibility_mode(self):
+        header_metadata = somadata.read_adat_header(
+            self.filename, compatibility_mode=True
+        )
+        self.assertIsInstance(header_metadata['ReportConfig'], str)
+
+    def test_read_adat_metadata(self):
+        row_metadata, column_metadata, header_metadata = somadata.read_adat_metadata(
+            self.filename
+        )
+        self.assertEqual(row_metadata, self.pieces[1])
+        self.assertEqual(column_metadata, self.pieces[2])
+        self.assertEqual(header_metadata, self.pieces[3])
+
+    def test_read_adat_metadata_selection(self):
+        options = dict(
+            seq_ids=['10000-28'],
+            row_filter=lambda meta: meta['SampleType'] == 'Calibrator',
+        )
+        pieces = somadata.parse_file(self.filename, **options)
+        row_metadata, column_metadata, _ = somadata.read_adat_metadata(
+            self.filename, **options
+        )
+        self.assertEqual(row_metadata, pieces[1])
+        self.assertEqual(column_metadata, pieces[2])
+
+
+class ReadAdatRowFilterTest(TestCase):
+    filename = './tests/data/control_data.adat'
+
+    def test_read_adat_row_filter_matches_pick_on_meta(self):
+        plate_positions = {'H8', 'E9', 'A6'}
+        adat = somadata.read_adat(
+            self.filename,
+            row_filter=lambda meta: meta['PlatePosition'] in plate_positions,
+        )
+        expected = somadata.read_adat(self.filename).pick_on_meta(
+            axis=0, name='PlatePosition', values=plate_positions
+        )
+        self.assertTrue(adat.index.equals(expected.index))
+        self.assertTrue((adat.values == expected.values).all())
+
+    def test_read_adat_chunks_row_filter(self):
+        chunks = list(
+            somadata.read_adat_chunks(
+                self.filename,
+                chunk_size=4,
+                row_filter=lambda meta: meta['SampleType'] == 'Calibrator',
+            )
+        )
+        sample_types = [
+            sample_type
+            for chunk in chunks
+            for sample_type in chunk.index.get_level_values('SampleType')
+        ]
+        self.assertTrue(all(len(chunk) > 0 for chunk in chunks))
+        self.assertEqual(set(sample_types), {'Calibrator'})
+
+
+class ReadAdatDtypeTest(TestCase):
+    filename = './tests/data/control_data.adat'
+
+    def test_read_adat_float32(self):
+        adat = somadata.read_adat(self.filename, dtype='float32')
+        expected = somadata.read_adat(self.filename)
+        self.assertEqual(set(adat.dtypes), {np.dtype('float32')})
+        self.assertTrue((adat.values == expected.values.astype('float32')).all())
+
+    def test_read_adat_python_engine_float32(self):
+        adat = somadata.read_adat(self.filename, engine='python', dtype='float32')
+        self.assertEqual(set(adat.dtypes), {np.dtype('float32')})
+
+    def test_read_adat_chunks_float32(self):
+        for chunk in somadata.read_adat_chunks(
+            self.filename, chunk_size=5, dtype='float32'
+        ):
+            self.assertEqual(set(chunk.dtypes), {np.dtype('float32')})
+
+    def test_from_features_dtype(self):
+        adat = Adat.from_features(
+            [[1, 2], [3, 4]],
+            {'Barcode': ['A', 'B']},
+            {'SeqId': ['1-1', '2-2']},
+            {},
+            dtype='float32',
+        )
+        self.assertEqual(set(adat.dtypes), {np.dtype('float32')})
+
+
+class ReadAdatsTest(TestCase):
+    filename = './tests/data/control_data.adat'
+
+    def setUp(self):
+        self.adat = somadata.read_adat(self.filename)
+
+    def assert_adat_equal(self, adat):
+        self.assertIsInstance(adat, Adat)
+        self.assertTrue(adat.index.equals(self.adat.index))
+        self.assertTrue(adat.columns.equals(self.adat.columns))
+        self.assertTrue((adat.values == self.adat.values).all())
+        self.assertEqual(adat.header_metadata, self.adat.header_metadata)
+
+    def test_read_adats_process(self):
+        adats = somadata.read_adats([self.filename] * 3, workers=2)
+        self.assertEqual(len(adats), 3)
+        for adat in adats:
+            self.assert_adat_equal(adat)
+
+    def test_read_adats_thread_kwargs(self):
+        adats = somadata.read_adats(
+            [self.filename] * 2, workers=2, executor='thread', dtype='float32'
+        )
+        for adat in adats:
+            self.assertEqual(set(adat.dtypes), {np.dtype('float32')})
+
+    def test_read_adats_raises(self):
+        with self.assertRaises(AdatReadError) as context:
+            somadata.read_adats([self.filename, 'missing.adat'], executor='thread')
+        self.assertIn('missing.adat', str(context.exception))
+
+    def test_read_adats_returns_errors(self):
+        results = somadata.read_adats(
+            ['missing.adat', self.filename], executor='thread', errors='return'
+        )
+        self.assertIsInstance(results[0], FileNotFoundError)
+        self.assert_adat_equal(results[1])
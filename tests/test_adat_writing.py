@@ -1,9 +1,11 @@
 import hashlib
 import os
+import tempfile
 from unittest import TestCase, mock
 
 import somadata
 from somadata import Adat
+from somadata.io.adat.errors import AdatWriteError
 
 
 def require_side_effect(*args, **kwargs):
@@ -118,3 +120,102 @@ class ConvertV3SeqIdsWriteTestCase(TestCase):
         with open(self.filename, 'rb') as f:
             hash_md5.update(f.read())
         self.assertEqual(hash_md5.hexdigest(), '0d94aad767bb4af52a1ea93d41a48d79')
+
+
+class TemporaryDirectoryTestCase(TestCase):
+    source_filename = './tests/data/control_data.adat'
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.adat = somadata.read_adat(self.source_filename)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def read_bytes(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+
+class AdatWriterTest(TemporaryDirectoryTestCase):
+    def test_chunks_match_to_adat(self):
+        self.adat.to_adat(self.path('whole.adat'))
+        with somadata.AdatWriter(self.path('chunked.adat')) as writer:
+            for chunk in somadata.read_adat_chunks(self.source_filename, chunk_size=4):
+                writer.write(chunk)
+        self.assertEqual(writer.n_samples, len(self.adat))
+        self.assertEqual(
+            self.read_bytes(self.path('chunked.adat')),
+            self.read_bytes(self.path('whole.adat')),
+        )
+
+    def test_compressed_chunks(self):
+        with somadata.AdatWriter(self.path('chunked.adat.gz')) as writer:
+            writer.write(self.adat.iloc[:5])
+            writer.write(self.adat.iloc[5:])
+        adat = somadata.read_adat(self.path('chunked.adat.gz'))
+        self.assertTrue(adat.index.equals(self.adat.index))
+        self.assertTrue((adat.values == self.adat.values).all())
+
+    def test_mismatched_chunks_raise(self):
+        with somadata.AdatWriter(self.path('chunked.adat')) as writer:
+            writer.write(self.adat.iloc[:5])
+            with self.assertRaises(AdatWriteError):
+                writer.write(self.adat.iloc[5:, 1:])
+            with self.assertRaises(AdatWriteError):
+                writer.write(self.adat.iloc[5:].exclude_meta(axis=0, names=['PlateId']))
+
+    def test_no_chunks_raises(self):
+        with self.assertRaises(AdatWriteError):
+            with somadata.AdatWriter(self.path('empty.adat')):
+                pass
+        self.assertFalse(os.path.exists(self.path('empty.adat')))
+
+    def test_empty_chunk_writes_empty_table(self):
+        with somadata.AdatWriter(self.path('empty.adat')) as writer:
+            writer.write(self.adat.iloc[:0])
+        adat = somadata.read_adat(self.path('empty.adat'))
+        self.assertEqual(adat.shape, (0, self.adat.shape[1]))
+        self.assertTrue(adat.columns.equals(self.adat.columns))
+
+
+class AppendToAdatTest(TemporaryDirectoryTestCase):
+    def test_append_matches_to_adat(self):
+        self.adat.to_adat(self.path('whole.adat'))
+        self.adat.iloc[:5].to_adat(self.path('appended.adat'))
+        somadata.append_to_adat(self.path('appended.adat'), self.adat.iloc[5:8])
+        somadata.append_to_adat(self.path('appended.adat'), self.adat.iloc[8:])
+        self.assertEqual(
+            self.read_bytes(self.path('appended.adat')),
+            self.read_bytes(self.path('whole.adat')),
+        )
+
+    def test_append_compressed(self):
+        self.adat.iloc[:5].to_adat(self.path('appended.adat.xz'))
+        somadata.append_to_adat(self.path('appended.adat.xz'), self.adat.iloc[5:])
+        adat = somadata.read_adat(self.path('appended.adat.xz'))
+        self.assertTrue(adat.index.equals(self.adat.index))
+        self.assertTrue((adat.values == self.adat.values).all())
+
+    def test_append_completes_last_line(self):
+        self.adat.iloc[:5].to_adat(self.path('appended.adat'))
+        with open(self.path('appended.adat'), 'r+b') as f:
+            f.truncate(os.path.getsize(self.path('appended.adat')) - 2)
+        somadata.append_to_adat(self.path('appended.adat'), self.adat.iloc[5:])
+        adat = somadata.read_adat(self.path('appended.adat'))
+        self.assertTrue((adat.values == self.adat.values).all())
+
+    def test_append_mismatch_raises(self):
+        self.adat.iloc[:5].to_adat(self.path('appended.adat'))
+        original = self.read_bytes(self.path('appended.adat'))
+        with self.assertRaises(AdatWriteError):
+            somadata.append_to_adat(self.path('appended.adat'), self.adat.iloc[5:, 1:])
+        with self.assertRaises(AdatWriteError):
+            somadata.append_to_adat(
+                self.path('appended.adat'),
+                self.adat.iloc[5:].exclude_meta(axis=0, names=['PlateId']),
+            )
+        self.assertEqual(self.read_bytes(self.path('appended.adat')), original)
@@ -5,6 +5,7 @@ import pandas as pd
 
 from somadata import Adat, Annotations
 from somadata.errors import AnnotationsLiftingError
+from somadata.tools.math import jround
 
 # Test data constants
 ANNOTATION_CSV_DATA = 'SeqId,SomaId,Plasma Scalar v4.0 5K to v4.1 7K\n54321-21,SL054321,0.8\n12345-12,SL012345,1.1\n'
@@ -111,6 +112,19 @@ class AdatLiftingTestCase(TestCase):
             )
         )
 
+    def test_lifting_rounds_like_adat_lift(self):
+        # 3.0625 * 0.8 is 2.45, which DataFrame.round rounds down
+        adat = Adat.from_features(
+            [[1, 3.0625], [4, 5]],
+            {'PlateId': ['A12', 'A12'], 'Barcode': ['SL1234', 'SL1235']},
+            {'SeqId': ['12345-12', '54321-21']},
+            self.adat.header_metadata,
+        )
+        lifted_adat = self.an.lift_adat(adat)
+        self.assertIsInstance(lifted_adat, Adat)
+        self.assertEqual(lifted_adat.values[0, 1], 2.5)
+        self.assertEqual(lifted_adat.values[0, 1], jround(3.0625 * 0.8, 1))
+
     def test_orig_adat_unmodified(self):
         self.an.lift_adat(self.adat)
 
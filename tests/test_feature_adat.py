@@ -0,0 +1,178 @@
+import io
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+import somadata
+from somadata import Adat, FeatureAdat
+from somadata.errors import AdatKeyError, AdatMetaError
+from somadata.tools.pandas import get_pd_axis
+
+
+class FeatureAdatTest(TestCase):
+    filename = './tests/data/control_data.adat'
+
+    def setUp(self):
+        self.adat = somadata.read_adat(self.filename)
+        self.feature_adat = somadata.read_adat(self.filename, feature_table=True)
+
+    def assertMatchesAdat(self, feature_adat, adat):
+        self.assertIsInstance(feature_adat, FeatureAdat)
+        self.assertTrue(np.array_equal(feature_adat.values, adat.values))
+        self.assertTrue(feature_adat.index.equals(adat.index))
+        self.assertTrue(feature_adat.column_multiindex.equals(adat.columns))
+        self.assertEqual(
+            list(feature_adat.column_multiindex.names), list(adat.columns.names)
+        )
+
+    def test_read(self):
+        self.assertMatchesAdat(self.feature_adat, self.adat)
+        self.assertEqual(
+            list(self.feature_adat.columns),
+            list(self.adat.columns.get_level_values('SeqId')),
+        )
+        self.assertEqual(
+            self.feature_adat.feature_table.loc['10000-28', 'Target'],
+            self.adat.columns.get_level_values('Target')[0],
+        )
+
+    def test_from_adat_round_trip(self):
+        feature_adat = FeatureAdat.from_adat(self.adat)
+        self.assertMatchesAdat(feature_adat, self.adat)
+        adat = feature_adat.to_multiindex_adat()
+        self.assertIsInstance(adat, Adat)
+        self.assertNotIsInstance(adat, FeatureAdat)
+        self.assertTrue(adat.equals(self.adat))
+
+    def test_filter_on_meta(self):
+        seq_ids = ['10000-28', '10001-7']
+        self.assertMatchesAdat(
+            self.feature_adat.pick_on_meta(axis=1, name='SeqId', values=seq_ids),
+            self.adat.pick_on_meta(axis=1, name='SeqId', values=seq_ids),
+        )
+        self.assertMatchesAdat(
+            self.feature_adat.exclude_on_meta(axis=1, name='SeqId', values=seq_ids),
+            self.adat.exclude_on_meta(axis=1, name='SeqId', values=seq_ids),
+        )
+        self.assertMatchesAdat(
+            self.feature_adat.pick_on_meta(
+                axis=0, name='SampleType', values=['Calibrator']
+            ),
+            self.adat.pick_on_meta(axis=0, name='SampleType', values=['Calibrator']),
+        )
+        with self.assertRaises(KeyError):
+            self.feature_adat.pick_on_meta(axis=1, name='SeqId', values=['0-0'])
+
+    def test_insert_and_replace_meta(self):
+        values = [str(i) for i in range(self.adat.shape[1])]
+        self.assertMatchesAdat(
+            self.feature_adat.insert_meta(axis=1, name='Rank', values=values),
+            self.adat.insert_meta(axis=1, name='Rank', values=values),
+        )
+        self.assertMatchesAdat(
+            self.feature_adat.replace_meta(axis=1, name='Target', values=values),
+            self.adat.replace_meta(axis=1, name='Target', values=values),
+        )
+        with self.assertRaises(AdatKeyError):
+            self.feature_adat.insert_meta(axis=1, name='Target', values=values)
+        with self.assertRaises(AdatKeyError):
+            self.feature_adat.replace_meta(axis=1, name='Rank', values=values)
+
+    def test_replace_seq_ids(self):
+        seq_ids = [f'{seq_id}x' for seq_id in self.feature_adat.columns]
+        feature_adat = self.feature_adat.replace_meta(
+            axis=1, name='SeqId', values=seq_ids
+        )
+        self.assertEqual(list(feature_adat.columns), seq_ids)
+        self.assertEqual(list(feature_adat.feature_table.index), seq_ids)
+        with self.assertRaises(AdatMetaError):
+            self.feature_adat.replace_meta(
+                axis=1, name='SeqId', values=['1-1'] * len(seq_ids)
+            )
+
+    def test_pick_and_exclude_meta(self):
+        self.assertMatchesAdat(
+            self.feature_adat.pick_meta(axis=1, names=['SeqId', 'Target']),
+            self.adat.pick_meta(axis=1, names=['SeqId', 'Target']),
+        )
+        self.assertMatchesAdat(
+            self.feature_adat.exclude_meta(axis=1, names=['Target']),
+            self.adat.exclude_meta(axis=1, names=['Target']),
+        )
+        with self.assertRaises(AdatMetaError):
+            self.feature_adat.exclude_meta(axis=1, names=['SeqId'])
+
+    def test_edit_meta(self):
+        values = [str(i) for i in range(self.adat.shape[1])]
+        with self.feature_adat.edit_meta(axis=1) as edit:
+            edit.replace('Target', values).insert('Rank', values).drop(['Dilution'])
+        expected = (
+            self.adat.edit_meta(axis=1)
+            .replace('Target', values)
+            .insert('Rank', values)
+            .drop(['Dilution'])
+            .apply()
+        )
+        self.assertMatchesAdat(edit.adat, expected)
+        with self.assertRaises(AdatMetaError):
+            self.feature_adat.edit_meta(axis=1).drop(['SeqId']).apply()
+
+    def test_align_to(self):
+        other = self.adat.iloc[:, ::-1]
+        self.assertMatchesAdat(
+            self.feature_adat.iloc[:, 2:].align_to(
+                other, axis=1, on='SeqId', missing='drop'
+            ),
+            self.adat.iloc[:, 2:].align_to(other, axis=1, on='SeqId', missing='drop'),
+        )
+        aligned = self.feature_adat.iloc[:, 2:].align_to(
+            other, axis=1, on='SeqId', missing='nan'
+        )
+        self.assertTrue(aligned.column_multiindex.equals(other.columns))
+        self.assertTrue(np.isnan(aligned.values[:, -2:]).all())
+
+    def test_operations_keep_feature_table(self):
+        self.assertMatchesAdat(self.feature_adat * 2, self.adat * 2)
+        self.assertMatchesAdat(self.feature_adat.iloc[:, 3:7], self.adat.iloc[:, 3:7])
+
+    def test_duplicate_seq_ids(self):
+        column_metadata = {'SeqId': ['1-1', '1-1'], 'Target': ['A', 'B']}
+        with self.assertRaises(AdatMetaError):
+            FeatureAdat.from_features(
+                [[1.0, 2.0]], {'SampleId': ['1']}, column_metadata, {}
+            )
+
+    def test_to_adat(self):
+        expected = io.StringIO()
+        actual = io.StringIO()
+        somadata.io.adat.file.write_adat(self.adat, expected)
+        somadata.io.adat.file.write_adat(self.feature_adat, actual)
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def assertWritesSameAdat(self, feature_adat, adat):
+        expected = io.StringIO()
+        actual = io.StringIO()
+        somadata.io.adat.file.write_adat(adat, expected)
+        somadata.io.adat.file.write_adat(feature_adat, actual)
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+    def test_lift_to_adat(self):
+        lifted = self.feature_adat.lift('v5.0')
+        self.assertMatchesAdat(lifted, self.adat.lift('v5.0'))
+        self.assertWritesSameAdat(lifted, self.adat.lift('v5.0'))
+
+    def test_arithmetic_to_adat(self):
+        self.assertWritesSameAdat(self.feature_adat * 2 + 1, self.adat * 2 + 1)
+
+    def test_missing_feature_table_raises(self):
+        combined = pd.concat([self.feature_adat, self.feature_adat])
+        self.assertIsNone(combined.feature_table)
+        with self.assertRaises(AdatMetaError):
+            combined.to_adat(io.StringIO())
+        with self.assertRaises(AdatMetaError):
+            get_pd_axis(combined, 1)
+
+    def test_lazy_feature_table(self):
+        with self.assertRaises(ValueError):
+            somadata.read_adat(self.filename, lazy=True, feature_table=True)
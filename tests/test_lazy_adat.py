@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+import numpy as np
+
+import somadata
+from somadata import Adat, LazyAdat
+from somadata.tools.pandas import get_pd_axis
+
+
+class LazyAdatTest(TestCase):
+    filename = './tests/data/control_data.adat'
+
+    def setUp(self):
+        self.adat = somadata.read_adat(self.filename)
+        self.lazy_adat = somadata.read_adat(self.filename, lazy=True)
+
+    def test_metadata_does_not_load(self):
+        self.assertIsInstance(self.lazy_adat, LazyAdat)
+        self.assertTrue(self.lazy_adat.index.equals(self.adat.index))
+        self.assertTrue(self.lazy_adat.columns.equals(self.adat.columns))
+        self.assertEqual(self.lazy_adat.header_metadata, self.adat.header_metadata)
+        self.assertEqual(self.lazy_adat.shape, self.adat.shape)
+        self.assertEqual(len(self.lazy_adat), len(self.adat))
+        self.assertIn('not loaded', repr(self.lazy_adat))
+        self.assertFalse(self.lazy_adat.is_loaded)
+
+    def test_get_pd_axis_does_not_load(self):
+        self.assertTrue(get_pd_axis(self.lazy_adat, 1).equals(self.adat.columns))
+        self.assertTrue(get_pd_axis(self.lazy_adat, 0).equals(self.adat.index))
+        self.assertFalse(self.lazy_adat.is_loaded)
+
+    def test_value_access_loads(self):
+        self.assertTrue(np.array_equal(self.lazy_adat.values, self.adat.values))
+        self.assertTrue(self.lazy_adat.is_loaded)
+        self.assertIs(self.lazy_adat.load(), self.lazy_adat.load())
+        self.assertIsInstance(self.lazy_adat.load(), Adat)
+
+    def test_behaves_like_adat(self):
+        seq_ids = ['10000-28', '10001-7']
+        picked = self.lazy_adat.pick_on_meta(axis=1, name='SeqId', values=seq_ids)
+        self.assertIsInstance(picked, Adat)
+        self.assertTrue(
+            picked.equals(self.adat.pick_on_meta(axis=1, name='SeqId', values=seq_ids))
+        )
+        self.assertTrue((self.lazy_adat * 2).equals(self.adat * 2))
+        self.assertTrue(np.array_equal(np.asarray(self.lazy_adat), self.adat.values))
+        self.assertEqual(
+            self.lazy_adat.iloc[0, 0], self.lazy_adat[self.adat.columns[0]].iloc[0]
+        )
+
+    def test_selection_applies_to_metadata_and_values(self):
+        seq_ids = ['10000-28', '10001-7']
+        row_filter = lambda meta: meta['SampleType'] == 'Calibrator'
+        lazy_adat = somadata.read_adat(
+            self.filename,
+            lazy=True,
+            seq_ids=seq_ids,
+            row_filter=row_filter,
+            dtype='float32',
+        )
+        expected = somadata.read_adat(
+            self.filename, seq_ids=seq_ids, row_filter=row_filter, dtype='float32'
+        )
+        self.assertTrue(lazy_adat.columns.equals(expected.columns))
+        self.assertTrue(lazy_adat.index.equals(expected.index))
+        self.assertFalse(lazy_adat.is_loaded)
+        self.assertTrue(lazy_adat.load().equals(expected))
+
+    def test_header_metadata_changes_survive_loading(self):
+        self.lazy_adat.header_metadata['!Title'] = 'Lazy'
+        self.assertEqual(self.lazy_adat.load().header_metadata['!Title'], 'Lazy')
+
+    def test_lazy_requires_path(self):
+        with open(self.filename) as f:
+            with self.assertRaises(ValueError):
+                somadata.read_adat(f, lazy=True)
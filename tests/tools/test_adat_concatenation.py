@@ -1,8 +1,12 @@
+import os
+import tempfile
 from unittest import TestCase
 
+import numpy as np
 import pytest
 
-from somadata import Adat
+import somadata
+from somadata import Adat, FeatureAdat
 from somadata.tools.adat_concatenation import concatenate_adats, smart_adat_concatenation
 from somadata.tools.errors import AdatConcatError
 
@@ -331,3 +335,54 @@ class SmartConcatTestCase(TestCase):
         self.assertEqual(
             list(concat_adat.columns.get_level_values('SeqIdVersion')), ['2', '3', '4']
         )
+
+
+class ConcatDtypeTest(TestCase):
+    def setUp(self):
+        col_metadata = {'SeqId': ['A', 'B', 'C']}
+        self.adats = [
+            Adat.from_features(
+                [[1.5, 2.5, 3.5]], {'Barcode': [barcode]}, col_metadata, {}, dtype=dtype
+            )
+            for barcode, dtype in [('SL1', 'float32'), ('SL2', 'float32')]
+        ]
+
+    def test_concat_keeps_dtype(self):
+        concat_adat = concatenate_adats(self.adats)
+        self.assertEqual(set(concat_adat.dtypes), {np.dtype('float32')})
+        self.assertEqual(concat_adat.shape, (2, 3))
+
+    def test_concat_requested_dtype(self):
+        concat_adat = concatenate_adats(self.adats, dtype='float64')
+        self.assertEqual(set(concat_adat.dtypes), {np.dtype('float64')})
+
+
+class ConcatFeatureAdatTest(TestCase):
+    filename = './tests/data/control_data.adat'
+
+    def setUp(self):
+        self.adat = somadata.read_adat(self.filename)
+        self.feature_adat = somadata.read_adat(self.filename, feature_table=True)
+
+    def assertMatchesAdat(self, feature_adat, adat):
+        self.assertIsInstance(feature_adat, FeatureAdat)
+        self.assertTrue(feature_adat.column_multiindex.equals(adat.columns))
+        self.assertTrue(feature_adat.index.equals(adat.index))
+        self.assertTrue((feature_adat.values == adat.values).all())
+
+    def test_concat_keeps_column_metadata(self):
+        concat_adat = concatenate_adats([self.feature_adat, self.feature_adat])
+        expected = concatenate_adats([self.adat, self.adat])
+        self.assertMatchesAdat(concat_adat, expected)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'concat.adat')
+            concat_adat.to_adat(path)
+            self.assertTrue(somadata.read_adat(path).equals(expected))
+
+    def test_smart_concat_keeps_column_metadata(self):
+        concat_adat = smart_adat_concatenation(
+            [self.feature_adat, self.feature_adat], self.feature_adat
+        )
+        expected = smart_adat_concatenation([self.adat, self.adat], self.adat)
+        self.assertMatchesAdat(concat_adat, expected)
@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+import numpy as np
+
+from somadata.tools.math import jround, jround_array
+
+
+class JroundArrayTest(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.values = np.concatenate(
+            [
+                rng.normal(0, 1, 1000),
+                rng.lognormal(7, 2, 1000),
+                -rng.lognormal(7, 2, 1000),
+                np.arange(-1000, 1000) / 20,
+                [0.0, -0.0, -0.01, 0.05, -0.05, 0.25, 2.5, -2.5, 12345.65],
+                [np.nan, np.inf, -np.inf],
+            ]
+        )
+
+    def assert_bit_identical(self, values, n_digits):
+        expected = np.array([jround(x, n_digits) for x in values])
+        rounded = jround_array(values, n_digits)
+        self.assertEqual(rounded.dtype, np.float64)
+        self.assertEqual(rounded.tobytes(), expected.tobytes())
+
+    def test_matches_jround(self):
+        for n_digits in (-2, -1, 0, 1, 2, 3):
+            with self.subTest(n_digits=n_digits):
+                self.assert_bit_identical(self.values, n_digits)
+
+    def test_matches_jround_float32(self):
+        self.assert_bit_identical(self.values.astype(np.float32), 1)
+
+    def test_shapes(self):
+        matrix = self.values[:1000].reshape(100, 10)
+        self.assertEqual(jround_array(matrix).shape, (100, 10))
+        self.assertEqual(jround_array(-0.05), jround(-0.05))
+        self.assertEqual(jround_array([1.25, 2.35]).tolist(), [1.2, 2.4])